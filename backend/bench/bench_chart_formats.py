@@ -0,0 +1,84 @@
+"""
+차트 응답 형식별 인코딩 시간 / 크기 비교
+
+    python -m backend.bench.bench_chart_formats [--repeat 5] [--indicators sma20,rsi]
+
+- rows    : 기존 형식 (봉 단위 dict 생성 → FastAPI jsonable_encoder → JSON)
+- columns : 컬럼 단위 JSON
+- msgpack : 컬럼별 배열 바이트 MessagePack
+"""
+
+import argparse
+import gzip
+import json
+import time
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+
+from ..services.chart_service import format_bars
+from ..services.chart_format import encode_columns, encode_msgpack
+from ..services.indicators import IndicatorSet, parse_indicators
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def synthetic_bars(n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    close = np.abs(np.cumsum(rng.normal(0, 100, n))) + 10_000
+    spread = np.abs(rng.normal(0, 50, n))
+    return {
+        "time": (np.datetime64("1990-01-01") + np.arange(n)).astype("datetime64[D]"),
+        "open": close + rng.normal(0, 30, n),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 10_000_000, n).astype(np.int64),
+    }
+
+
+def encode_rows(bars: dict, extra: dict) -> bytes:
+    # JSONResponse 와 같은 경로: jsonable_encoder → json.dumps
+    content = jsonable_encoder(format_bars(bars, extra))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+ENCODERS = {"rows": encode_rows, "columns": encode_columns, "msgpack": encode_msgpack}
+
+
+def best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--indicators", default="", help="함께 인코딩할 지표 (ex. sma20,rsi)")
+    args = parser.parse_args()
+
+    names = parse_indicators(args.indicators)
+    print(f"{'bars':>8} {'format':>8} {'encode ms':>10} {'bytes':>12} {'gzip bytes':>12} {'vs rows':>8}")
+    for n in SIZES:
+        bars = synthetic_bars(n)
+        extra = {}
+        if names:
+            columns = IndicatorSet(names).compute(bars["close"])
+            extra = {k: [None if np.isnan(v) else v for v in values.tolist()] for k, values in columns.items()}
+
+        baseline = None
+        for fmt, encode in ENCODERS.items():
+            body = encode(bars, extra)
+            seconds = best_time(lambda: encode(bars, extra), args.repeat)
+            baseline = baseline or seconds
+            print(
+                f"{n:>8} {fmt:>8} {seconds * 1000:>10.2f} {len(body):>12,} "
+                f"{len(gzip.compress(body)):>12,} {baseline / seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
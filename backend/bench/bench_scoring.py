@@ -0,0 +1,67 @@
+"""
+리스크 점수 일괄 계산 처리량 비교
+
+    python -m backend.bench.bench_scoring [--repeat 3]
+
+- per-symbol : 종목마다 model.score(dict) (기존 API 경로)
+- records    : KIS 원본 dict 목록 → 파싱 + 일괄 계산 (score_records)
+- columns    : 파싱된 지표 컬럼 배열 일괄 계산 (score_columns)
+"""
+
+import argparse
+import time
+import numpy as np
+
+from ..services.scoring import FINANCIAL_STABILITY, PROFITABILITY, VOLATILITY, SUPPLY_DEMAND
+
+MODELS = {
+    "financial": FINANCIAL_STABILITY,
+    "profitability": PROFITABILITY,
+    "volatility": VOLATILITY,
+    "supply": SUPPLY_DEMAND,
+}
+SIZES = (1_000, 10_000, 100_000)
+
+
+def synthetic_records(model, n: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for metric in model.metrics:
+        edges = metric.buckets.edges
+        spread = max(abs(edges[0]), abs(edges[-1])) * 1.5
+        values = rng.uniform(-spread if edges[0] < 0 or metric.transform else 0, spread, n)
+        columns[metric.field] = [str(round(v, 2)) for v in values.tolist()]
+    return [{field: values[i] for field, values in columns.items()} for i in range(n)]
+
+
+def best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'model':>14} {'symbols':>8} {'path':>11} {'ms':>10} {'symbols/s':>14}")
+    for name, model in MODELS.items():
+        for n in SIZES:
+            records = synthetic_records(model, n)
+            columns = model.parse_records(records)
+            paths = {
+                "per-symbol": lambda: [model.score(record) for record in records],
+                "records": lambda: model.score_records(records),
+                "columns": lambda: model.score_columns(columns),
+            }
+            for path, fn in paths.items():
+                seconds = best_time(fn, args.repeat)
+                print(f"{name:>14} {n:>8} {path:>11} {seconds * 1000:>10.2f} {n / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+API 라우트 부하 테스트 (처리량 / p50 · p95 · p99 응답 시간)
+
+    # 이미 실행 중인 서버 대상
+    python -m backend.bench.load_test --base-url http://127.0.0.1:8000 --concurrency 32 --duration 10
+
+    # 로컬 KIS 대역 서버 + 백엔드를 임시로 띄워서 실행 (실제 KIS 호출 없음)
+    python -m backend.bench.load_test --spawn --latency 0.05 --rate-limit 20
+
+    # 이전 결과와 비교
+    python -m backend.bench.load_test --spawn --compare backend/bench/results/load-20261018-120000.json
+
+- 라우트(시나리오)마다 --concurrency 개의 작업자가 --duration 초 동안 (또는 --requests 건) 요청을 반복
+- 종목은 종목 리스트 앞쪽 --symbols 개를 돌아가며 사용 (캐시 히트 비율은 이 값으로 조절)
+- 결과는 JSON (설정 + 라우트별 처리량 / 지연 분포 / 상태 코드) 으로 저장해서 실행 간 비교
+- 웹소켓 (/ws/quotes) 과 상태를 바꾸는 POST / 관리자 라우트는 제외
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import itertools
+import subprocess
+import tempfile
+from datetime import datetime
+
+import httpx
+import numpy as np
+
+from ..utils.symbol_table import current_table
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# 시나리오 이름 → 요청 경로 ({q}: 종목코드, {qs}: 쉼표로 이은 종목코드 10개)
+SCENARIOS = {
+    "stocks": "/stocks?limit=100",
+    "stocks_search": "/stocks/search?q={q}",
+    "summary": "/stock/summary?query={q}",
+    "financial": "/stock/financial?query={q}",
+    "profitability": "/stock/profitability?query={q}",
+    "volatility": "/stock/volatility?query={q}",
+    "supply_risk": "/stock/supply-risk?query={q}",
+    "ratios_history": "/stock/ratios/history?query={q}",
+    "dashboard": "/stock/dashboard?query={q}",
+    "chart_daily": "/chart/daily?query={q}",
+    "chart_weekly": "/chart/weekly?query={q}",
+    "chart_monthly": "/chart/monthly?query={q}",
+    "chart_indicators": "/chart/daily?query={q}&indicators=sma20,rsi,macd,bb",
+    "chart_columns": "/chart/daily?query={q}&format=columns",
+    "chart_msgpack": "/chart/daily?query={q}&format=msgpack",
+    "chart_minute": "/chart/minute?query={q}",
+    "summary_batch": "/stock/summary/batch?query={qs}",
+    "chart_batch": "/chart/batch?query={qs}",
+    "screener": "/screener?limit=50",
+    "screener_status": "/screener/status",
+    "cache_stats": "/cache/stats",
+    "scheduler_stats": "/scheduler/stats",
+    "prefetch_status": "/prefetch/status",
+    "quote_ws_stats": "/ws/quotes/stats",
+    "metrics": "/metrics",
+}
+
+
+def _summarize(latencies: list, statuses: dict, elapsed: float) -> dict:
+    values = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    ok = sum(count for status, count in statuses.items() if 200 <= int(status) < 400)
+    total = sum(statuses.values())
+    return {
+        "requests": total,
+        "errors": total - ok,
+        "rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(float(values.mean()), 2),
+        "p50_ms": round(float(np.percentile(values, 50)), 2),
+        "p95_ms": round(float(np.percentile(values, 95)), 2),
+        "p99_ms": round(float(np.percentile(values, 99)), 2),
+        "max_ms": round(float(values.max()), 2),
+        "status": statuses,
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, path: str, symbols: list, concurrency: int, duration: float, max_requests: int | None
+) -> dict:
+    codes = itertools.cycle(symbols)
+    groups = itertools.cycle([",".join(symbols[i : i + 10]) for i in range(0, len(symbols), 10)])
+    latencies: list = []
+    statuses: dict[str, int] = {}
+    issued = itertools.count()
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            if max_requests is not None and next(issued) >= max_requests:
+                return
+            url = path.format(q=next(codes), qs=next(groups))
+            started = time.perf_counter()
+            try:
+                response = await client.get(url)
+                await response.aread()
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return _summarize(latencies, statuses, time.perf_counter() - started)
+
+
+async def run_all(args, names: list) -> dict:
+    table = current_table()
+    symbols = [table.code(idx) for idx in range(min(args.symbols, len(table)))]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        results = {}
+        for name in names:
+            path = SCENARIOS[name]
+            if args.warmup:
+                await run_scenario(client, path, symbols, args.concurrency, args.warmup, None)
+            results[name] = await run_scenario(
+                client, path, symbols, args.concurrency, args.duration, args.requests
+            )
+            r = results[name]
+            print(
+                f"{name:>18} {r['requests']:>8} {r['errors']:>7} {r['rps']:>10.1f}"
+                f" {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f}"
+            )
+        return results
+
+
+# ✅ --spawn: 로컬 KIS 대역 서버 + 백엔드 실행
+def _wait_ready(url: str, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"서버가 응답하지 않습니다: {url}")
+
+
+def spawn_servers(args, workdir: str) -> list:
+    mock_url = f"http://127.0.0.1:{args.mock_port}"
+    mock = subprocess.Popen(
+        [
+            sys.executable, "-m", "backend.mock_kis.server",
+            "--port", str(args.mock_port),
+            "--latency", str(args.latency),
+            "--jitter", str(args.jitter),
+            "--error-rate", str(args.error_rate),
+            "--rate-limit", str(args.rate_limit),
+        ]
+    )
+    env = {
+        **os.environ,
+        "BASE_URL": mock_url,
+        "APP_KEY": "mock",
+        "APP_SECRET": "mock",
+        "KIS_TOKEN_CACHE_FILE": os.path.join(workdir, "token_cache.json"),
+        "MARKET_DB_PATH": os.path.join(workdir, "market.sqlite3"),
+        "SHARED_STORE_PATH": os.path.join(workdir, "shared.sqlite3"),
+        # 대역 서버의 초당 제한에 맞춰 스케줄러 속도 설정 (제한 없음이면 충분히 크게)
+        "KIS_RATE_LIMIT": str(args.rate_limit or 100000),
+        "QUOTE_FEED": "simulated",
+        "SCREENER_AUTOSTART": "0",
+        "PREFETCH_AUTOSTART": "0",
+        "LOG_LEVEL": "WARNING",
+    }
+    backend = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.main:app",
+            "--port", str(args.backend_port), "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+    )
+    processes = [mock, backend]
+    try:
+        _wait_ready(f"{mock_url}/mock/stats")
+        _wait_ready(f"http://127.0.0.1:{args.backend_port}/cache/stats")
+    except Exception:
+        stop_servers(processes)
+        raise
+    args.base_url = f"http://127.0.0.1:{args.backend_port}"
+    return processes
+
+
+def stop_servers(processes: list):
+    # 백엔드를 먼저 종료 (대역 서버가 먼저 내려가면 진행 중인 backfill 이 연결 오류를 남김)
+    for process in reversed(processes):
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(baseline_path: str, results: dict):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["routes"]
+    print(f"\n비교: {baseline_path}")
+    print(f"{'route':>18} {'rps':>10} {'Δrps':>8} {'p95 ms':>9} {'Δp95':>8} {'p99 ms':>9} {'Δp99':>8}")
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+
+        def delta(new, old):
+            return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+        print(
+            f"{name:>18} {r['rps']:>10.1f} {delta(r['rps'], base['rps']):>8}"
+            f" {r['p95_ms']:>9.2f} {delta(r['p95_ms'], base['p95_ms']):>8}"
+            f" {r['p99_ms']:>9.2f} {delta(r['p99_ms'], base['p99_ms']):>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--routes", default=",".join(SCENARIOS), help="실행할 시나리오 (쉼표 구분)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--requests", type=int, default=None, help="시나리오별 최대 요청 수")
+    parser.add_argument("--warmup", type=float, default=1.0, help="시나리오별 예열 시간 (초, 결과 제외)")
+    parser.add_argument("--symbols", type=int, default=50, help="돌아가며 조회할 종목 수")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본 backend/bench/results/load-<시각>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    spawn = parser.add_argument_group("--spawn (로컬 KIS 대역 서버 + 백엔드 실행)")
+    spawn.add_argument("--spawn", action="store_true")
+    spawn.add_argument("--mock-port", type=int, default=8100)
+    spawn.add_argument("--backend-port", type=int, default=8001)
+    spawn.add_argument("--latency", type=float, default=0.05)
+    spawn.add_argument("--jitter", type=float, default=0.02)
+    spawn.add_argument("--error-rate", type=float, default=0.0)
+    spawn.add_argument("--rate-limit", type=float, default=0.0)
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.routes.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)} ({', '.join(SCENARIOS)})")
+
+    with tempfile.TemporaryDirectory(prefix="stockchart-load-") as workdir:
+        processes = spawn_servers(args, workdir) if args.spawn else []
+        try:
+            print(f"{args.base_url}  concurrency={args.concurrency} duration={args.duration}s symbols={args.symbols}")
+            print(f"{'route':>18} {'requests':>8} {'errors':>7} {'rps':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+            results = asyncio.run(run_all(args, names))
+        finally:
+            stop_servers(processes)
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "config": {
+            "base_url": args.base_url,
+            "spawn": args.spawn,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "symbols": args.symbols,
+            **(
+                {
+                    "mock_latency": args.latency,
+                    "mock_jitter": args.jitter,
+                    "mock_error_rate": args.error_rate,
+                    "mock_rate_limit": args.rate_limit,
+                }
+                if args.spawn
+                else {}
+            ),
+        },
+        "routes": results,
+    }
+    out = args.out or os.path.join(RESULTS_DIR, f"load-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {out}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import os
+import asyncio
+import time
+import contextvars
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from .log import get_logger
+from .shared_store import get_store
+
+logger = get_logger(__name__)
+
+# 비동기 TTL 캐시
+# - 같은 키에 대한 동시 요청은 진행 중인 하나의 업스트림 조회를 함께 기다림 (request coalescing)
+# - 히트/미스/병합 횟수를 기록해서 /cache/stats 로 노출
+# - stale_ttl 을 주면 만료 후에도 그 시간 동안은 마지막 값을 보관 (stale-while-revalidate)
+#   → 갱신이 STALE_WAIT_SECONDS 안에 끝나지 않거나 실패하면 마지막 값으로 응답하고 갱신은 계속 진행
+#   → stale 로 응답한 요청은 X-Data-Stale / Warning 헤더로 표시
+# - shared=True 면 조회 결과를 워커 간 공유 저장소에도 저장하고, 로컬에 없을 때 업스트림보다 먼저 확인
+#   (값은 JSON 직렬화 가능해야 함, 공유 저장소 오류 시에는 로컬 캐시만 사용)
+
+# stale 값이 있을 때 갱신을 기다리는 최대 시간 (초)
+STALE_WAIT_SECONDS = float(os.getenv("CACHE_STALE_WAIT_SECONDS", "1.0"))
+
+_registry: list["AsyncTTLCache"] = []
+_stale_marks: contextvars.ContextVar[list | None] = contextvars.ContextVar("stale_marks", default=None)
+
+
+def _consume_result(task: asyncio.Task):
+    # 아무도 기다리지 않게 된 갱신 작업의 예외 경고 방지
+    if not task.cancelled():
+        task.exception()
+
+
+def mark_stale(name: str, age: float):
+    """현재 요청이 stale 데이터로 응답함을 기록"""
+    marks = _stale_marks.get()
+    if marks is not None:
+        marks.append((name, age))
+
+
+class AsyncTTLCache:
+    def __init__(
+        self,
+        name: str,
+        ttl: float | Callable[[], float],
+        maxsize: int = 4096,
+        stale_ttl: float = 0.0,
+        shared: bool = False,
+    ):
+        """ttl 은 초 단위 고정값 또는 저장 시점마다 호출되는 함수, stale_ttl 은 만료 후 stale 로 제공할 수 있는 시간"""
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self.shared = shared
+        self._data: OrderedDict = OrderedDict()  # key → (만료 시각 (monotonic), 값, 저장 시각 (epoch))
+        self._inflight: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stale_served = 0
+        self.shared_hits = 0
+        register_cache(self)
+
+    def _ttl(self) -> float:
+        return self.ttl() if callable(self.ttl) else self.ttl
+
+    def stored_at(self, key) -> float | None:
+        """값을 저장한 시각 (epoch 초, stale 값 포함 / 없으면 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        return entry[2]
+
+    def get(self, key):
+        """만료되지 않은 값이 있으면 반환, 없으면 None (통계에 반영하지 않음)"""
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def contains(self, key) -> bool:
+        """만료되지 않은 값이 있는지 (값이 None 이어도 True)"""
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def set(self, key, value, ttl: float | None = None, stored_at: float | None = None):
+        ttl = self._ttl() if ttl is None else ttl
+        self._data[key] = (time.monotonic() + ttl, value, time.time() if stored_at is None else stored_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key=None):
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+    def _start_load(self, key, loader) -> asyncio.Future:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, loader))
+            task.add_done_callback(_consume_result)
+            self._inflight[key] = task
+        return task
+
+    async def get_or_load(self, key, loader: Callable[[], Awaitable]):
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            self._data.move_to_end(key)
+            return entry[1]
+
+        task = self._start_load(key, loader)
+        # 한 요청이 취소되어도 다른 대기자를 위해 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    async def get_or_load_stale(
+        self, key, loader: Callable[[], Awaitable], wait: float = STALE_WAIT_SECONDS
+    ):
+        """
+        get_or_load + stale-while-revalidate
+        만료 후 stale_ttl 안의 값이 있으면 갱신을 wait 초까지만 기다리고, 늦거나 실패하면 그 값을 반환
+        """
+        now = time.monotonic()
+        entry = self._data.get(key)
+        if entry is None or entry[0] > now or now > entry[0] + self.stale_ttl:
+            return await self.get_or_load(key, loader)
+
+        task = self._start_load(key, loader)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), wait)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.stale_served += 1
+            mark_stale(self.name, time.time() - entry[2])
+            return entry[1]
+
+    def _shared_key(self, key) -> str:
+        return f"cache:{self.name}:{key}"
+
+    async def _load_shared(self, key):
+        """다른 워커가 저장한 값 (없거나 만료됐으면 None)"""
+        try:
+            entry = await get_store().get(self._shared_key(key))
+        except Exception as e:
+            logger.warning("❌ 공유 캐시 조회 실패: %s %s", self.name, e)
+            return None
+        if entry is None or entry["expires_at"] <= time.time():
+            return None
+        self.shared_hits += 1
+        self.set(key, entry["value"], ttl=entry["expires_at"] - time.time(), stored_at=entry["stored_at"])
+        return entry
+
+    async def _save_shared(self, key, value):
+        ttl = self._ttl()
+        now = time.time()
+        try:
+            await get_store().set(
+                self._shared_key(key),
+                {"value": value, "stored_at": now, "expires_at": now + ttl},
+                ttl=ttl,
+            )
+        except Exception as e:
+            logger.warning("❌ 공유 캐시 저장 실패: %s %s", self.name, e)
+
+    async def _load(self, key, loader):
+        try:
+            if self.shared:
+                entry = await self._load_shared(key)
+                if entry is not None:
+                    return entry["value"]
+            value = await loader()
+            self.set(key, value)
+            if self.shared:
+                await self._save_shared(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stale_served": self.stale_served,
+            "shared_hits": self.shared_hits,
+            "inflight": len(self._inflight),
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
+
+
+def register_cache(cache):
+    """stats() 를 가진 캐시를 /cache/stats 및 /metrics 에 등록"""
+    _registry.append(cache)
+
+
+def stale_marks() -> list:
+    """현재 요청에서 stale 로 응답한 데이터 목록 [(이름, 경과 초), ...]"""
+    return list(_stale_marks.get() or ())
+
+
+def cache_stats() -> list:
+    return [cache.stats() for cache in _registry]
+
+
+# ✅ stale 응답 표시 미들웨어 (ASGI)
+class StaleMarkerMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        marks: list = []
+        token = _stale_marks.set(marks)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and marks:
+                value = ", ".join(f"{name};age={age:.1f}" for name, age in marks)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-data-stale", value.encode("latin-1")),
+                    (b"warning", b'110 - "Response is Stale"'),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _stale_marks.reset(token)
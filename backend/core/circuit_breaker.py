@@ -0,0 +1,124 @@
+import os
+import time
+
+# TR_ID 별 서킷 브레이커
+# - closed    : 정상. 연속 실패가 FAILURE_THRESHOLD 회에 도달하면 open
+# - open      : RECOVERY_SECONDS 동안 업스트림을 호출하지 않고 바로 CircuitOpen 발생
+# - half_open : 복구 대기 후 시험 요청 HALF_OPEN_MAX 건만 통과, 성공하면 closed / 실패하면 다시 open
+# - 실패로 세는 것은 타임아웃 · 연결 오류 · 5xx 뿐 (rt_cd 업무 오류와 초당 요청 수 초과는 제외)
+
+FAILURE_THRESHOLD = int(os.getenv("KIS_BREAKER_FAILURES", "5"))
+RECOVERY_SECONDS = float(os.getenv("KIS_BREAKER_RECOVERY_SECONDS", "30"))
+HALF_OPEN_MAX = int(os.getenv("KIS_BREAKER_HALF_OPEN_MAX", "1"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class UpstreamError(Exception):
+    """업스트림 장애로 응답할 수 없을 때 (main 의 예외 핸들러가 구조화된 5xx 응답으로 변환)"""
+
+    status_code = 502
+    code = "upstream_error"
+
+    def __init__(self, tr_id: str, message: str, retry_after: float | None = None):
+        self.tr_id = tr_id
+        self.retry_after = retry_after
+        super().__init__(message)
+
+    def to_dict(self) -> dict:
+        body = {"detail": str(self), "code": self.code, "tr_id": self.tr_id}
+        if self.retry_after is not None:
+            body["retry_after"] = round(self.retry_after, 1)
+        return body
+
+
+class CircuitOpen(UpstreamError):
+    status_code = 503
+    code = "circuit_open"
+
+    def __init__(self, tr_id: str, retry_after: float):
+        super().__init__(tr_id, f"업스트림 장애로 {tr_id} 요청을 일시 중단했습니다.", retry_after)
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        recovery_seconds: float = RECOVERY_SECONDS,
+        half_open_max: int = HALF_OPEN_MAX,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.half_open_max = half_open_max
+        self.state = CLOSED
+        self.failures = 0  # 연속 실패 수
+        self.opened_at = 0.0
+        self._trials = 0  # half_open 상태에서 진행 중인 시험 요청 수
+        self.opened_count = 0
+        self.rejected = 0
+
+    def before_call(self):
+        """호출 전 확인 (열려 있으면 CircuitOpen)"""
+        if self.state == OPEN:
+            remaining = self.opened_at + self.recovery_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpen(self.name, remaining)
+            self.state = HALF_OPEN
+            self._trials = 0
+        if self.state == HALF_OPEN:
+            if self._trials >= self.half_open_max:
+                self.rejected += 1
+                raise CircuitOpen(self.name, self.recovery_seconds)
+            self._trials += 1
+
+    def record_success(self):
+        self.failures = 0
+        if self.state != CLOSED:
+            self.state = CLOSED
+            self._trials = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opened_count += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._trials = 0
+
+    def release(self):
+        """성공 / 실패로 판정하지 않고 끝난 호출 (rt_cd 오류, 취소 등) 의 시험 요청 반환"""
+        if self.state == HALF_OPEN and self._trials > 0:
+            self._trials -= 1
+
+    def stats(self) -> dict:
+        retry_after = 0.0
+        if self.state == OPEN:
+            retry_after = max(self.opened_at + self.recovery_seconds - time.monotonic(), 0.0)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened": self.opened_count,
+            "rejected": self.rejected,
+            "retry_after": round(retry_after, 1),
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def breaker_for(tr_id: str) -> CircuitBreaker:
+    breaker = _breakers.get(tr_id)
+    if breaker is None:
+        breaker = _breakers[tr_id] = CircuitBreaker(tr_id)
+    return breaker
+
+
+def breaker_stats() -> dict:
+    return {tr_id: breaker.stats() for tr_id, breaker in sorted(_breakers.items())}
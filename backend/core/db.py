@@ -0,0 +1,27 @@
+import os
+import sqlite3
+
+# 로컬 저장소 (SQLite, 프로세스당 커넥션 1개)
+# - WAL 모드: 읽기와 쓰기가 서로 막지 않음
+# - 모든 접근이 이벤트 루프 스레드에서 짧게 일어나므로 별도 락 없이 사용
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.getenv("MARKET_DB_PATH", os.path.join(BASE_DIR, "..", "data", "market.sqlite3"))
+
+_conn: sqlite3.Connection | None = None
+
+
+def get_connection() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+    return _conn
+
+
+def close_connection():
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
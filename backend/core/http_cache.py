@@ -0,0 +1,159 @@
+import os
+import json
+import hashlib
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable
+
+from fastapi import Request, Response
+
+from .cache import register_cache, stale_marks
+from .profiling import span
+from ..utils.market_hours import is_market_open
+
+# HTTP 조건부 요청 / Cache-Control
+# - 라우트가 원본 데이터의 버전(마지막 봉 날짜, 결산 기간(stac_yymm), 시세 조회 시각 등)을 먼저 구하면
+#   ETag 는 (리소스 키, 버전) 으로 만들어서 본문을 만들지 않고도 비교 가능
+# - If-None-Match (없으면 If-Modified-Since) 가 일치하면 점수 계산 / 리샘플 / 직렬화 없이 304
+# - 인코딩한 응답 바이트는 리소스 키별로 마지막 버전 1개를 보관해서 버전이 같으면 그대로 재전송
+# - stale 데이터로 응답한 경우에는 공유 캐시에 오래 남지 않도록 no-cache
+
+# 장중 / 장 마감 후 시세 기반 응답의 max-age (초)
+LIVE_MAX_AGE = int(os.getenv("HTTP_CACHE_LIVE_MAX_AGE", "3"))
+CLOSED_MAX_AGE = int(os.getenv("HTTP_CACHE_CLOSED_MAX_AGE", "300"))
+# 재무비율 (결산 기간 단위로 바뀌는 데이터) 응답의 max-age (초)
+RATIO_MAX_AGE = int(os.getenv("HTTP_CACHE_RATIO_MAX_AGE", "3600"))
+# 리소스 키별 응답 바이트 보관 개수
+RESPONSE_CACHE_SIZE = int(os.getenv("HTTP_RESPONSE_CACHE_SIZE", "2048"))
+# 배포 시 값을 바꾸면 (응답 형식 / 점수 모델 변경 등) 기존 ETag 가 모두 무효화됨
+ETAG_SALT = os.getenv("HTTP_ETAG_SALT", "")
+
+
+def market_max_age() -> int:
+    """장중에는 시세 캐시 주기에 맞춰 짧게, 장 마감 후에는 길게"""
+    return LIVE_MAX_AGE if is_market_open() else CLOSED_MAX_AGE
+
+
+def make_etag(key, version) -> str:
+    digest = hashlib.blake2b(repr((ETAG_SALT, key, version)).encode("utf-8"), digest_size=12)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etags: tuple) -> bool:
+    """If-None-Match 헤더가 etags (따옴표 포함) 중 하나와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return any(etag in candidates for etag in etags)
+
+
+def _not_modified_since(if_modified_since: str | None, last_modified: float | None) -> bool:
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP 날짜는 초 단위
+    return int(last_modified) <= since
+
+
+def encode_json(content) -> bytes:
+    """기본 JSONResponse 와 같은 형식으로 직렬화"""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class ResponseCache:
+    def __init__(self, name: str, max_age: int | Callable[[], int], maxsize: int = RESPONSE_CACHE_SIZE):
+        """max_age 는 초 단위 고정값 또는 응답 시점마다 호출되는 함수"""
+        self.name = name
+        self.max_age = max_age
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()  # key → (ETag, 바이트)
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        register_cache(self)
+
+    def _max_age(self) -> int:
+        return self.max_age() if callable(self.max_age) else self.max_age
+
+    def _headers(self, etag: str, last_modified: float | None, vary: str | None) -> dict:
+        if stale_marks():
+            cache_control = "no-cache"
+        else:
+            cache_control = f"public, max-age={self._max_age()}"
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if last_modified is not None:
+            headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+        if vary:
+            headers["Vary"] = vary
+        return headers
+
+    async def respond(
+        self,
+        request: Request,
+        key,
+        version,
+        build: Callable,
+        *,
+        last_modified: float | None = None,
+        media_type: str = "application/json",
+        encode: Callable = encode_json,
+        vary: str | None = None,
+    ) -> Response:
+        """
+        key     : 리소스 식별자 (종목, 쿼리 파라미터, 응답 형식 등 본문을 결정하는 값 전체)
+        version : 원본 데이터 버전 (같으면 본문도 같음)
+        build   : 본문 생성 (동기 또는 async, encode 로 바이트 변환)
+        """
+        etag = make_etag((self.name, key), version)
+        headers = self._headers(etag, last_modified, vary)
+
+        if_none_match = request.headers.get("if-none-match")
+        if etag_matches(if_none_match, (etag,)) or (
+            if_none_match is None
+            and _not_modified_since(request.headers.get("if-modified-since"), last_modified)
+        ):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        entry = self._data.get(key)
+        if entry is not None and entry[0] == etag:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return Response(content=entry[1], media_type=media_type, headers=headers)
+
+        self.misses += 1
+        content = build()
+        if hasattr(content, "__await__"):
+            content = await content
+        with span("encode"):
+            body = encode(content)
+        self._data[key] = (etag, body)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return Response(content=body, media_type=media_type, headers=headers)
+
+    def invalidate(self, key=None):
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.not_modified
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": round((self.hits + self.not_modified) / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,211 @@
+import os
+import time
+import random
+import asyncio
+import logging
+import httpx
+from dotenv import load_dotenv
+from . import token_manager
+from .scheduler import scheduler
+from .log import get_logger, log_sampled, preview
+from .metrics import upstream_duration, upstream_errors
+from .profiling import span
+from .circuit_breaker import UpstreamError, breaker_for
+
+load_dotenv()
+
+# 한국투자증권 API 공용 비동기 클라이언트
+# - 프로세스 전체에서 하나의 httpx.AsyncClient 를 공유 (keep-alive 커넥션 풀)
+# - TR_ID 별 요청 경로/기본 파라미터/타임아웃을 한 곳에서 관리
+# - TR_ID 별 서킷 브레이커 + 일시적 오류(타임아웃 · 연결 오류 · 5xx)는 지터를 섞은 지수 백오프로 제한된 횟수만 재시도
+
+# ✅ TR_ID 별 요청 정의
+TR_SPECS = {
+    # 주식현재가 시세
+    "FHKST01010100": {
+        "path": "/uapi/domestic-stock/v1/quotations/inquire-price",
+        "params": {"fid_cond_mrkt_div_code": "J"},
+        "timeout": 3.0,
+    },
+    # 주식현재가 일자별
+    "FHKST01010400": {
+        "path": "/uapi/domestic-stock/v1/quotations/inquire-daily-price",
+        "params": {"fid_cond_mrkt_div_code": "J", "fid_org_adj_prc": "1"},
+        "timeout": 5.0,
+    },
+    # 국내주식 기간별 시세 (일/주/월/년, 조회 구간 지정 · 최대 100건)
+    "FHKST03010100": {
+        "path": "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice",
+        "params": {
+            "fid_cond_mrkt_div_code": "J",
+            "fid_period_div_code": "D",
+            "fid_org_adj_prc": "0",  # 0: 수정주가
+        },
+        "timeout": 5.0,
+    },
+    # 재무비율 - 안정성비율
+    "FHKST66430600": {
+        "path": "/uapi/domestic-stock/v1/finance/stability-ratio",
+        "params": {"fid_cond_mrkt_div_code": "J", "fid_div_cls_code": "1"},
+        "timeout": 5.0,
+    },
+    # 재무비율 - 수익성비율
+    "FHKST66430400": {
+        "path": "/uapi/domestic-stock/v1/finance/profit-ratio",
+        "params": {"fid_cond_mrkt_div_code": "J", "fid_div_cls_code": "1"},
+        "timeout": 5.0,
+    },
+}
+
+# 커넥션 풀 설정 (동시에 수백 개의 업스트림 요청을 유지할 수 있도록)
+MAX_CONNECTIONS = int(os.getenv("KIS_MAX_CONNECTIONS", "200"))
+MAX_KEEPALIVE = int(os.getenv("KIS_MAX_KEEPALIVE", "50"))
+DEFAULT_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+
+# 초당 요청 수 초과 응답 코드 / 재시도 횟수
+THROTTLE_MSG_CD = "EGW00201"
+THROTTLE_RETRIES = int(os.getenv("KIS_THROTTLE_RETRIES", "2"))
+# 일시적 오류 재시도 횟수 / 백오프 (초, 재시도마다 2배, 0 ~ 상한 사이 무작위)
+UPSTREAM_RETRIES = int(os.getenv("KIS_UPSTREAM_RETRIES", "2"))
+BACKOFF_BASE = float(os.getenv("KIS_BACKOFF_BASE", "0.2"))
+BACKOFF_MAX = float(os.getenv("KIS_BACKOFF_MAX", "2.0"))
+
+_client: httpx.AsyncClient | None = None
+logger = get_logger(__name__)
+
+
+class KisApiError(Exception):
+    """KIS 응답의 rt_cd 가 "0" 이 아닐 때 발생"""
+
+    def __init__(self, tr_id: str, res_json: dict):
+        self.tr_id = tr_id
+        self.res_json = res_json
+        super().__init__(f"API 오류: {res_json}")
+
+
+class UpstreamTimeout(UpstreamError):
+    status_code = 504
+    code = "upstream_timeout"
+
+
+class UpstreamUnavailable(UpstreamError):
+    status_code = 503
+    code = "upstream_unavailable"
+
+
+def backoff_delay(retry: int) -> float:
+    """full jitter: 0 ~ min(상한, 기본값 · 2^retry)"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**retry))
+
+
+# ✅ 공용 클라이언트 (최초 호출 시 생성)
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=os.getenv("BASE_URL", ""),
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE,
+            ),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# ✅ TR_ID 별 요청 헤더/파라미터 생성
+def build_headers(tr_id: str, token: str) -> dict:
+    return {
+        "content-type": "application/json",
+        "authorization": f"Bearer {token}",
+        "appkey": os.getenv("APP_KEY"),
+        "appsecret": os.getenv("APP_SECRET"),
+        "tr_id": tr_id,
+        "custtype": "P",
+    }
+
+
+def build_params(tr_id: str, symbol: str, **extra) -> dict:
+    params = dict(TR_SPECS[tr_id]["params"])
+    params["fid_input_iscd"] = symbol
+    params.update(extra)
+    return params
+
+
+# ✅ KIS GET 요청 (서킷 브레이커 + 스케줄러 대기 + rt_cd 검사 + 재시도 포함)
+async def kis_get(tr_id: str, symbol: str, **extra) -> dict:
+    spec = TR_SPECS[tr_id]
+    breaker = breaker_for(tr_id)
+    with span("token"):
+        token = await token_manager.get_access_token()
+
+    throttles = 0
+    failures = 0
+    while True:
+        breaker.before_call()
+        try:
+            with span("queue"):
+                await scheduler.acquire()
+            started = time.perf_counter()
+            try:
+                with span(f"upstream.{tr_id}"):
+                    response = await get_client().get(
+                        spec["path"],
+                        headers=build_headers(tr_id, token),
+                        params=build_params(tr_id, symbol, **extra),
+                        timeout=spec["timeout"],
+                    )
+                with span("parse"):
+                    res_json = response.json()
+                error = None
+            except (httpx.TimeoutException, httpx.TransportError, ValueError) as e:
+                error = e
+            finally:
+                upstream_duration.observe(time.perf_counter() - started, tr_id)
+        except BaseException:
+            # 대기열 거절 / 취소 등 업스트림 상태와 무관한 종료
+            breaker.release()
+            raise
+
+        if error is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                log_sampled(logger, logging.DEBUG, "📦 %s %s 응답: %s", tr_id, symbol, preview(res_json))
+            if res_json.get("rt_cd") == "0":
+                breaker.record_success()
+                return res_json
+
+            # 초당 요청 수 초과면 속도를 늦추고 다시 대기열로
+            if res_json.get("msg_cd") == THROTTLE_MSG_CD:
+                upstream_errors.inc(tr_id, "throttle")
+                breaker.release()
+                if throttles == THROTTLE_RETRIES:
+                    raise KisApiError(tr_id, res_json)
+                throttles += 1
+                logger.info("⏳ %s 초당 요청 수 초과, 재시도 (%d/%d)", tr_id, throttles, THROTTLE_RETRIES)
+                scheduler.throttle()
+                continue
+
+            # 업무 오류 (잘못된 종목 등) 는 업스트림이 살아 있다는 뜻이므로 재시도하지 않음
+            if response.status_code < 500:
+                upstream_errors.inc(tr_id, "rt_cd")
+                breaker.record_success()
+                raise KisApiError(tr_id, res_json)
+            error = UpstreamUnavailable(tr_id, f"KIS 서버 오류 ({tr_id}): {res_json.get('msg1')}")
+
+        upstream_errors.inc(tr_id, type(error).__name__)
+        breaker.record_failure()
+        if failures == UPSTREAM_RETRIES:
+            if isinstance(error, httpx.TimeoutException):
+                raise UpstreamTimeout(tr_id, f"KIS 응답 지연 ({tr_id})") from error
+            if isinstance(error, UpstreamError):
+                raise error
+            raise UpstreamUnavailable(tr_id, f"KIS 연결 실패 ({tr_id}): {error}") from error
+        await asyncio.sleep(backoff_delay(failures))
+        failures += 1
@@ -0,0 +1,36 @@
+import os
+import random
+import logging
+
+# 로깅 설정
+# - LOG_LEVEL 로 레벨 지정 (기본 INFO)
+# - 응답 원본처럼 양이 많은 로그는 LOG_SAMPLE_RATE 비율만 남기고, 길이도 잘라서 기록
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# 샘플링 로그를 남길 비율 (0 ~ 1)
+SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.01"))
+# 원본 데이터 미리보기 최대 길이
+PREVIEW_CHARS = int(os.getenv("LOG_PREVIEW_CHARS", "500"))
+
+
+def configure_logging():
+    """앱 시작 시 1회 (이미 핸들러가 설정되어 있으면 레벨만 적용)"""
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("backend").setLevel(LOG_LEVEL)
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(name)
+
+
+def log_sampled(logger: logging.Logger, level: int, msg: str, *args, rate: float = SAMPLE_RATE):
+    """rate 비율만 기록 (해당 레벨이 꺼져 있으면 인자도 만들지 않도록 호출 전에 isEnabledFor 로 확인 권장)"""
+    if logger.isEnabledFor(level) and random.random() < rate:
+        logger.log(level, msg, *args)
+
+
+def preview(value, limit: int = PREVIEW_CHARS) -> str:
+    text = str(value)
+    return text if len(text) <= limit else f"{text[:limit]}... ({len(text)}자)"
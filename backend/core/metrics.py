@@ -0,0 +1,283 @@
+import os
+import time
+import asyncio
+from typing import Callable
+
+# Prometheus 텍스트 형식 메트릭 (외부 라이브러리 없이 /metrics 로 노출)
+# - 라우트별 응답 시간 (미들웨어), TR_ID 별 업스트림 응답 시간 / 오류, 토큰 발급 횟수
+# - 이벤트 루프 지연 (주기적으로 sleep 해서 예정보다 늦게 깨어난 시간 측정), 스레드풀 사용량
+# - 캐시 / 스케줄러 상태는 조회 시점에 콜백으로 수집
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# 이벤트 루프 지연 측정 주기 (초)
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL", "0.5"))
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry: list = []
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels_text(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        _registry.append(self)
+
+    def _header(self) -> list:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        super().__init__(name, help, labels)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1.0):
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> list:
+        lines = self._header()
+        for values, count in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels_text(self.labels, values)} {_number(count)}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # 라벨 값 → [구간별 개수..., 합계, 개수]
+
+    def observe(self, value: float, *label_values):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * len(self.buckets) + [0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+                break
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list:
+        lines = self._header()
+        for values, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = _labels_text(self.labels, values, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _labels_text(self.labels, values)
+            inf = _labels_text(self.labels, values, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {series[-1]}")
+            lines.append(f"{self.name}_sum{labels} {_number(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class Callback(_Metric):
+    """조회 시점에 값을 수집하는 메트릭 (collect → [(라벨 값 tuple, 값)])"""
+
+    def __init__(self, name: str, help: str, kind: str, collect: Callable[[], list], labels: tuple = ()):
+        super().__init__(name, help, labels)
+        self.kind = kind
+        self.collect = collect
+
+    def render(self) -> list:
+        lines = self._header()
+        for values, value in self.collect():
+            lines.append(f"{self.name}{_labels_text(self.labels, values)} {_number(value)}")
+        return lines
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ✅ 메트릭 정의
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "라우트별 응답 시간", ("method", "route", "status")
+)
+http_in_progress: dict[str, int] = {"value": 0}
+Callback(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수", "gauge",
+    lambda: [((), http_in_progress["value"])],
+)
+upstream_duration = Histogram(
+    "kis_upstream_request_duration_seconds", "TR_ID 별 KIS 응답 시간 (스케줄러 대기 제외)", ("tr_id",)
+)
+upstream_errors = Counter("kis_upstream_errors_total", "TR_ID 별 KIS 요청 오류", ("tr_id", "reason"))
+token_refreshes = Counter("kis_token_refresh_total", "접근 토큰 발급 요청 수", ("result",))
+loop_lag = Histogram(
+    "event_loop_lag_seconds", "이벤트 루프가 예정보다 늦게 깨어난 시간", buckets=LOOP_LAG_BUCKETS
+)
+_last_loop_lag = {"value": 0.0}
+Callback(
+    "event_loop_lag_last_seconds", "마지막으로 측정한 이벤트 루프 지연", "gauge",
+    lambda: [((), _last_loop_lag["value"])],
+)
+
+
+def _threadpool_usage() -> list:
+    # 동기 라우트 / run_in_threadpool 이 사용하는 anyio 기본 스레드 한도
+    try:
+        from anyio import to_thread
+
+        limiter = to_thread.current_default_thread_limiter()
+        return [(("borrowed",), limiter.borrowed_tokens), (("total",), limiter.total_tokens)]
+    except Exception:
+        return []
+
+
+Callback("threadpool_tokens", "스레드풀 사용 중 / 전체 슬롯", "gauge", _threadpool_usage, ("state",))
+
+
+def _cache_stat(field: str) -> Callable[[], list]:
+    def collect():
+        from .cache import cache_stats
+
+        # 캐시 종류마다 집계하는 항목이 다름 (응답 캐시에는 병합 / stale 없음, TTL 캐시에는 304 없음)
+        return [((stats["name"],), stats[field]) for stats in cache_stats() if field in stats]
+
+    return collect
+
+
+for _field, _kind, _help in (
+    ("hits", "counter", "캐시 히트 수"),
+    ("misses", "counter", "캐시 미스 수"),
+    ("coalesced", "counter", "진행 중인 조회에 합류한 요청 수"),
+    ("stale_served", "counter", "갱신 지연 / 실패로 stale 값으로 응답한 수"),
+    ("shared_hits", "counter", "다른 워커가 공유 저장소에 저장한 값을 사용한 수"),
+    ("not_modified", "counter", "If-None-Match / If-Modified-Since 일치로 304 응답한 수"),
+    ("size", "gauge", "캐시 항목 수"),
+    ("hit_ratio", "gauge", "캐시 히트율 (병합 포함)"),
+):
+    Callback(f"cache_{_field}" + ("_total" if _kind == "counter" else ""), _help, _kind, _cache_stat(_field), ("cache",))
+
+
+def _scheduler_stat(field: str) -> Callable[[], list]:
+    def collect():
+        from .scheduler import scheduler
+
+        return [((), scheduler.stats()[field])]
+
+    return collect
+
+
+for _field, _kind, _help in (
+    ("queue_depth", "gauge", "KIS 요청 대기열 길이"),
+    ("tokens", "gauge", "남은 요청 토큰"),
+    ("rejected", "counter", "대기열이 가득 차서 거절한 요청 수"),
+    ("throttled", "counter", "초당 요청 수 초과 응답 횟수"),
+):
+    Callback(f"kis_scheduler_{_field}" + ("_total" if _kind == "counter" else ""), _help, _kind, _scheduler_stat(_field))
+
+
+def _breaker_states() -> list:
+    from .circuit_breaker import _breakers, STATE_VALUES
+
+    return [((tr_id,), STATE_VALUES[breaker.state]) for tr_id, breaker in sorted(_breakers.items())]
+
+
+Callback(
+    "kis_circuit_state", "TR_ID 별 서킷 브레이커 상태 (0 closed / 1 half_open / 2 open)", "gauge",
+    _breaker_states, ("tr_id",),
+)
+
+
+# ✅ 라우트별 응답 시간 미들웨어 (ASGI, 웹소켓은 그대로 통과)
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: dict | None = None
+
+    def _route_path(self, scope) -> str:
+        # 라우터가 scope 에 기록한 endpoint 로 경로 템플릿 조회 (/chart/{timeframe} 처럼 라벨 수가 늘지 않도록)
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if self._route_paths is None:
+            app = scope.get("app")
+            routes = getattr(app, "routes", [])
+            self._route_paths = {
+                getattr(route, "endpoint", None): route.path for route in routes if hasattr(route, "path")
+            }
+        return self._route_paths.get(endpoint, "unmatched")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        http_in_progress["value"] += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_in_progress["value"] -= 1
+            http_request_duration.observe(
+                time.perf_counter() - started, scope["method"], self._route_path(scope), str(status["code"])
+            )
+
+
+# ✅ 이벤트 루프 지연 측정
+_monitor_task: asyncio.Task | None = None
+
+
+async def _monitor_loop(interval: float):
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - expected, 0.0)
+        _last_loop_lag["value"] = lag
+        loop_lag.observe(lag)
+
+
+def start_loop_monitor(interval: float = LOOP_MONITOR_INTERVAL):
+    global _monitor_task
+    if _monitor_task is None or _monitor_task.done():
+        _monitor_task = asyncio.create_task(_monitor_loop(interval))
+
+
+async def stop_loop_monitor():
+    global _monitor_task
+    if _monitor_task is not None:
+        _monitor_task.cancel()
+        await asyncio.gather(_monitor_task, return_exceptions=True)
+        _monitor_task = None
@@ -0,0 +1,163 @@
+import os
+import io
+import time
+import pstats
+import random
+import cProfile
+import contextvars
+from fastapi.responses import JSONResponse
+
+# 요청 단위 프로파일링 (필요할 때만 켜는 모드)
+# - 관리자 헤더 (X-Profile: PROFILE_TOKEN) 또는 PROFILE_SAMPLE_RATE 비율의 요청만 측정
+# - 측정 중인 요청은 구간(span)별 소요 시간을 모아서 Server-Timing 헤더로 반환
+#   (lookup / token / queue / upstream.<TR_ID> / parse / score / indicators / resample / encode)
+# - 측정 요청 중 PROFILE_DUMP_RATE 비율 (또는 X-Profile-Dump: 1) 은 cProfile 결과를 파일로 저장
+#   (같은 스레드의 다른 요청도 함께 잡히므로 한 번에 하나만 기록)
+# - 측정하지 않는 요청은 contextvar 조회 1번 외에 비용 없음
+
+PROFILE_HEADER = "x-profile"
+PROFILE_DUMP_HEADER = "x-profile-dump"
+# 관리자 헤더 값 (비어 있으면 헤더로 켜는 기능 비활성)
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+# 헤더 없이 측정할 요청 비율 (0 ~ 1)
+SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+# 측정 요청 중 cProfile 결과를 저장할 비율 (0 ~ 1)
+DUMP_RATE = float(os.getenv("PROFILE_DUMP_RATE", "0.1"))
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DUMP_DIR = os.getenv("PROFILE_DUMP_DIR", os.path.join(BASE_DIR, "..", "data", "profiles"))
+# 보관할 cProfile 결과 파일 수 (오래된 것부터 삭제)
+DUMP_KEEP = int(os.getenv("PROFILE_DUMP_KEEP", "50"))
+
+_spans: contextvars.ContextVar[list | None] = contextvars.ContextVar("profile_spans", default=None)
+_dumping = False
+
+
+class span:
+    """with span("parse"): ... → 측정 중인 요청이면 소요 시간 기록 (gather 로 나뉜 task 도 같은 목록에 기록)"""
+
+    __slots__ = ("name", "_spans", "_started")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._spans = _spans.get()
+
+    def __enter__(self):
+        if self._spans is not None:
+            self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self._spans is not None:
+            self._spans.append((self.name, time.perf_counter() - self._started))
+        return False
+
+
+def is_admin(headers: dict) -> bool:
+    return bool(PROFILE_TOKEN) and headers.get(PROFILE_HEADER) == PROFILE_TOKEN
+
+
+def server_timing(spans: list, total: float) -> str:
+    """같은 이름의 구간은 합산 (desc 에 횟수)"""
+    merged: dict[str, list] = {}
+    for name, seconds in spans:
+        entry = merged.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+    parts = [
+        f'{name};dur={seconds * 1000:.2f}' + (f';desc="x{count}"' if count > 1 else "")
+        for name, (seconds, count) in merged.items()
+    ]
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
+
+
+def _dump_name(path: str) -> str:
+    """ex. 20261018-102030-123-chart_daily.prof"""
+    now = time.time()
+    label = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in path.strip("/")) or "root"
+    return f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}-{label}.prof"
+
+
+def _save_dump(profiler: cProfile.Profile, name: str):
+    os.makedirs(DUMP_DIR, exist_ok=True)
+    profiler.dump_stats(os.path.join(DUMP_DIR, name))
+    for old in list_dumps()[DUMP_KEEP:]:
+        os.remove(os.path.join(DUMP_DIR, old))
+
+
+def list_dumps() -> list:
+    """저장된 cProfile 결과 파일 (최신 → 과거)"""
+    if not os.path.isdir(DUMP_DIR):
+        return []
+    return sorted((f for f in os.listdir(DUMP_DIR) if f.endswith(".prof")), reverse=True)
+
+
+def dump_path(name: str) -> str | None:
+    if name not in list_dumps():
+        return None
+    return os.path.join(DUMP_DIR, name)
+
+
+def dump_text(name: str, limit: int = 50, sort: str = "cumulative") -> str | None:
+    path = dump_path(name)
+    if path is None:
+        return None
+    out = io.StringIO()
+    pstats.Stats(path, stream=out).sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+# ✅ 기본 JSON 응답 직렬화 시간 기록 (encode 구간)
+class TimedJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        with span("encode"):
+            return super().render(content)
+
+
+# ✅ 요청 단위 프로파일링 미들웨어 (ASGI)
+class ProfilingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        admin = is_admin(headers)
+        if not admin and not (SAMPLE_RATE and random.random() < SAMPLE_RATE):
+            await self.app(scope, receive, send)
+            return
+
+        global _dumping
+        spans: list = []
+        token = _spans.set(spans)
+        dump = not _dumping and (
+            (admin and headers.get(PROFILE_DUMP_HEADER) == "1") or random.random() < DUMP_RATE
+        )
+        profiler = cProfile.Profile() if dump else None
+        dump_name = _dump_name(scope["path"]) if dump else None
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                timing = server_timing(spans, time.perf_counter() - started)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1"))
+                ]
+                if dump_name is not None:
+                    message["headers"].append((b"x-profile-dump", dump_name.encode("latin-1")))
+            await send(message)
+
+        try:
+            if profiler is not None:
+                _dumping = True
+                profiler.enable()
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                _dumping = False
+                _save_dump(profiler, dump_name)
+            _spans.reset(token)
@@ -0,0 +1,173 @@
+import os
+import time
+import heapq
+import asyncio
+import itertools
+import contextvars
+from contextlib import contextmanager
+
+# KIS 업스트림 요청 스케줄러
+# - 앱키당 초당 요청 수 제한에 맞춰 토큰 버킷으로 요청 속도를 조절
+# - 대기 중인 요청은 우선순위 순서로 처리 (사용자 요청 > 백그라운드 작업)
+# - 대기열이 가득 차면 바로 SchedulerBusy 를 발생시켜 503 으로 응답 (무한정 쌓이지 않도록)
+
+# 초당 허용 요청 수 / 순간 최대 요청 수 / 최대 대기 요청 수
+RATE_LIMIT = float(os.getenv("KIS_RATE_LIMIT", "18"))
+RATE_BURST = float(os.getenv("KIS_RATE_BURST", str(RATE_LIMIT)))
+MAX_QUEUE = int(os.getenv("KIS_QUEUE_MAX", "200"))
+
+# 우선순위 (낮을수록 먼저 처리)
+INTERACTIVE = 0
+BACKGROUND = 10
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+# 대기 시간 분포 구간 (초)
+WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("kis_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def background():
+    """이 블록 안에서 시작한 KIS 요청 (및 여기서 만든 task) 은 백그라운드 우선순위로 처리"""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+class SchedulerBusy(Exception):
+    """대기열이 가득 차서 요청을 받을 수 없을 때 발생"""
+
+    def __init__(self, queue_depth: int, retry_after: float):
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+        super().__init__(f"업스트림 요청 대기열이 가득 찼습니다. ({queue_depth}건 대기 중)")
+
+
+class _WaitStats:
+    def __init__(self):
+        self.granted = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def record(self, seconds: float):
+        self.granted += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(WAIT_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "granted": self.granted,
+            "wait_avg_ms": round(self.total / self.granted * 1000, 2) if self.granted else 0.0,
+            "wait_max_ms": round(self.max * 1000, 2),
+            "wait_histogram": {
+                **{f"le_{bound}": count for bound, count in zip(WAIT_BUCKETS, self.buckets)},
+                "le_inf": self.buckets[-1],
+            },
+        }
+
+
+class TokenBucketScheduler:
+    def __init__(self, rate: float, burst: float, max_queue: int):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.max_queue = max_queue
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._heap: list = []  # (우선순위, 순번, future, 대기 시작 시각)
+        self._seq = itertools.count()
+        self._dispatcher: asyncio.Task | None = None
+        self._waits: dict[int, _WaitStats] = {}
+        self.rejected = 0
+        self.throttled = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _record(self, priority: int, seconds: float):
+        self._waits.setdefault(priority, _WaitStats()).record(seconds)
+
+    async def acquire(self, priority: int | None = None):
+        """요청 1건 보낼 차례가 될 때까지 대기"""
+        if priority is None:
+            priority = current_priority()
+        self._refill()
+        # 대기 중인 요청이 없을 때만 바로 통과 (먼저 기다린 요청 추월 방지)
+        if not self._heap and self._tokens >= 1:
+            self._tokens -= 1
+            self._record(priority, 0.0)
+            return
+
+        if len(self._heap) >= self.max_queue:
+            self.rejected += 1
+            raise SchedulerBusy(len(self._heap), retry_after=len(self._heap) / self.rate)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (priority, next(self._seq), future, time.monotonic()))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 차례를 받은 직후 취소되었으면 토큰 반환
+            if future.done() and not future.cancelled():
+                self._tokens = min(self.burst, self._tokens + 1)
+            raise
+
+    async def _dispatch(self):
+        while self._heap:
+            self._refill()
+            while self._heap and self._tokens >= 1:
+                priority, _, future, enqueued_at = heapq.heappop(self._heap)
+                if future.done():  # 대기 중 취소된 요청
+                    continue
+                self._tokens -= 1
+                self._record(priority, time.monotonic() - enqueued_at)
+                future.set_result(None)
+            if self._heap:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def throttle(self):
+        """업스트림이 초당 요청 수 초과로 거절했을 때 호출 (남은 토큰을 비워서 속도를 늦춤)"""
+        self.throttled += 1
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    def stats(self) -> dict:
+        self._refill()
+        waiting: dict[str, int] = {}
+        for priority, _, future, _ in self._heap:
+            if not future.done():
+                name = PRIORITY_NAMES.get(priority, str(priority))
+                waiting[name] = waiting.get(name, 0) + 1
+        return {
+            "rate_limit": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": sum(waiting.values()),
+            "max_queue": self.max_queue,
+            "waiting": waiting,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "priorities": {
+                PRIORITY_NAMES.get(priority, str(priority)): stats.to_dict()
+                for priority, stats in sorted(self._waits.items())
+            },
+        }
+
+
+scheduler = TokenBucketScheduler(RATE_LIMIT, RATE_BURST, MAX_QUEUE)
@@ -0,0 +1,262 @@
+import os
+import json
+import time
+import uuid
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+# 워커 프로세스 간 공유 저장소 (uvicorn --workers N)
+# - 액세스 토큰 / 자주 조회하는 데이터(시세 등)를 모든 워커가 함께 사용
+# - 프로세스 간 락 (토큰 갱신처럼 한 워커만 실행해야 하는 작업)
+#   → 락에는 만료 시간(lease)이 있어서 보유한 워커가 죽어도 일정 시간 뒤 다른 워커가 획득
+# - 기본은 같은 호스트의 SQLite (WAL), SHARED_STORE_URL=redis://... 이면 Redis 호환 서버 사용
+# - 값은 JSON 직렬화 가능한 객체
+
+# 비어 있으면 SQLite (SHARED_STORE_PATH), redis:// / rediss:// 이면 Redis
+SHARED_STORE_URL = os.getenv("SHARED_STORE_URL", "")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SHARED_STORE_PATH = os.getenv(
+    "SHARED_STORE_PATH", os.path.join(BASE_DIR, "..", "data", "shared.sqlite3")
+)
+# Redis 등 여러 서비스가 함께 쓰는 저장소에서 키 충돌 방지
+KEY_PREFIX = os.getenv("SHARED_STORE_PREFIX", "stockchart:")
+# 락 획득 대기 시 확인 간격 (초)
+LOCK_POLL_INTERVAL = 0.05
+# 만료된 키 정리 주기 (set 호출 횟수)
+PURGE_EVERY = 256
+# SQLite: 다른 워커의 쓰기와 겹쳤을 때(SQLITE_BUSY) 재시도하는 최대 시간 (초)
+BUSY_TIMEOUT = float(os.getenv("SHARED_STORE_BUSY_TIMEOUT", "5"))
+
+
+class LockTimeout(Exception):
+    def __init__(self, name: str, timeout: float):
+        super().__init__(f"공유 락 대기 시간 초과: {name} ({timeout:g}초)")
+        self.name = name
+
+
+class SharedStore:
+    """공유 저장소 인터페이스 (구현체는 get / set / delete / _try_acquire / _release 제공)"""
+
+    async def get(self, key: str):
+        raise NotImplementedError
+
+    async def set(self, key: str, value, ttl: float | None = None):
+        """ttl (초) 이 지나면 없는 값으로 취급, None 이면 만료 없음"""
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+    async def _try_acquire(self, name: str, owner: str, lease: float) -> bool:
+        raise NotImplementedError
+
+    async def _release(self, name: str, owner: str):
+        raise NotImplementedError
+
+    @asynccontextmanager
+    async def lock(self, name: str, lease: float = 30.0, timeout: float = 35.0):
+        """
+        프로세스 간 배타 락 (timeout 안에 얻지 못하면 LockTimeout)
+        lease 는 보유 최대 시간 - 작업이 이보다 오래 걸리면 다른 워커가 락을 가져갈 수 있음
+        """
+        owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        deadline = time.monotonic() + timeout
+        while not await self._try_acquire(name, owner, lease):
+            if time.monotonic() >= deadline:
+                raise LockTimeout(name, timeout)
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            await self._release(name, owner)
+
+    async def close(self):
+        pass
+
+
+def _is_busy(e: sqlite3.OperationalError) -> bool:
+    return e.sqlite_errorcode in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+class SQLiteSharedStore(SharedStore):
+    """
+    같은 호스트의 워커끼리 SQLite 파일 (WAL) 로 공유
+    - busy timeout 0: 다른 워커가 쓰기 중이면 sqlite 안에서 기다리지 않고 바로 SQLITE_BUSY
+      → asyncio.sleep 후 재시도해서 대기 중에도 이벤트 루프(WebSocket, KIS 호출 등)가 멈추지 않음
+    """
+
+    def __init__(self, path: str = SHARED_STORE_PATH):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._sets = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # isolation_level=None: 트랜잭션은 락 획득 시에만 직접 BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.path, timeout=0, check_same_thread=False, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS kv (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        expires_at REAL
+                    ) WITHOUT ROWID;
+
+                    CREATE TABLE IF NOT EXISTS locks (
+                        name TEXT PRIMARY KEY,
+                        owner TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    ) WITHOUT ROWID;
+                    """
+                )
+            except BaseException:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn):
+        """fn(conn) 실행 - SQLITE_BUSY 면 LOCK_POLL_INTERVAL 만큼 쉬고 BUSY_TIMEOUT 까지 재시도"""
+        deadline = time.monotonic() + BUSY_TIMEOUT
+        while True:
+            try:
+                return fn(self._db())
+            except sqlite3.OperationalError as e:
+                if not _is_busy(e) or time.monotonic() >= deadline:
+                    raise
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+    async def get(self, key: str):
+        row = await self._run(
+            lambda conn: conn.execute(
+                "SELECT value, expires_at FROM kv WHERE key = ?", (KEY_PREFIX + key,)
+            ).fetchone()
+        )
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return None
+        return json.loads(row[0])
+
+    async def set(self, key: str, value, ttl: float | None = None):
+        now = time.time()
+        row = (KEY_PREFIX + key, json.dumps(value, ensure_ascii=False), now + ttl if ttl is not None else None)
+        await self._run(lambda conn: conn.execute("INSERT OR REPLACE INTO kv VALUES (?, ?, ?)", row))
+        self._sets += 1
+        if self._sets % PURGE_EVERY == 0:
+            try:
+                await self._run(lambda conn: conn.execute("DELETE FROM kv WHERE expires_at <= ?", (now,)))
+            except sqlite3.OperationalError as e:
+                # 정리는 다음 주기에 다시 시도
+                logger.warning("❌ 공유 저장소 만료 키 정리 실패: %s", e)
+
+    async def delete(self, key: str):
+        await self._run(lambda conn: conn.execute("DELETE FROM kv WHERE key = ?", (KEY_PREFIX + key,)))
+
+    async def _try_acquire(self, name: str, owner: str, lease: float) -> bool:
+        now = time.time()
+        try:
+            conn = self._db()
+            # 쓰기 락을 먼저 잡아서 만료 확인 ~ 등록 사이에 다른 프로세스가 끼어들지 못하게 함
+            # 다른 워커가 쓰기 중이면 실패로 보고 lock() 에서 asyncio.sleep 후 재시도
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            if _is_busy(e):
+                return False
+            raise
+        try:
+            conn.execute("DELETE FROM locks WHERE name = ? AND expires_at <= ?", (name, now))
+            acquired = conn.execute(
+                "INSERT OR IGNORE INTO locks VALUES (?, ?, ?)", (name, owner, now + lease)
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return acquired
+
+    async def _release(self, name: str, owner: str):
+        await self._run(
+            lambda conn: conn.execute("DELETE FROM locks WHERE name = ? AND owner = ?", (name, owner))
+        )
+
+    async def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# 락 보유자일 때만 삭제 (다른 워커가 lease 만료 후 가져간 락은 건드리지 않음)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisSharedStore(SharedStore):
+    """Redis 호환 서버 (여러 호스트의 워커가 함께 사용) - redis 패키지가 필요"""
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError("SHARED_STORE_URL 로 Redis 를 사용하려면 redis 패키지가 필요합니다. (pip install redis)") from e
+        self._redis = aioredis.from_url(url)
+
+    async def get(self, key: str):
+        raw = await self._redis.get(KEY_PREFIX + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value, ttl: float | None = None):
+        px = max(1, int(ttl * 1000)) if ttl is not None else None
+        await self._redis.set(KEY_PREFIX + key, json.dumps(value, ensure_ascii=False), px=px)
+
+    async def delete(self, key: str):
+        await self._redis.delete(KEY_PREFIX + key)
+
+    async def _try_acquire(self, name: str, owner: str, lease: float) -> bool:
+        return bool(
+            await self._redis.set(f"{KEY_PREFIX}lock:{name}", owner, nx=True, px=max(1, int(lease * 1000)))
+        )
+
+    async def _release(self, name: str, owner: str):
+        await self._redis.eval(_RELEASE_SCRIPT, 1, f"{KEY_PREFIX}lock:{name}", owner)
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+_store: SharedStore | None = None
+
+
+def create_store(url: str = SHARED_STORE_URL) -> SharedStore:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisSharedStore(url)
+    if url.startswith("sqlite:///"):
+        return SQLiteSharedStore(url.removeprefix("sqlite:///"))
+    if url:
+        raise ValueError(f"지원하지 않는 SHARED_STORE_URL: {url}")
+    return SQLiteSharedStore()
+
+
+def get_store() -> SharedStore:
+    global _store
+    if _store is None:
+        _store = create_store()
+        logger.info("🗄️ 공유 저장소: %s", type(_store).__name__)
+    return _store
+
+
+async def close_store():
+    global _store
+    if _store is not None:
+        await _store.close()
+        _store = None
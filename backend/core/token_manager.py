@@ -1,59 +1,106 @@
 import os
 import json
 import time
-import requests
+import asyncio
 from dotenv import load_dotenv
+from . import kis_client
+from .log import get_logger
+from .metrics import token_refreshes
+from .shared_store import get_store
 
 load_dotenv()
 
 # 토큰 발급 + 캐싱
+# - 토큰은 워커 프로세스 간 공유 저장소(core/shared_store)에 저장하고, 각 워커는 메모리에서 제공
+# - 만료 전에 백그라운드에서 미리 갱신
+# - 같은 워커의 동시 요청은 진행 중인 단일 갱신을 함께 기다리고 (single-flight),
+#   워커 간에는 공유 락으로 한 워커만 발급 → 나머지는 공유 저장소의 새 토큰을 사용
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-TOKEN_CACHE_FILE = os.path.join(BASE_DIR, "token_cache.json")
+# 이전 버전의 토큰 파일 (공유 저장소가 비어 있을 때 한 번 가져옴)
+# 부하 테스트 등에서 실제 토큰 캐시를 읽지 않도록 경로 변경 가능
+TOKEN_CACHE_FILE = os.getenv("KIS_TOKEN_CACHE_FILE", os.path.join(BASE_DIR, "token_cache.json"))
+TOKEN_KEY = "kis:access_token"
+REFRESH_LOCK = "kis_token_refresh"
 
+# 만료 몇 초 전에 미리 갱신할지
+REFRESH_MARGIN = int(os.getenv("TOKEN_REFRESH_MARGIN", "600"))
+# 갱신 실패 시 재시도 간격
+RETRY_INTERVAL = 30
+# 다른 워커의 토큰 발급을 기다리는 최대 시간 (초)
+REFRESH_LOCK_TIMEOUT = float(os.getenv("TOKEN_REFRESH_LOCK_TIMEOUT", "35"))
 
-# ✅ 캐시된 토큰 로드
-def load_cached_token():
-    if not os.path.exists(TOKEN_CACHE_FILE):
-        return None
+_token = {"access_token": None, "expires_at": 0.0}
+_refresh_lock = asyncio.Lock()
+_refresher_task: asyncio.Task | None = None
+logger = get_logger(__name__)
 
-    with open(TOKEN_CACHE_FILE, "r") as f:
-        data = json.load(f)
 
-        # ✅ 강제 형변환 추가 (에러 방지용)
-        try:
-            expires_at = float(data.get("expires_at", 0))
-        except ValueError:
-            print("❌ 캐시된 expires_at 형식이 잘못됨")
-            return None
+def _is_valid() -> bool:
+    return _token["access_token"] is not None and time.time() < _token["expires_at"]
 
-        if time.time() < expires_at:
-            print("✅ 캐시된 토큰 사용")
-            return data["access_token"]
-        else:
-            print("⏰ 토큰 만료됨")
 
-    return None
+def _use(data: dict) -> bool:
+    """저장된 토큰이 아직 유효하면 메모리에 반영"""
+    try:
+        access_token = data["access_token"]
+        # ✅ 강제 형변환 추가 (에러 방지용)
+        expires_at = float(data.get("expires_at", 0))
+    except (KeyError, TypeError, ValueError):
+        logger.warning("❌ 저장된 토큰 형식이 잘못됨")
+        return False
+    if time.time() >= expires_at:
+        return False
+    _token["access_token"] = access_token
+    _token["expires_at"] = expires_at
+    return True
+
+
+def _read_legacy_file() -> dict | None:
+    if not os.path.exists(TOKEN_CACHE_FILE):
+        return None
+    try:
+        with open(TOKEN_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (ValueError, OSError):
+        logger.warning("❌ 캐시된 토큰 파일 형식이 잘못됨")
+        return None
 
 
-# ✅ 토큰 저장
-def save_token_to_cache(access_token: str, expires_in: int):
-    expires_at = time.time() + expires_in - 60  # 유효시간 1분 여유
-    with open(TOKEN_CACHE_FILE, "w") as f:
-        json.dump(
-            {"access_token": access_token, "expires_at": expires_at},  # float으로 저장
-            f,
-        )
+# ✅ 공유 저장소의 토큰 로드 (다른 워커가 발급한 토큰 포함)
+async def load_cached_token():
+    store = get_store()
+    data = await store.get(TOKEN_KEY)
+    if data is None:
+        # 공유 저장소 도입 전 토큰 파일이 남아 있으면 옮겨서 재사용
+        data = _read_legacy_file()
+        if data is not None and _use(data):
+            await store.set(TOKEN_KEY, data, ttl=_token["expires_at"] - time.time())
+            logger.info("✅ 토큰 파일을 공유 저장소로 이전")
+            return _token["access_token"]
+        return None
 
+    if _use(data):
+        return _token["access_token"]
+    logger.info("⏰ 토큰 만료됨")
+    return None
 
-# ✅ 토큰 발급
-def get_access_token():
-    cached = load_cached_token()
-    if cached:
-        return cached
 
-    print("🔐 토큰 발급 요청 중...")
-    url = f"{os.getenv('BASE_URL')}/oauth2/token"
+# ✅ 토큰 저장 (메모리 + 공유 저장소, 만료 시각이 지나면 저장소에서도 사라짐)
+async def save_token_to_cache(access_token: str, expires_in: int):
+    expires_at = time.time() + expires_in - 60  # 유효시간 1분 여유
+    _token["access_token"] = access_token
+    _token["expires_at"] = expires_at
+    await get_store().set(
+        TOKEN_KEY,
+        {"access_token": access_token, "expires_at": expires_at},  # float으로 저장
+        ttl=max(expires_at - time.time(), 1),
+    )
+
+
+# ✅ 토큰 발급 요청
+async def issue_token() -> str:
+    logger.info("🔐 토큰 발급 요청 중...")
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
     data = {
         "grant_type": "client_credentials",
@@ -61,16 +108,100 @@ def get_access_token():
         "appsecret": os.getenv("APP_SECRET"),
     }
 
-    res = requests.post(url, headers=headers, data=data)
-    res_json = res.json()
-
-    print("🔐 토큰 발급 응답:", res_json)
+    try:
+        res = await kis_client.get_client().post("/oauth2/token", headers=headers, data=data)
+        res_json = res.json()
+    except Exception:
+        token_refreshes.inc("failure")
+        raise
 
     if "access_token" not in res_json:
+        token_refreshes.inc("failure")
         raise Exception(f"토큰 발급 실패: {res_json}")
 
     access_token = res_json["access_token"]
     expires_in = int(res_json.get("expires_in", 3600))
 
-    save_token_to_cache(access_token, expires_in)
+    await save_token_to_cache(access_token, expires_in)
+    token_refreshes.inc("success")
+    logger.info("🔐 토큰 발급 완료")
     return access_token
+
+
+# ✅ 실시간(웹소켓) 접속키 발급
+async def issue_approval_key() -> str:
+    data = {
+        "grant_type": "client_credentials",
+        "appkey": os.getenv("APP_KEY"),
+        "secretkey": os.getenv("APP_SECRET"),
+    }
+    res = await kis_client.get_client().post("/oauth2/Approval", json=data)
+    res_json = res.json()
+
+    if "approval_key" not in res_json:
+        raise Exception(f"웹소켓 접속키 발급 실패: {res_json}")
+    return res_json["approval_key"]
+
+
+def _usable(force: bool) -> bool:
+    # force (사전 갱신) 일 때는 만료까지 REFRESH_MARGIN 보다 많이 남아야 그대로 사용
+    return _is_valid() and (not force or _token["expires_at"] - time.time() > REFRESH_MARGIN)
+
+
+# ✅ 토큰 갱신 (워커 내 single-flight + 워커 간 공유 락)
+async def refresh_token(force: bool = False) -> str:
+    async with _refresh_lock:
+        # 락을 기다리는 동안 다른 요청 / 다른 워커가 이미 갱신했다면 그 결과를 사용
+        if _usable(force):
+            return _token["access_token"]
+        await load_cached_token()
+        if _usable(force):
+            return _token["access_token"]
+
+        async with get_store().lock(REFRESH_LOCK, timeout=REFRESH_LOCK_TIMEOUT):
+            # 공유 락을 기다리는 동안 다른 워커가 발급했을 수 있음
+            await load_cached_token()
+            if _usable(force):
+                return _token["access_token"]
+            return await issue_token()
+
+
+# ✅ 토큰 조회 (메모리에서 바로 반환, 만료 시에만 갱신 대기)
+async def get_access_token() -> str:
+    if _is_valid():
+        return _token["access_token"]
+    return await refresh_token()
+
+
+# ✅ 만료 전 미리 갱신하는 백그라운드 루프 (시작 시 공유 저장소의 토큰부터 로드)
+async def _refresh_loop():
+    try:
+        await load_cached_token()
+    except Exception as e:
+        logger.error("❌ 저장된 토큰 로드 실패: %s", e)
+    while True:
+        wait = _token["expires_at"] - REFRESH_MARGIN - time.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            await refresh_token(force=True)
+        except Exception as e:
+            logger.error("❌ 토큰 사전 갱신 실패: %s", e)
+            await asyncio.sleep(RETRY_INTERVAL)
+
+
+def start_token_refresher():
+    global _refresher_task
+    if _refresher_task is None or _refresher_task.done():
+        _refresher_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_token_refresher():
+    global _refresher_task
+    if _refresher_task is not None:
+        _refresher_task.cancel()
+        try:
+            await _refresher_task
+        except asyncio.CancelledError:
+            pass
+        _refresher_task = None
@@ -1,7 +1,36 @@
-from fastapi import FastAPI, HTTPException
+import math
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from .core.kis_client import close_client
+from .core.token_manager import start_token_refresher, stop_token_refresher
+from .core.db import close_connection
+from .core.shared_store import close_store
+from .core.scheduler import SchedulerBusy
+from .core.circuit_breaker import UpstreamError
+from .core.cache import StaleMarkerMiddleware
+from .core.http_cache import ResponseCache, market_max_age, encode_json
+from .core.log import configure_logging
+from .core.metrics import MetricsMiddleware, start_loop_monitor, stop_loop_monitor
+from .core.profiling import ProfilingMiddleware, TimedJSONResponse
+from .services.candle_store import stop_backfills
+from .services.screener_service import start_screener, stop_screener
+from .services.quote_hub import stop_quote_hub
+from .services.ratio_store import stop_ratio_tasks
+from .services.prefetch_service import start_prefetcher, stop_prefetcher
 
-from .services.chart_service import get_chart_data
+from .services.chart_service import get_chart_columns, chart_version, format_bars, validate_timeframe
+from .services.chart_format import (
+    negotiate_format,
+    encode_columns,
+    encode_msgpack,
+    COLUMNS_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+)
+from .services.indicators import parse_indicators
 from .utils.stock_lookup import find_symbol
 from .routes import stock_list_route  # 👉 종목 리스트 라우트
 from .routes import stock_summary_route # 주식 최소 정보카드
@@ -9,9 +38,47 @@ from .routes import financial_route # 주식 재무제표 기준 리스크 분
 from .routes import profitability_route # 주식 재무제표 기준 리스크 분석(수익성 비율 -> 가중치 계산 포함)
 from .routes import volatility_route # 주식 재무제표 기준 리스크 분석(변동성 비율 -> 가중치 계산 포함)
 from .routes import supply_route # 주식 재무제표 기준 리스크 분석(외국인 매매 동향(수급) -> 가중치 계산 포함)
+from .routes import dashboard_route # 종목 대시보드 (요약 + 차트 + 리스크 점수 통합 조회)
+from .routes import cache_route # 캐시 통계
+from .routes import screener_route # 전 종목 리스크 스크리너
+from .routes import scheduler_route # KIS 요청 스케줄러 상태
+from .routes import quote_ws_route # 실시간 체결가 웹소켓
+from .routes import intraday_route # 실시간 분봉 차트
+from .routes import ratio_history_route # 결산 기간별 재무비율 점수 이력
+from .routes import prefetch_route # 인기 종목 미리 조회
+from .routes import batch_route # 여러 종목 차트 / 시세 한 번에 조회
+from .routes import metrics_route # Prometheus 메트릭
+from .routes import profiling_route # 요청 프로파일링 결과 (cProfile)
+
+configure_logging()
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ✅ 이벤트 루프 지연 측정 시작
+    start_loop_monitor()
+    # ✅ 시작 시 캐시된 토큰 로드 + 만료 전 자동 갱신 시작
+    start_token_refresher()
+    # ✅ 스크리너 자동 실행 (SCREENER_AUTOSTART=1)
+    start_screener()
+    # ✅ 인기 종목 미리 조회 (시작 시 / 정규장 시작 / 주기 실행)
+    start_prefetcher()
+    yield
+    # ✅ 종료 시 백그라운드 작업 중지 및 커넥션 정리
+    await stop_quote_hub()
+    await stop_prefetcher()
+    await stop_screener()
+    await stop_ratio_tasks()
+    await stop_backfills()
+    await stop_token_refresher()
+    await close_client()
+    close_connection()
+    await close_store()
+    await stop_loop_monitor()
+
+
+# 기본 JSON 응답은 직렬화 시간을 프로파일링 구간(encode)으로 기록
+app = FastAPI(lifespan=lifespan, default_response_class=TimedJSONResponse)
 
 # ✅ CORS 설정 (Vite 프론트엔드 허용)
 app.add_middleware(
@@ -20,7 +87,14 @@ app.add_middleware(
     allow_credentials=True, 
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Total-Count", "Server-Timing", "X-Profile-Dump", "X-Data-Stale", "Warning"],
 )
+# ✅ 라우트별 응답 시간 / 상태 코드 기록 (/metrics)
+app.add_middleware(MetricsMiddleware)
+# ✅ 업스트림 장애로 만료된 캐시 값으로 응답하면 X-Data-Stale / Warning 헤더 추가
+app.add_middleware(StaleMarkerMiddleware)
+# ✅ 요청 단위 프로파일링 (X-Profile 헤더 또는 PROFILE_SAMPLE_RATE, Server-Timing 헤더로 반환)
+app.add_middleware(ProfilingMiddleware)
 
 # ✅ 종목 리스트 라우트 등록 (/stocks)
 app.include_router(stock_list_route.router)
@@ -29,15 +103,90 @@ app.include_router(stock_summary_route.router)
 app.include_router(profitability_route.router)
 app.include_router(volatility_route.router)
 app.include_router(supply_route.router)
+app.include_router(dashboard_route.router)
+app.include_router(cache_route.router)
+app.include_router(screener_route.router)
+app.include_router(scheduler_route.router)
+app.include_router(quote_ws_route.router)
+app.include_router(ratio_history_route.router)
+app.include_router(prefetch_route.router)
+app.include_router(metrics_route.router)
+app.include_router(profiling_route.router)
+app.include_router(batch_route.router)  # /chart/batch 는 /chart/{timeframe} 보다 먼저
+app.include_router(intraday_route.router)  # /chart/minute 은 /chart/{timeframe} 보다 먼저
+
+
+# ✅ KIS 요청 대기열이 가득 차면 503 (Retry-After 포함)
+@app.exception_handler(SchedulerBusy)
+async def scheduler_busy_handler(request: Request, exc: SchedulerBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
+
+
+# ✅ 업스트림 장애 (서킷 브레이커 열림 503 / 응답 지연 504 / 서버 오류 503) 는 구조화된 JSON 으로 응답
+@app.exception_handler(UpstreamError)
+async def upstream_error_handler(request: Request, exc: UpstreamError):
+    headers = {}
+    if exc.retry_after is not None:
+        headers["Retry-After"] = str(max(1, math.ceil(exc.retry_after)))
+    return JSONResponse(status_code=exc.status_code, content=exc.to_dict(), headers=headers)
+
+
+# 차트 응답 (버전: 저장된 일봉 구간 + 마지막 동기화 시각 + 장중 형성 중인 봉)
+_chart_responses = ResponseCache("response_chart", market_max_age)
+_chart_encoders = {
+    "rows": (lambda chart: encode_json(format_bars(*chart)), "application/json"),
+    "columns": (lambda chart: encode_columns(*chart), COLUMNS_MEDIA_TYPE),
+    "msgpack": (lambda chart: encode_msgpack(*chart), MSGPACK_MEDIA_TYPE),
+}
+
 
 # ✅ 차트 데이터 API
 @app.get("/chart/{timeframe}")
-def fetch_chart(query: str, timeframe: str = "daily"):
+async def fetch_chart(
+    request: Request,
+    query: str,
+    timeframe: str = "daily",
+    limit: int | None = Query(None, ge=1, le=10000, description="최근 봉 개수 (일봉 기본 65)"),
+    indicators: str | None = Query(
+        None, description="기술적 지표 (ex. sma20,ema60,bb,rsi,macd / sma·ema 만 쓰면 5,20,60,120 전체)"
+    ),
+    fmt: str | None = Query(
+        None, alias="format", description="응답 형식 (rows / columns / msgpack, 생략 시 Accept 헤더)"
+    ),
+):
     """
     회사명 또는 종목코드를 받아서 차트 데이터 반환
     ex) /chart/daily?query=삼성전자 or /chart/weekly?query=005930
+    timeframe: daily / weekly / monthly / quarterly / yearly
+    일봉은 로컬 저장소에서 제공하고, 나머지 단위는 일봉에서 계산 (limit 으로 조회 개수 지정)
+    indicators 를 지정하면 각 봉에 지표 값이 함께 담김 (계산 전 구간은 null)
+    format=columns 는 컬럼 단위 JSON, format=msgpack (또는 Accept: application/x-msgpack) 은 바이너리
+    원본 일봉이 바뀌지 않았으면 리샘플 / 지표 계산 없이 이전 응답 바이트 재사용 (If-None-Match 일치 시 304)
     """
+    try:
+        validate_timeframe(timeframe)
+        names = parse_indicators(indicators)
+        fmt = negotiate_format(fmt, request.headers.get("accept"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     symbol = find_symbol(query)
     if not symbol:
         raise HTTPException(status_code=404, detail="해당 종목을 찾을 수 없습니다.")
-    return get_chart_data(symbol, timeframe)
+
+    version, last_modified = await chart_version(symbol)
+    encode, media_type = _chart_encoders[fmt]
+    return await _chart_responses.respond(
+        request,
+        (symbol, timeframe, limit, names, fmt),
+        version,
+        lambda: get_chart_columns(symbol, timeframe, limit, names, sync=False),
+        last_modified=last_modified,
+        media_type=media_type,
+        encode=encode,
+        vary="Accept",
+    )
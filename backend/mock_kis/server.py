@@ -0,0 +1,289 @@
+"""
+한국투자증권 API 로컬 대역 서버 (부하 테스트 / 개발용)
+
+    python -m backend.mock_kis.server [--port 8100] [--latency 0.05] [--jitter 0.02]
+                                      [--error-rate 0.01] [--rate-limit 20] [--fixtures DIR]
+
+백엔드는 BASE_URL=http://127.0.0.1:8100 으로 실행하면 실제 KIS 대신 이 서버를 호출
+- 지원 경로: oauth2/token, oauth2/Approval, inquire-price, inquire-daily-price,
+  inquire-daily-itemchartprice, stability-ratio, profit-ratio
+- 응답: --fixtures 디렉터리의 녹화 응답 ({TR_ID}/{종목코드}.json → {TR_ID}.json 순으로 탐색),
+  없으면 종목코드로 시드를 고정한 합성 데이터 (같은 종목 · 날짜는 항상 같은 값)
+- 응답 지연 (latency ± jitter), 오류 비율 (HTTP 500 + rt_cd=1), 초당 요청 수 제한 (EGW00201) 설정 가능
+- GET /mock/stats : TR_ID 별 요청 / 오류 / 제한 횟수
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import argparse
+import hashlib
+from collections import deque
+from datetime import date, datetime, timedelta
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+THROTTLE_MSG_CD = "EGW00201"
+# 합성 일봉의 첫 거래일 (backfill 이 여기서 끝남)
+LISTING_DATE = date(2015, 1, 2)
+ROWS_PER_PAGE = 100
+
+
+class MockConfig:
+    def __init__(
+        self,
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        error_rate: float = 0.0,
+        rate_limit: float = 0.0,
+        fixtures: str | None = None,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit  # 초당 허용 요청 수 (0 이면 제한 없음)
+        self.fixtures = fixtures
+        self.random = random.Random(seed)
+
+    @classmethod
+    def from_env(cls) -> "MockConfig":
+        return cls(
+            latency=float(os.getenv("MOCK_KIS_LATENCY", "0.05")),
+            jitter=float(os.getenv("MOCK_KIS_JITTER", "0.02")),
+            error_rate=float(os.getenv("MOCK_KIS_ERROR_RATE", "0")),
+            rate_limit=float(os.getenv("MOCK_KIS_RATE_LIMIT", "0")),
+            fixtures=os.getenv("MOCK_KIS_FIXTURES") or None,
+        )
+
+
+# ✅ 합성 데이터 (종목코드 / 날짜로 시드 고정)
+def _seed(*parts) -> int:
+    return int.from_bytes(hashlib.md5("|".join(map(str, parts)).encode()).digest()[:8], "little")
+
+
+def _base_price(symbol: str) -> int:
+    return random.Random(_seed(symbol)).randint(20, 2000) * 100
+
+
+def _candle(symbol: str, day: date) -> dict:
+    rng = random.Random(_seed(symbol, day.isoformat()))
+    # 상장일부터 천천히 오르내리는 추세 + 일별 변동
+    trend = 1 + 0.3 * ((day - LISTING_DATE).days % 730 - 365) / 365
+    close = max(100, round(_base_price(symbol) * trend * (1 + rng.gauss(0, 0.02))))
+    open_ = max(100, round(close * (1 + rng.gauss(0, 0.01))))
+    high = max(open_, close) + rng.randint(0, close // 50 + 1)
+    low = max(1, min(open_, close) - rng.randint(0, close // 50 + 1))
+    return {
+        "stck_bsop_date": day.strftime("%Y%m%d"),
+        "stck_oprc": str(open_),
+        "stck_hgpr": str(high),
+        "stck_lwpr": str(low),
+        "stck_clpr": str(close),
+        "acml_vol": str(rng.randint(1, 500) * 1000),
+    }
+
+
+def _trading_days_desc(start: date, end: date, limit: int):
+    day = end
+    while day >= max(start, LISTING_DATE) and limit > 0:
+        if day.weekday() < 5:
+            yield day
+            limit -= 1
+        day -= timedelta(days=1)
+
+
+def synth_price(symbol: str) -> dict:
+    today = date.today()
+    candle = _candle(symbol, today)
+    prev = _candle(symbol, today - timedelta(days=1))
+    rng = random.Random(_seed(symbol, "quote", int(time.time() // 5)))
+    price = int(candle["stck_clpr"])
+    prev_close = int(prev["stck_clpr"])
+    return {
+        "stck_prpr": str(price),
+        "prdy_vrss": str(price - prev_close),
+        "prdy_ctrt": f"{(price - prev_close) / prev_close * 100:.2f}",
+        "stck_oprc": candle["stck_oprc"],
+        "stck_hgpr": candle["stck_hgpr"],
+        "stck_lwpr": candle["stck_lwpr"],
+        "stck_sdpr": str(prev_close),
+        "acml_vol": candle["acml_vol"],
+        "acml_tr_pbmn": str(int(candle["acml_vol"]) * price),
+        "hts_frgn_ehrt": f"{rng.uniform(0, 60):.2f}",
+        "frgn_ntby_qty": str(rng.randint(-500000, 500000)),
+        "pgtr_ntby_qty": str(rng.randint(-300000, 300000)),
+        "vol_tnrt": f"{rng.uniform(0, 8):.2f}",
+        "prdy_vrss_vol_rate": f"{rng.uniform(20, 400):.2f}",
+        "w52_hgpr_vrss_prpr_ctrt": f"{rng.uniform(-60, 0):.2f}",
+    }
+
+
+def synth_daily_price(symbol: str) -> list:
+    return [_candle(symbol, day) for day in _trading_days_desc(LISTING_DATE, date.today(), 30)]
+
+
+def synth_itemchart(symbol: str, start: str, end: str) -> list:
+    start_day = datetime.strptime(start, "%Y%m%d").date()
+    end_day = min(datetime.strptime(end, "%Y%m%d").date(), date.today())
+    return [_candle(symbol, day) for day in _trading_days_desc(start_day, end_day, ROWS_PER_PAGE)]
+
+
+def _periods(symbol: str, kind: str, fields: dict) -> list:
+    """최근 8개 분기 결산 (fields: 필드 → (최소, 최대))"""
+    out = []
+    today = date.today()
+    year, quarter = today.year, (today.month - 1) // 3  # 직전 분기
+    for _ in range(8):
+        if quarter == 0:
+            year, quarter = year - 1, 4
+        rng = random.Random(_seed(symbol, kind, year, quarter))
+        row = {"stac_yymm": f"{year}{quarter * 3:02d}"}
+        row.update({field: f"{rng.uniform(low, high):.2f}" for field, (low, high) in fields.items()})
+        out.append(row)
+        quarter -= 1
+    return out
+
+
+def synth_stability(symbol: str) -> list:
+    return _periods(
+        symbol,
+        "stability",
+        {"lblt_rate": (10, 400), "bram_depn": (20, 300), "crnt_rate": (50, 400), "quck_rate": (30, 300)},
+    )
+
+
+def synth_profitability(symbol: str) -> list:
+    return _periods(
+        symbol,
+        "profitability",
+        {
+            "self_cptl_ntin_inrt": (-10, 30),
+            "tot_assets_ntin_rate": (-5, 15),
+            "sale_totl_rate": (-10, 30),
+            "sale_ntin_rate": (-10, 25),
+        },
+    )
+
+
+# ✅ 앱
+def create_app(config: MockConfig | None = None) -> FastAPI:
+    config = config or MockConfig.from_env()
+    app = FastAPI(title="KIS mock")
+    stats: dict[str, dict] = {}
+    window: deque = deque()  # 최근 1초 요청 시각
+
+    def record(tr_id: str, field: str):
+        entry = stats.setdefault(tr_id, {"requests": 0, "errors": 0, "throttled": 0})
+        entry[field] += 1
+
+    def fixture(tr_id: str, symbol: str) -> dict | None:
+        if not config.fixtures:
+            return None
+        for path in (
+            os.path.join(config.fixtures, tr_id, f"{symbol}.json"),
+            os.path.join(config.fixtures, f"{tr_id}.json"),
+        ):
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    return json.load(f)
+        return None
+
+    async def respond(request: Request, build):
+        tr_id = request.headers.get("tr_id", "unknown")
+        record(tr_id, "requests")
+
+        # 초당 요청 수 제한 (앱키 전체 기준)
+        if config.rate_limit:
+            now = time.monotonic()
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= config.rate_limit:
+                record(tr_id, "throttled")
+                return JSONResponse(
+                    status_code=500,
+                    content={"rt_cd": "1", "msg_cd": THROTTLE_MSG_CD, "msg1": "초당 거래건수를 초과하였습니다."},
+                )
+            window.append(now)
+
+        delay = config.latency + config.random.uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if config.random.random() < config.error_rate:
+            record(tr_id, "errors")
+            return JSONResponse(
+                status_code=500, content={"rt_cd": "1", "msg_cd": "MOCK500", "msg1": "모의 서버 오류"}
+            )
+
+        symbol = request.query_params.get("fid_input_iscd", "")
+        recorded = fixture(tr_id, symbol)
+        if recorded is not None:
+            return recorded
+        return {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", **build(request, symbol)}
+
+    @app.post("/oauth2/token")
+    async def issue_token():
+        return {"access_token": "mock-access-token", "token_type": "Bearer", "expires_in": 86400}
+
+    @app.post("/oauth2/Approval")
+    async def issue_approval_key():
+        return {"approval_key": "mock-approval-key"}
+
+    @app.get("/uapi/domestic-stock/v1/quotations/inquire-price")
+    async def inquire_price(request: Request):
+        return await respond(request, lambda r, s: {"output": synth_price(s)})
+
+    @app.get("/uapi/domestic-stock/v1/quotations/inquire-daily-price")
+    async def inquire_daily_price(request: Request):
+        return await respond(request, lambda r, s: {"output": synth_daily_price(s)})
+
+    @app.get("/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice")
+    async def inquire_itemchart(request: Request):
+        def build(r, s):
+            today = date.today().strftime("%Y%m%d")
+            start = r.query_params.get("fid_input_date_1") or LISTING_DATE.strftime("%Y%m%d")
+            end = r.query_params.get("fid_input_date_2") or today
+            return {"output1": {}, "output2": synth_itemchart(s, start, end)}
+
+        return await respond(request, build)
+
+    @app.get("/uapi/domestic-stock/v1/finance/stability-ratio")
+    async def stability_ratio(request: Request):
+        return await respond(request, lambda r, s: {"output": synth_stability(s)})
+
+    @app.get("/uapi/domestic-stock/v1/finance/profit-ratio")
+    async def profit_ratio(request: Request):
+        return await respond(request, lambda r, s: {"output": synth_profitability(s)})
+
+    @app.get("/mock/stats")
+    async def mock_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    env = MockConfig.from_env()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", type=float, default=env.latency, help="평균 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=env.jitter, help="지연 ± 범위 (초)")
+    parser.add_argument("--error-rate", type=float, default=env.error_rate, help="오류 응답 비율 (0 ~ 1)")
+    parser.add_argument("--rate-limit", type=float, default=env.rate_limit, help="초당 허용 요청 수 (0: 제한 없음)")
+    parser.add_argument("--fixtures", default=env.fixtures, help="녹화 응답 디렉터리")
+    parser.add_argument("--seed", type=int, default=None, help="지연 / 오류 난수 시드")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.rate_limit, args.fixtures, args.seed)
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Query, HTTPException
+from ..utils.stock_lookup import find_symbols
+from ..services.batch_service import parse_queries, get_summary_batch, get_chart_batch
+from ..services.chart_service import validate_timeframe
+from ..services.indicators import parse_indicators
+
+router = APIRouter()
+
+
+@router.get("/stock/summary/batch")
+async def stock_summary_batch(
+    query: str = Query(..., description="쉼표로 구분된 회사명 또는 종목코드 (ex. 삼성전자,000660)"),
+):
+    """
+    여러 종목의 시세 요약을 한 번에 반환합니다. (검색어 순서대로 results, 실패한 종목은 errors)
+    """
+    try:
+        queries = parse_queries(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await get_summary_batch(find_symbols(queries))
+
+
+# ✅ 여러 종목 차트 (/chart/{timeframe} 보다 먼저 등록해야 함)
+@router.get("/chart/batch")
+async def fetch_chart_batch(
+    query: str = Query(..., description="쉼표로 구분된 회사명 또는 종목코드 (ex. 삼성전자,000660)"),
+    timeframe: str = Query("daily", description="차트 단위 (daily/weekly/monthly/quarterly/yearly)"),
+    limit: int | None = Query(None, ge=1, le=10000, description="종목별 최근 봉 개수 (일봉 기본 65)"),
+    indicators: str | None = Query(None, description="기술적 지표 (ex. sma20,rsi)"),
+):
+    """
+    여러 종목의 차트 데이터를 한 번에 반환합니다. (종목별 형식은 /chart/{timeframe} 의 rows 형식과 동일)
+    """
+    try:
+        validate_timeframe(timeframe)
+        queries = parse_queries(query)
+        names = parse_indicators(indicators)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await get_chart_batch(find_symbols(queries), timeframe, limit, names)
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from ..core.cache import cache_stats
+
+router = APIRouter()
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    캐시별 크기, 히트/미스/병합 횟수 및 히트율을 반환합니다.
+    """
+    return cache_stats()
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Query, HTTPException
+from ..utils.stock_lookup import find_symbol
+from ..services.dashboard_service import get_dashboard
+from ..services.chart_service import validate_timeframe
+from ..services.indicators import parse_indicators
+
+router = APIRouter()
+
+
+@router.get("/stock/dashboard")
+async def stock_dashboard(
+    query: str = Query(..., description="회사명 또는 종목코드"),
+    timeframe: str = Query("daily", description="차트 단위 (daily/weekly/monthly/quarterly/yearly)"),
+    indicators: str | None = Query(None, description="차트 기술적 지표 (ex. sma5,rsi)"),
+):
+    """
+    종목 요약, 차트, 리스크 점수(안정성/수익성/변동성/수급)를 한 번에 반환합니다.
+    일부 섹션 조회에 실패하면 해당 섹션은 null 이고 errors 에 사유가 담깁니다.
+    """
+    try:
+        validate_timeframe(timeframe)
+        names = parse_indicators(indicators)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    symbol = find_symbol(query)
+    if not symbol:
+        raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
+
+    return await get_dashboard(symbol, timeframe, names)
@@ -1,28 +1,50 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 from ..utils.stock_lookup import find_symbol
-from ..services.financial_service import get_financial_ratios
+from ..services.financial_service import fetch_stability_output, build_financial_ratios
+from ..services.ratio_store import checked_at
+from ..core.scheduler import SchedulerBusy
+from ..core.circuit_breaker import UpstreamError
+from ..core.http_cache import ResponseCache, RATIO_MAX_AGE
 
 router = APIRouter()
 
+# 버전: 최근 결산 기간 (stac_yymm) + 마지막 KIS 확인 시각
+_responses = ResponseCache("response_financial", RATIO_MAX_AGE)
+
+
+def _financial_body(symbol: str, latest: dict) -> dict:
+    result = build_financial_ratios(symbol, latest)
+    return {
+        "symbol": result["symbol"],
+        "report_date": result["report_date"],
+        "stability_score": result["stability_score"],
+        "risk_level": result["risk_level"],
+        "raw_data": result["raw_data"],
+        "score_details": result["score_details"],
+    }
+
 
 @router.get("/stock/financial")
-def stock_financial(query: str = Query(..., description="회사명 또는 종목코드")):
+async def stock_financial(request: Request, query: str = Query(..., description="회사명 또는 종목코드")):
     """
     종목의 재무 안정성 점수 및 리스크 수준을 반환합니다.
+    ETag / Last-Modified 가 일치하면 304
     """
     symbol = find_symbol(query)
     if not symbol:
         raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
 
     try:
-        result = get_financial_ratios(symbol)
-        return {
-            "symbol": result["symbol"],
-            "report_date": result["report_date"],
-            "stability_score": result["stability_score"],
-            "risk_level": result["risk_level"],
-            "raw_data": result["raw_data"],
-            "score_details": result["score_details"],
-        }
+        latest = await fetch_stability_output(symbol)
+        checked = checked_at(symbol, "stability")
+        return await _responses.respond(
+            request,
+            symbol,
+            (latest.get("stac_yymm"), checked),
+            lambda: _financial_body(symbol, latest),
+            last_modified=checked,
+        )
+    except (SchedulerBusy, UpstreamError):
+        raise  # 503 / 504 응답은 main 의 예외 핸들러에서 처리
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
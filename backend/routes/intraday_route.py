@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Query, HTTPException
+from ..utils.stock_lookup import find_symbol
+from ..services.quote_feed import FeedLimitError
+from ..services.quote_hub import get_hub
+from ..services.intraday_bars import INTERVALS, get_bars, format_minute_bars
+
+router = APIRouter()
+
+
+# ✅ 분봉 차트 (/chart/{timeframe} 보다 먼저 등록해야 함)
+@router.get("/chart/minute")
+async def fetch_minute_chart(
+    query: str = Query(..., description="회사명 또는 종목코드"),
+    interval: int = Query(1, description="분봉 단위 (1 / 5 / 30)"),
+    limit: int | None = Query(None, ge=1, le=512, description="최근 봉 개수 (생략 시 보관 중인 전체)"),
+):
+    """
+    실시간 체결로 만든 당일 분봉 (마지막 봉은 형성 중인 봉)
+    조회한 종목은 일정 시간 실시간 구독을 유지하며, 구독 시작 이후 구간만 포함됩니다.
+    실시간 갱신은 /ws/quotes?symbols=...&bars=1 로 받을 수 있습니다.
+    """
+    if interval not in INTERVALS:
+        raise HTTPException(
+            status_code=400, detail=f"지원하지 않는 분봉 단위: {interval} ({', '.join(map(str, INTERVALS))})"
+        )
+
+    symbol = find_symbol(query)
+    if not symbol:
+        raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
+
+    try:
+        await get_hub().retain(symbol)
+    except FeedLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    bars = get_bars(symbol, interval, limit)
+    return format_minute_bars(bars) if bars is not None else []
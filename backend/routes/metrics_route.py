@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+from ..core.metrics import render_metrics, CONTENT_TYPE
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Prometheus 텍스트 형식 메트릭 (라우트 / 업스트림 응답 시간, 오류, 토큰 발급, 이벤트 루프 지연, 캐시 히트율)
+    """
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
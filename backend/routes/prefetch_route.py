@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query
+from ..services.prefetch_service import prefetch_status, start_prefetch
+
+router = APIRouter()
+
+
+@router.get("/prefetch/status")
+async def get_prefetch_status(top: int = Query(20, ge=1, le=200, description="인기 종목 표시 개수")):
+    """
+    인기 종목(감소하는 조회 빈도) 순위와 최근 미리 조회 결과를 반환합니다.
+    """
+    return prefetch_status(top)
+
+
+@router.post("/prefetch/run", status_code=202)
+async def run_prefetch_now():
+    """
+    인기 종목 미리 조회를 바로 시작합니다. (이미 실행 중이면 started=false)
+    """
+    return {"started": start_prefetch()}
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi.responses import FileResponse, PlainTextResponse
+from ..core.profiling import is_admin, list_dumps, dump_path, dump_text
+
+router = APIRouter()
+
+
+def _require_admin(request: Request):
+    if not is_admin(request.headers):
+        raise HTTPException(status_code=403, detail="프로파일링 결과는 관리자 헤더(X-Profile)가 필요합니다.")
+
+
+@router.get("/profiles", include_in_schema=False)
+async def get_profiles(request: Request):
+    """
+    저장된 cProfile 결과 파일 목록 (최신 → 과거)
+    """
+    _require_admin(request)
+    return list_dumps()
+
+
+@router.get("/profiles/{name}", include_in_schema=False)
+async def get_profile(
+    request: Request,
+    name: str,
+    format: str = Query("text", description="text (pstats 요약) / raw (.prof 파일, snakeviz · flameprof 로 열기)"),
+    limit: int = Query(50, ge=1, le=1000, description="text 형식에서 표시할 함수 수"),
+    sort: str = Query("cumulative", description="text 형식 정렬 기준 (cumulative / tottime / ncalls)"),
+):
+    """
+    cProfile 결과 (text: 함수별 누적 시간 요약, raw: pstats 원본 파일)
+    """
+    _require_admin(request)
+    path = dump_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일 결과를 찾을 수 없습니다.")
+    if format == "raw":
+        return FileResponse(path, media_type="application/octet-stream", filename=name)
+    if sort not in ("cumulative", "tottime", "ncalls"):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 정렬 기준: {sort}")
+    return PlainTextResponse(dump_text(name, limit, sort))
@@ -1,28 +1,50 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 from ..utils.stock_lookup import find_symbol
-from ..services.profitability_service import get_profitability_ratios
+from ..services.profitability_service import fetch_profitability_output, build_profitability_ratios
+from ..services.ratio_store import checked_at
+from ..core.scheduler import SchedulerBusy
+from ..core.circuit_breaker import UpstreamError
+from ..core.http_cache import ResponseCache, RATIO_MAX_AGE
 
 router = APIRouter()
 
+# 버전: 최근 결산 기간 (stac_yymm) + 마지막 KIS 확인 시각
+_responses = ResponseCache("response_profitability", RATIO_MAX_AGE)
+
+
+def _profitability_body(symbol: str, latest: dict) -> dict:
+    result = build_profitability_ratios(symbol, latest)
+    return {
+        "symbol": result["symbol"],
+        "report_date": result["report_date"],
+        "profitability_score": result["profitability_score"],
+        "risk_level": result["risk_level"],
+        "raw_data": result["raw_data"],
+        "score_details": result["score_details"],
+    }
+
 
 @router.get("/stock/profitability")
-def stock_profitability(query: str = Query(..., description="회사명 또는 종목코드")):
+async def stock_profitability(request: Request, query: str = Query(..., description="회사명 또는 종목코드")):
     """
     종목의 수익성 점수 및 리스크 수준을 반환합니다.
+    ETag / Last-Modified 가 일치하면 304
     """
     symbol = find_symbol(query)
     if not symbol:
         raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
 
     try:
-        result = get_profitability_ratios(symbol)
-        return {
-            "symbol": result["symbol"],
-            "report_date": result["report_date"],
-            "profitability_score": result["profitability_score"],
-            "risk_level": result["risk_level"],
-            "raw_data": result["raw_data"],
-            "score_details": result["score_details"],
-        }
+        latest = await fetch_profitability_output(symbol)
+        checked = checked_at(symbol, "profitability")
+        return await _responses.respond(
+            request,
+            symbol,
+            (latest.get("stac_yymm"), checked),
+            lambda: _profitability_body(symbol, latest),
+            last_modified=checked,
+        )
+    except (SchedulerBusy, UpstreamError):
+        raise  # 503 / 504 응답은 main 의 예외 핸들러에서 처리
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
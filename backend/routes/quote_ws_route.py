@@ -0,0 +1,115 @@
+import os
+import json
+import asyncio
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from ..utils.stock_lookup import find_symbol
+from ..services.quote_feed import FeedLimitError
+from ..services.quote_hub import Subscriber, get_hub
+from ..services.intraday_bars import INTERVALS
+
+router = APIRouter()
+
+# 클라이언트 1개당 최대 구독 종목 수
+MAX_SYMBOLS_PER_CLIENT = int(os.getenv("WS_MAX_SYMBOLS_PER_CLIENT", "20"))
+
+
+async def _subscribe(subscriber: Subscriber, queries: list):
+    hub = get_hub()
+    added = []
+    for query in queries:
+        symbol = find_symbol(str(query))
+        if not symbol:
+            subscriber.send_control({"type": "error", "detail": f"종목을 찾을 수 없습니다: {query}"})
+            continue
+        if symbol not in subscriber.symbols and len(subscriber.symbols) >= MAX_SYMBOLS_PER_CLIENT:
+            subscriber.send_control(
+                {"type": "error", "detail": f"최대 {MAX_SYMBOLS_PER_CLIENT}종목까지 구독할 수 있습니다."}
+            )
+            break
+        try:
+            await hub.subscribe(subscriber, symbol)
+            added.append(symbol)
+        except FeedLimitError as e:
+            subscriber.send_control({"type": "error", "detail": str(e)})
+            break
+    subscriber.send_control({"type": "subscribed", "symbols": sorted(subscriber.symbols), "added": added})
+
+
+def _set_bar_intervals(subscriber: Subscriber, intervals: list):
+    try:
+        requested = {int(interval) for interval in intervals}
+    except (TypeError, ValueError):
+        requested = {None}
+    invalid = requested - set(INTERVALS)
+    if invalid:
+        subscriber.send_control(
+            {"type": "error", "detail": f"지원하지 않는 분봉 단위입니다. ({', '.join(map(str, INTERVALS))})"}
+        )
+        return
+    subscriber.bar_intervals = requested
+    subscriber.send_control({"type": "bars", "intervals": sorted(requested)})
+
+
+async def _unsubscribe(subscriber: Subscriber, queries: list):
+    hub = get_hub()
+    for query in queries:
+        symbol = find_symbol(str(query))
+        if symbol:
+            await hub.unsubscribe(subscriber, symbol)
+    subscriber.send_control({"type": "subscribed", "symbols": sorted(subscriber.symbols), "added": []})
+
+
+@router.websocket("/ws/quotes")
+async def quotes_ws(websocket: WebSocket, symbols: str | None = None, bars: str | None = None):
+    """
+    실시간 체결가 스트림
+    - 접속 시 ?symbols=005930,삼성전자&bars=1,5 로 바로 구독하거나
+    - {"action": "subscribe" | "unsubscribe", "symbols": [...]} 메시지로 구독 변경
+    - {"action": "bars", "intervals": [1, 5, 30]} 메시지로 받을 분봉 단위 지정 ([] 이면 받지 않음)
+    - 서버 → 클라이언트: {"type": "tick", ...} / {"type": "bar", ...} / {"type": "subscribed", ...} / {"type": "error", ...}
+    """
+    await websocket.accept()
+    subscriber = Subscriber(websocket)
+    sender = asyncio.create_task(subscriber.run_sender())
+    try:
+        if bars:
+            _set_bar_intervals(subscriber, [b for b in bars.split(",") if b.strip()])
+        if symbols:
+            await _subscribe(subscriber, [s for s in symbols.split(",") if s.strip()])
+
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                message = json.loads(raw)
+                action = message["action"]
+                targets = message.get("symbols") or []
+                intervals = message.get("intervals") or []
+                # 문자열을 그대로 순회하면 글자 단위 종목 / 분봉 단위가 되므로 목록만 허용
+                if not isinstance(targets, list) or not isinstance(intervals, list):
+                    raise TypeError
+            except (ValueError, KeyError, TypeError, AttributeError):
+                subscriber.send_control({"type": "error", "detail": "잘못된 메시지 형식입니다. (symbols / intervals 는 배열)"})
+                continue
+
+            if action == "subscribe":
+                await _subscribe(subscriber, targets)
+            elif action == "unsubscribe":
+                await _unsubscribe(subscriber, targets)
+            elif action == "bars":
+                _set_bar_intervals(subscriber, intervals)
+            else:
+                subscriber.send_control({"type": "error", "detail": f"지원하지 않는 action: {action}"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+        await get_hub().remove(subscriber)
+
+
+@router.get("/ws/quotes/stats")
+async def quotes_ws_stats():
+    """
+    실시간 시세 허브 상태 (피드 종류, 구독 종목 / 클라이언트 수, 전송 / 건너뛴 메시지 수)
+    """
+    return get_hub().stats()
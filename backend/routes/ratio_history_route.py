@@ -0,0 +1,79 @@
+import asyncio
+from typing import Literal
+from fastapi import APIRouter, Query, HTTPException, Request
+from ..utils.stock_lookup import find_symbol
+from ..services.financial_service import build_financial_ratios
+from ..services.profitability_service import build_profitability_ratios
+from ..services import ratio_store
+from ..core.scheduler import SchedulerBusy
+from ..core.circuit_breaker import UpstreamError
+from ..core.http_cache import ResponseCache, RATIO_MAX_AGE
+
+router = APIRouter()
+
+# 버전: 비율 종류별 마지막 KIS 확인 시각
+_responses = ResponseCache("response_ratio_history", RATIO_MAX_AGE)
+
+
+def _history_items(rows: list, score_key: str) -> list:
+    return [
+        {
+            "report_date": row["report_date"],
+            "score": row[score_key],
+            "risk_level": row["risk_level"],
+            "raw_data": row["raw_data"],
+            "score_details": row["score_details"],
+        }
+        for row in rows
+    ]
+
+
+@router.get("/stock/ratios/history")
+async def stock_ratio_history(
+    request: Request,
+    query: str = Query(..., description="회사명 또는 종목코드"),
+    kind: Literal["stability", "profitability"] | None = Query(None, description="비율 종류 (없으면 전체)"),
+    limit: int | None = Query(None, ge=1, le=100, description="최근 결산 기간 수"),
+):
+    """
+    결산 기간별 재무 안정성 / 수익성 점수 이력을 반환합니다. (최근 → 과거)
+    """
+    symbol = find_symbol(query)
+    if not symbol:
+        raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
+
+    try:
+        kinds = [kind] if kind else ["stability", "profitability"]
+
+        async def load(k: str):
+            # 저장소 조회 직후의 확인 시각을 버전으로 사용 (사이에 await 가 없어야 데이터와 일치)
+            periods = await ratio_store.get_periods(symbol, k, limit)
+            return periods, ratio_store.checked_at(symbol, k)
+
+        loaded = await asyncio.gather(*(load(k) for k in kinds))
+        results = [periods for periods, _ in loaded]
+        checked = tuple(checked for _, checked in loaded)
+
+        # 점수 계산은 저장된 결산 기간이 바뀐 경우에만
+        def body():
+            history = {}
+            for k, periods in zip(kinds, results):
+                if k == "stability":
+                    rows = [build_financial_ratios(symbol, row) for row in periods]
+                    history[k] = _history_items(rows, "stability_score")
+                else:
+                    rows = [build_profitability_ratios(symbol, row) for row in periods]
+                    history[k] = _history_items(rows, "profitability_score")
+            return {"symbol": symbol, "history": history}
+
+        return await _responses.respond(
+            request,
+            (symbol, kind, limit),
+            checked,
+            body,
+            last_modified=max((t for t in checked if t is not None), default=None),
+        )
+    except (SchedulerBusy, UpstreamError):
+        raise  # 503 / 504 응답은 main 의 예외 핸들러에서 처리
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+from ..core.scheduler import scheduler
+from ..core.circuit_breaker import breaker_stats
+
+router = APIRouter()
+
+
+@router.get("/scheduler/stats")
+async def get_scheduler_stats():
+    """
+    KIS 요청 스케줄러 상태 (남은 토큰, 대기열 길이, 우선순위별 대기 시간, 거절/throttle 횟수)
+    """
+    return scheduler.stats()
+
+
+@router.get("/upstream/breakers")
+async def get_breaker_stats():
+    """
+    TR_ID 별 서킷 브레이커 상태 (closed / open / half_open, 연속 실패 수, 열린 횟수, 거절 수)
+    """
+    return breaker_stats()
@@ -0,0 +1,42 @@
+from typing import Literal
+from fastapi import APIRouter, Query
+from ..services.screener_service import query_screener, screener_status, start_screen
+
+router = APIRouter()
+
+
+@router.get("/screener")
+async def get_screener(
+    sort: Literal["stability", "profitability", "volatility", "supply"] = Query(
+        "stability", description="정렬 기준 점수"
+    ),
+    order: Literal["asc", "desc"] = Query("asc", description="정렬 방향"),
+    market: Literal["KOSPI", "KOSDAQ"] | None = Query(None, description="시장구분 필터"),
+    risk_level: str | None = Query(None, description="정렬 기준 점수의 리스크 구간 필터 (ex. 위험, 높음)"),
+    min_score: float | None = Query(None, description="최소 점수"),
+    max_score: float | None = Query(None, description="최대 점수"),
+    offset: int = Query(0, ge=0, description="시작 위치"),
+    limit: int = Query(50, ge=1, le=500, description="최대 건수"),
+):
+    """
+    전 종목 리스크 점수 순위 (ex. 안정성 점수 낮은 순, KOSDAQ 변동성 높은 순)
+    백그라운드 조회가 끝난 종목만 포함되며, status 에 진행률과 마지막 완료 시각이 담깁니다.
+    """
+    return query_screener(sort, order, market, risk_level, min_score, max_score, offset, limit)
+
+
+@router.get("/screener/status")
+async def get_screener_status():
+    """
+    스크리너 백그라운드 조회 진행 상태 및 데이터 최신성
+    """
+    return screener_status()
+
+
+@router.post("/screener/refresh", status_code=202)
+async def refresh_screener():
+    """
+    전 종목 재조회 시작 (이미 진행 중이면 그대로 진행)
+    """
+    started = start_screen()
+    return {"started": started, **screener_status()}
@@ -1,16 +1,83 @@
 # backend/routes/stock_list_route.py
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from typing import Literal
+from fastapi import APIRouter, Query, Request, Response
+from functools import lru_cache
+import gzip
+import hashlib
 import json
-import os
+
+from ..utils.stock_lookup import search_symbols
+from ..utils.symbol_table import current_table, on_swap
+from ..core.http_cache import etag_matches
 
 router = APIRouter()
 
+# 종목 리스트는 심볼 테이블이 교체될 때만 바뀌므로 응답 바이트를 미리 만들어 재사용
+CACHE_CONTROL = "public, max-age=3600"
+
+
+@lru_cache(maxsize=256)
+def _encoded_stock_list(table, market: str | None, offset: int, limit: int | None):
+    """(테이블, 필터/페이지 조건) → (JSON 바이트, gzip 바이트, ETag, 전체 건수)"""
+    items = [item for item in table.items() if market is None or item["시장구분"] == market]
+    total = len(items)
+    page = items[offset : offset + limit] if limit is not None else items[offset:]
+
+    body = json.dumps(page, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = hashlib.sha1(body).hexdigest()
+    return body, gzip.compress(body, mtime=0), etag, total
+
+
+# ✅ 서버 시작 시 / 테이블 교체 시 전체/시장별 응답 미리 생성
+def _prebuild(table):
+    _encoded_stock_list.cache_clear()
+    for market in (None, "KOSPI", "KOSDAQ"):
+        _encoded_stock_list(table, market, 0, None)
+
+
+_prebuild(current_table())
+on_swap(_prebuild)
+
 
 @router.get("/stocks")
-def get_stock_list():
-    path = os.path.join(os.path.dirname(__file__), "..", "data", "stock_list.json")
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-    return JSONResponse(content=data)
+async def get_stock_list(
+    request: Request,
+    market: Literal["KOSPI", "KOSDAQ"] | None = Query(None, description="시장구분 필터"),
+    offset: int = Query(0, ge=0, description="시작 위치"),
+    limit: int | None = Query(None, ge=1, le=5000, description="최대 건수 (생략 시 전체)"),
+):
+    """
+    종목 리스트 (시장구분 필터 + offset/limit 페이지네이션)
+    ETag 가 일치하면 304, gzip 을 받는 클라이언트에는 미리 압축한 바이트를 그대로 전송
+    """
+    body, gz_body, etag, total = _encoded_stock_list(current_table(), market, offset, limit)
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    # 표현(encoding)마다 다른 강한 ETag 사용
+    current_etag = f"{etag}-gz" if use_gzip else etag
+
+    headers = {
+        "ETag": f'"{current_etag}"',
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "X-Total-Count": str(total),
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), (f'"{etag}"', f'"{etag}-gz"')):
+        return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=gz_body, media_type="application/json", headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/stocks/search")
+async def search_stock_list(
+    q: str = Query(..., description="회사명/종목코드 접두어 또는 초성 (ex. ㅅㅅㅈㅈ)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수"),
+):
+    """
+    종목 자동완성 검색 (정확 일치 → 회사명 접두어 → 종목코드 접두어 → 초성 순)
+    """
+    return search_symbols(q, limit)
@@ -1,17 +1,29 @@
-from fastapi import APIRouter, Query, HTTPException
-from ..services.quote_service import get_stock_summary
+from fastapi import APIRouter, Query, HTTPException, Request
+from ..services.quote_service import fetch_price_output, build_stock_summary, quote_time
 from ..utils.stock_lookup import find_symbol  # query → 종목코드 매핑
+from ..core.scheduler import SchedulerBusy
+from ..core.circuit_breaker import UpstreamError
+from ..core.http_cache import ResponseCache, market_max_age
 
 router = APIRouter()
 
+# 버전: 시세를 KIS 에서 받은 시각
+_responses = ResponseCache("response_summary", market_max_age)
+
 
 @router.get("/stock/summary")
-def stock_summary(query: str = Query(..., description="회사명 또는 종목코드")):
+async def stock_summary(request: Request, query: str = Query(..., description="회사명 또는 종목코드")):
     symbol = find_symbol(query)
     if not symbol:
         raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
 
     try:
-        return get_stock_summary(symbol)
+        output = await fetch_price_output(symbol)
+        updated = quote_time(symbol)
+        return await _responses.respond(
+            request, symbol, updated, lambda: build_stock_summary(symbol, output), last_modified=updated
+        )
+    except (SchedulerBusy, UpstreamError):
+        raise  # 503 / 504 응답은 main 의 예외 핸들러에서 처리
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 from ..utils.stock_lookup import find_symbol
-from ..services.supply_service import get_stock_summary, score_supply_demand
+from ..services.quote_service import fetch_price_output, quote_time
+from ..services.supply_service import build_supply_risk
+from ..core.scheduler import SchedulerBusy
+from ..core.circuit_breaker import UpstreamError
+from ..core.http_cache import ResponseCache, market_max_age
 
 router = APIRouter()
 
+# 버전: 시세를 KIS 에서 받은 시각
+_responses = ResponseCache("response_supply_risk", market_max_age)
+
 
 @router.get("/stock/supply-risk")
-def stock_supply_risk(query: str = Query(..., description="회사명 또는 종목코드")):
+async def stock_supply_risk(request: Request, query: str = Query(..., description="회사명 또는 종목코드")):
     """
     종목의 수급 관련 지표(외국인 지분율, 외국인/기관 순매수량, 회전율)를 기반으로
     리스크 점수(100점 만점)를 계산하고, 리스크 수준을 반환합니다.
@@ -17,20 +24,17 @@ def stock_supply_risk(query: str = Query(..., description="회사명 또는 종
         raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
 
     try:
-        # 실시간 종목 요약 정보 조회 (수급 관련 데이터 포함)
-        summary = get_stock_summary(symbol)
+        # 실시간 시세 조회 (수급 관련 데이터 포함)
+        output = await fetch_price_output(symbol)
 
-        # 수급 지표 기반 리스크 점수 계산
-        score_result = score_supply_demand(summary)
+        updated = quote_time(symbol)
 
-        return {
-            "symbol": symbol,
-            "risk_score": score_result["total_score"],  # 👉 총점 (100점 기준)
-            "risk_level": score_result["risk_level"],  # 👉 리스크 구간 (낮음/보통/높음)
-            "score_details": score_result[
-                "score_by_metric"
-            ],  # 👉 각 지표별 점수 breakdown
-        }
+        # 수급 지표 기반 리스크 점수 계산 (시세가 그대로면 이전 응답 재사용 / 304)
+        return await _responses.respond(
+            request, symbol, updated, lambda: build_supply_risk(symbol, output), last_modified=updated
+        )
+    except (SchedulerBusy, UpstreamError):
+        raise  # 503 / 504 응답은 main 의 예외 핸들러에서 처리
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"수급 리스크 점수 계산 실패: {str(e)}"
@@ -1,12 +1,30 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 from ..utils.stock_lookup import find_symbol
-from ..services.volatility_service import get_volatility
+from ..services.quote_service import fetch_price_output, quote_time
+from ..services.volatility_service import build_volatility
+from ..core.scheduler import SchedulerBusy
+from ..core.circuit_breaker import UpstreamError
+from ..core.http_cache import ResponseCache, market_max_age
 
 router = APIRouter()
 
+# 버전: 시세를 KIS 에서 받은 시각
+_responses = ResponseCache("response_volatility", market_max_age)
+
+
+def _volatility_body(symbol: str, output: dict) -> dict:
+    result = build_volatility(symbol, output)
+    return {
+        "symbol": symbol,
+        "volatility_score": result["volatility_score"],
+        "risk_level": result["risk_level"],
+        "raw_data": result["raw_data"],
+        "score_details": result["score_details"],
+    }
+
 
 @router.get("/stock/volatility")
-def stock_volatility(query: str = Query(..., description="회사명 또는 종목코드")):
+async def stock_volatility(request: Request, query: str = Query(..., description="회사명 또는 종목코드")):
     """
     종목의 변동성 관련 지표를 기반으로 점수 및 리스크 수준을 반환합니다.
     """
@@ -15,14 +33,12 @@ def stock_volatility(query: str = Query(..., description="회사명 또는 종
         raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다.")
 
     try:
-        result = get_volatility(symbol)
-
-        return {
-            "symbol": symbol,
-            "volatility_score": result["volatility_score"],
-            "risk_level": result["risk_level"],
-            "raw_data": result["raw_data"],
-            "score_details": result["score_details"],
-        }
+        output = await fetch_price_output(symbol)
+        updated = quote_time(symbol)
+        return await _responses.respond(
+            request, symbol, updated, lambda: _volatility_body(symbol, output), last_modified=updated
+        )
+    except (SchedulerBusy, UpstreamError):
+        raise  # 503 / 504 응답은 main 의 예외 핸들러에서 처리
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
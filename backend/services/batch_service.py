@@ -0,0 +1,85 @@
+import os
+import asyncio
+from .chart_service import get_chart_data
+from .quote_service import quote_cache, fetch_price_output, build_stock_summary
+
+# 여러 종목 (관심종목 / 비교 화면) 차트 · 시세 한 번에 조회
+# - 검색어는 한 번에 종목코드로 변환하고, 같은 종목은 한 번만 조회
+# - 캐시에 있는 시세는 바로 응답하고, 나머지만 동시 조회 수 제한 안에서 조회
+# - 종목별로 실패해도 나머지 결과는 그대로 반환 (errors 에 실패 사유 기록)
+
+# 요청 1건당 최대 종목 수
+MAX_SYMBOLS = int(os.getenv("BATCH_MAX_SYMBOLS", "50"))
+# 동시에 업스트림을 조회하는 종목 수
+CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+
+
+def parse_queries(raw: str) -> list:
+    """쉼표로 구분된 회사명 / 종목코드 목록 (ex. 삼성전자,000660)"""
+    queries = [q.strip() for q in raw.split(",") if q.strip()]
+    if not queries:
+        raise ValueError("조회할 종목이 없습니다.")
+    if len(queries) > MAX_SYMBOLS:
+        raise ValueError(f"한 번에 조회할 수 있는 종목은 최대 {MAX_SYMBOLS}개입니다. ({len(queries)}개 요청)")
+    return queries
+
+
+async def _load_all(symbols: list, loader) -> dict:
+    """종목별 loader 결과 → {종목코드: 결과 또는 예외} (동시 실행 수 제한)"""
+    semaphore = asyncio.Semaphore(max(CONCURRENCY, 1))
+
+    async def run(symbol):
+        async with semaphore:
+            return await loader(symbol)
+
+    results = await asyncio.gather(*(run(symbol) for symbol in symbols), return_exceptions=True)
+    return dict(zip(symbols, results))
+
+
+def _combine(resolved: dict, results: dict, **extra) -> dict:
+    """검색어 순서대로 결과 정리, 찾지 못한 종목 / 실패한 종목은 data=None + errors"""
+    response = {**extra, "results": [], "errors": {}}
+    for query, symbol in resolved.items():
+        if symbol is None:
+            data, error = None, "종목을 찾을 수 없습니다."
+        else:
+            value = results[symbol]
+            if isinstance(value, BaseException):
+                data, error = None, str(value) or type(value).__name__
+            else:
+                data, error = value, None
+        response["results"].append({"query": query, "symbol": symbol, "data": data})
+        if error is not None:
+            response["errors"][query] = error
+    return response
+
+
+# ✅ 여러 종목 시세 요약
+async def get_summary_batch(resolved: dict) -> dict:
+    symbols = list(dict.fromkeys(s for s in resolved.values() if s is not None))
+
+    results = {}
+    cold = []
+    for symbol in symbols:
+        output = quote_cache.get(symbol)
+        if output is not None:
+            results[symbol] = build_stock_summary(symbol, output)
+        else:
+            cold.append(symbol)
+
+    async def load(symbol):
+        return build_stock_summary(symbol, await fetch_price_output(symbol))
+
+    results.update(await _load_all(cold, load))
+    return _combine(resolved, results)
+
+
+# ✅ 여러 종목 차트 (행 단위 JSON)
+async def get_chart_batch(
+    resolved: dict, timeframe: str, limit: int | None = None, indicators: tuple = ()
+) -> dict:
+    symbols = list(dict.fromkeys(s for s in resolved.values() if s is not None))
+    results = await _load_all(
+        symbols, lambda symbol: get_chart_data(symbol, timeframe, limit, indicators)
+    )
+    return _combine(resolved, results, timeframe=timeframe)
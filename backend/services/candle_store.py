@@ -0,0 +1,342 @@
+import os
+import time
+import asyncio
+from datetime import date, datetime, timedelta
+from ..core.cache import AsyncTTLCache
+from ..core.db import get_connection
+from ..core.kis_client import kis_get
+from ..core.scheduler import background
+from ..core.log import get_logger
+from ..utils.market_hours import KST, now_kst, last_trading_day
+
+logger = get_logger(__name__)
+
+# 종목별 일봉(OHLCV) 로컬 저장소
+# - 마지막 저장일 이후 구간만 KIS 에서 가져와 채움 (delta sync)
+# - 과거 구간은 백그라운드에서 100건씩 페이지 단위로 거슬러 올라가며 채움 (backfill)
+# - 저장소에는 종가가 확정된 일봉만 저장 (장중 형성 중인 봉은 저장하지 않음)
+# - 수정주가 기준이므로 액면분할 / 유상증자 등으로 과거 가격이 다시 계산되면
+#   tail 동기화 때 겹치는 마지막 저장 봉의 가격이 달라짐 → 종목 일봉을 지우고 다시 채움
+
+# 기간별 시세 API 1회 조회 구간 (약 95 거래일 → 100건 제한 이내)
+PAGE_DAYS = 140
+# 최초 조회 시 가져올 구간
+INITIAL_DAYS = PAGE_DAYS
+# 시간외 거래까지 끝나서 일봉이 더 이상 바뀌지 않는 시각
+DAILY_FINAL_HOUR = 18
+# 같은 종목의 tail 동기화 최소 간격 (초)
+SYNC_INTERVAL = float(os.getenv("CANDLE_SYNC_INTERVAL", "60"))
+# 업스트림 장애 / 지연 시 동기화를 기다리지 않고 저장된 일봉으로 응답할 수 있는 시간 (초, 마지막 동기화 기준)
+SYNC_STALE_SECONDS = float(os.getenv("CANDLE_SYNC_STALE_SECONDS", str(24 * 3600)))
+# 백그라운드 backfill 최대 페이지 수 / 페이지 간 대기 (초)
+BACKFILL_MAX_PAGES = int(os.getenv("CANDLE_BACKFILL_MAX_PAGES", "40"))
+BACKFILL_PAGE_DELAY = float(os.getenv("CANDLE_BACKFILL_PAGE_DELAY", "0.5"))
+# 빈 구간이 이 횟수만큼 연속되어야 상장일 이전으로 판단 (기본 4 × 140일 ≈ 1년 반)
+# - 장기 거래정지 / 재상장 사이 공백도 빈 구간으로 오므로 한 번 비었다고 끝내지 않고 더 과거를 조회
+BACKFILL_EMPTY_WINDOWS = int(os.getenv("CANDLE_BACKFILL_EMPTY_WINDOWS", "4"))
+
+_sync_cache = AsyncTTLCache("candle_sync", ttl=SYNC_INTERVAL, stale_ttl=SYNC_STALE_SECONDS)
+_backfill_tasks: dict[str, asyncio.Task] = {}
+_schema_ready = False
+
+
+def _db():
+    global _schema_ready
+    conn = get_connection()
+    if not _schema_ready:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS daily_candles (
+                symbol TEXT NOT NULL,
+                date TEXT NOT NULL,
+                open REAL NOT NULL,
+                high REAL NOT NULL,
+                low REAL NOT NULL,
+                close REAL NOT NULL,
+                volume INTEGER NOT NULL,
+                PRIMARY KEY (symbol, date)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS candle_meta (
+                symbol TEXT PRIMARY KEY,
+                synced_at REAL NOT NULL DEFAULT 0,
+                history_complete INTEGER NOT NULL DEFAULT 0,
+                changed_at REAL NOT NULL DEFAULT 0
+            );
+            """
+        )
+        # changed_at 추가 전 저장소: 마지막 동기화 시각을 마지막 변경 시각으로 사용
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(candle_meta)")}
+        if "changed_at" not in columns:
+            with conn:
+                conn.execute("ALTER TABLE candle_meta ADD COLUMN changed_at REAL NOT NULL DEFAULT 0")
+                conn.execute("UPDATE candle_meta SET changed_at = synced_at")
+        _schema_ready = True
+    return conn
+
+
+def _yyyymmdd(d: date) -> str:
+    return d.strftime("%Y%m%d")
+
+
+# ✅ 저장소 조회 (오래된 날짜 → 최신 날짜 순)
+def load_daily(symbol: str, limit: int | None = None) -> list:
+    """[(date, open, high, low, close, volume), ...]"""
+    conn = _db()
+    if limit is None:
+        rows = conn.execute(
+            "SELECT date, open, high, low, close, volume FROM daily_candles"
+            " WHERE symbol = ? ORDER BY date",
+            (symbol,),
+        ).fetchall()
+        return rows
+    rows = conn.execute(
+        "SELECT date, open, high, low, close, volume FROM daily_candles"
+        " WHERE symbol = ? ORDER BY date DESC LIMIT ?",
+        (symbol, limit),
+    ).fetchall()
+    rows.reverse()
+    return rows
+
+
+def date_range(symbol: str) -> tuple:
+    """(가장 오래된 저장일, 가장 최근 저장일) - 저장된 봉이 없으면 (None, None)"""
+    return _db().execute(
+        "SELECT MIN(date), MAX(date) FROM daily_candles WHERE symbol = ?", (symbol,)
+    ).fetchone()
+
+
+def data_version(symbol: str) -> tuple:
+    """(봉 수, 가장 오래된 저장일, 가장 최근 봉) - 저장된 일봉이 같으면 같은 값 (동기화 시각과 무관)"""
+    count, oldest = _db().execute(
+        "SELECT COUNT(*), MIN(date) FROM daily_candles WHERE symbol = ?", (symbol,)
+    ).fetchone()
+    newest = load_daily(symbol, 1)
+    return count, oldest, tuple(newest[0]) if newest else None
+
+
+def changed_at(symbol: str) -> float:
+    """저장된 일봉이 마지막으로 바뀐 시각 (epoch 초, 없으면 0)"""
+    row = _db().execute("SELECT changed_at FROM candle_meta WHERE symbol = ?", (symbol,)).fetchone()
+    return row[0] if row else 0.0
+
+
+def _meta(symbol: str) -> tuple:
+    row = _db().execute(
+        "SELECT synced_at, history_complete FROM candle_meta WHERE symbol = ?", (symbol,)
+    ).fetchone()
+    return row or (0.0, 0)
+
+
+def _upsert(symbol: str, raw_rows: list, max_date: str) -> int:
+    """KIS 원본 행 저장 (max_date 이후의 미확정 봉은 제외)"""
+    values = [
+        (
+            symbol,
+            item["stck_bsop_date"],
+            float(item["stck_oprc"]),
+            float(item["stck_hgpr"]),
+            float(item["stck_lwpr"]),
+            float(item["stck_clpr"]),
+            int(item["acml_vol"]),
+        )
+        for item in raw_rows
+        if item.get("stck_bsop_date") and item["stck_bsop_date"] <= max_date
+    ]
+    conn = _db()
+    before = conn.total_changes
+    with conn:
+        # 값이 같은 봉은 덮어쓰지 않음 → 실제로 바뀐 행만 변경 건수에 포함
+        conn.executemany(
+            "INSERT INTO daily_candles VALUES (?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(symbol, date) DO UPDATE SET"
+            " open = excluded.open, high = excluded.high, low = excluded.low,"
+            " close = excluded.close, volume = excluded.volume"
+            " WHERE open != excluded.open OR high != excluded.high OR low != excluded.low"
+            " OR close != excluded.close OR volume != excluded.volume",
+            values,
+        )
+    if conn.total_changes != before:
+        _set_meta(symbol, changed_at=time.time())
+    return len(values)
+
+
+def _stored_prices(symbol: str, day: str) -> tuple | None:
+    return _db().execute(
+        "SELECT open, high, low, close FROM daily_candles WHERE symbol = ? AND date = ?", (symbol, day)
+    ).fetchone()
+
+
+def _readjusted(stored: tuple | None, raw_rows: list, day: str) -> bool:
+    """다시 받은 day 봉의 가격(OHLC)이 저장된 값과 다른지 (거래량은 마감 직후 보정이 있으므로 제외)"""
+    if stored is None:
+        return False
+    for item in raw_rows:
+        if item["stck_bsop_date"] == day:
+            fetched = tuple(
+                float(item[k]) for k in ("stck_oprc", "stck_hgpr", "stck_lwpr", "stck_clpr")
+            )
+            return fetched != tuple(stored)
+    return False
+
+
+def _reset(symbol: str):
+    """종목 일봉 전체 삭제 (backfill 도 처음부터 다시)"""
+    task = _backfill_tasks.get(symbol)
+    if task is not None:
+        task.cancel()
+    conn = _db()
+    with conn:
+        conn.execute("DELETE FROM daily_candles WHERE symbol = ?", (symbol,))
+        conn.execute(
+            "UPDATE candle_meta SET history_complete = 0, changed_at = ? WHERE symbol = ?",
+            (time.time(), symbol),
+        )
+
+
+def _set_meta(symbol: str, **fields):
+    """candle_meta 의 지정한 컬럼만 갱신 (행이 없으면 나머지는 기본값으로 생성)"""
+    columns = ", ".join(fields)
+    placeholders = ", ".join("?" * len(fields))
+    updates = ", ".join(f"{name} = excluded.{name}" for name in fields)
+    conn = _db()
+    with conn:
+        conn.execute(
+            f"INSERT INTO candle_meta (symbol, {columns}) VALUES (?, {placeholders})"
+            f" ON CONFLICT(symbol) DO UPDATE SET {updates}",
+            (symbol, *fields.values()),
+        )
+
+
+# ✅ 기간별 시세 조회 (start ~ end, 최신 날짜부터 최대 100건)
+async def _fetch_range(symbol: str, start: date, end: date) -> list:
+    res_json = await kis_get(
+        "FHKST03010100",
+        symbol,
+        fid_input_date_1=_yyyymmdd(start),
+        fid_input_date_2=_yyyymmdd(end),
+    )
+    return [row for row in res_json.get("output2", []) if row.get("stck_bsop_date")]
+
+
+def _is_final(day: str, synced_at: float) -> bool:
+    """해당 일봉을 장 마감(시간외 포함) 이후에 동기화했는지"""
+    final_at = datetime.strptime(day, "%Y%m%d").replace(hour=DAILY_FINAL_HOUR, tzinfo=KST)
+    return synced_at >= final_at.timestamp()
+
+
+# ✅ 최신 구간 동기화 (마지막 저장일 ~ 최근 확정 거래일, 최근에 동기화했으면 오래 기다리지 않음)
+async def sync_tail(symbol: str):
+    await _sync_cache.get_or_load_stale(symbol, lambda: _sync_tail(symbol))
+
+
+def synced_at(symbol: str) -> float:
+    """마지막 동기화 시각 (epoch 초, 없으면 0)"""
+    return _meta(symbol)[0]
+
+
+def sync_age(symbol: str) -> float:
+    """마지막 동기화 후 지난 시간 (초)"""
+    synced_at, _ = _meta(symbol)
+    return time.time() - synced_at if synced_at else float("inf")
+
+
+def is_synced(symbol: str) -> bool:
+    """최근 SYNC_INTERVAL 안에 최신 구간을 동기화했는지"""
+    return _sync_cache.contains(symbol)
+
+
+async def _sync_tail(symbol: str):
+    target = last_trading_day()
+    target_str = _yyyymmdd(target)
+    _, newest = date_range(symbol)
+    synced_at, _ = _meta(symbol)
+
+    if newest is not None and newest >= target_str and _is_final(newest, synced_at):
+        return
+
+    # 마지막 저장 봉도 다시 받아서 덮어씀 (마감 직후 저장된 봉의 거래량 보정)
+    start = (
+        datetime.strptime(newest, "%Y%m%d").date()
+        if newest is not None
+        else target - timedelta(days=INITIAL_DAYS)
+    )
+    end = now_kst().date()
+    overlap = _stored_prices(symbol, newest) if newest is not None else None
+    while True:
+        rows = await _fetch_range(symbol, start, end)
+        if overlap is not None:
+            if _readjusted(overlap, rows, newest):
+                # 저장된 과거 봉이 이전 기준 가격 → 최초 조회 구간부터 다시 받고 과거는 backfill
+                logger.info("🔁 수정주가 변경 감지, 일봉 다시 저장: %s (%s)", symbol, newest)
+                _reset(symbol)
+                overlap = None
+                start = target - timedelta(days=INITIAL_DAYS)
+                end = now_kst().date()
+                continue
+            if any(item["stck_bsop_date"] == newest for item in rows):
+                overlap = None
+        _upsert(symbol, rows, target_str)
+        # 100건을 꽉 채워 받았다면 그 이전 구간이 더 남아 있음
+        if len(rows) < 100:
+            break
+        oldest = min(row["stck_bsop_date"] for row in rows)
+        end = datetime.strptime(oldest, "%Y%m%d").date() - timedelta(days=1)
+        if end < start:
+            break
+
+    _set_meta(symbol, synced_at=time.time())
+
+
+# ✅ 과거 구간 backfill (백그라운드)
+async def backfill(symbol: str, max_pages: int = BACKFILL_MAX_PAGES):
+    _, history_complete = _meta(symbol)
+    oldest, _ = date_range(symbol)
+    if history_complete or oldest is None:
+        return
+
+    end = datetime.strptime(oldest, "%Y%m%d").date() - timedelta(days=1)
+    empty = 0
+    for _ in range(max_pages):
+        start = end - timedelta(days=PAGE_DAYS)
+        rows = await _fetch_range(symbol, start, end)
+        if rows:
+            empty = 0
+            _upsert(symbol, rows, _yyyymmdd(end))
+            end = datetime.strptime(min(row["stck_bsop_date"] for row in rows), "%Y%m%d").date() - timedelta(days=1)
+        else:
+            empty += 1
+            if empty >= BACKFILL_EMPTY_WINDOWS:
+                # 더 이상 과거 데이터가 없음 (상장일 도달)
+                _set_meta(symbol, history_complete=1)
+                return
+            # 거래정지 등으로 빈 구간일 수 있으므로 그 이전 구간 계속 조회
+            end = start - timedelta(days=1)
+        await asyncio.sleep(BACKFILL_PAGE_DELAY)
+
+
+def schedule_backfill(symbol: str):
+    task = _backfill_tasks.get(symbol)
+    if task is not None and not task.done():
+        return
+    if _meta(symbol)[1]:
+        return
+
+    async def run():
+        try:
+            await backfill(symbol)
+        except Exception as e:
+            logger.warning("❌ 일봉 backfill 실패: %s %s", symbol, e)
+        finally:
+            _backfill_tasks.pop(symbol, None)
+
+    # backfill 요청은 사용자 요청보다 뒤로 밀리도록 백그라운드 우선순위로 실행
+    with background():
+        _backfill_tasks[symbol] = asyncio.create_task(run())
+
+
+async def stop_backfills():
+    tasks = list(_backfill_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
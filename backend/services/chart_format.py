@@ -0,0 +1,81 @@
+import json
+import numpy as np
+import msgpack
+
+# 차트 응답 인코딩
+# - rows    : 봉 단위 dict 목록 (기존 형식, [{"time": ..., "open": ...}, ...])
+# - columns : 컬럼 단위 JSON ({"time": [...], "open": [...], ...})
+# - msgpack : 컬럼별 리틀엔디언 배열 바이트를 그대로 담은 MessagePack
+#             (time: int32 YYYYMMDD, 가격/지표: float64 (값 없음 = NaN), volume: int64)
+
+COLUMNS_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+FORMATS = ("rows", "columns", "msgpack")
+
+
+def negotiate_format(fmt: str | None, accept: str | None) -> str:
+    """format 쿼리 파라미터 우선, 없으면 Accept 헤더로 결정"""
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt} ({', '.join(FORMATS)})")
+        return fmt
+    accept = accept or ""
+    if "msgpack" in accept:
+        return "msgpack"
+    if "application/vnd.stockchart.columns+json" in accept:
+        return "columns"
+    return "rows"
+
+
+def time_strings(days: np.ndarray) -> list:
+    return np.char.replace(np.datetime_as_string(days, unit="D"), "-", "").tolist()
+
+
+def time_ints(days: np.ndarray) -> np.ndarray:
+    """datetime64[D] → YYYYMMDD 정수 (벡터 연산)"""
+    years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = days.astype("datetime64[M]")
+    month_no = months.astype(np.int64) % 12 + 1
+    day_no = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return (years * 10000 + month_no * 100 + day_no).astype("<i4")
+
+
+def encode_columns(bars: dict, extra: dict) -> bytes:
+    payload = {
+        "time": time_strings(bars["time"]),
+        "open": bars["open"].tolist(),
+        "high": bars["high"].tolist(),
+        "low": bars["low"].tolist(),
+        "close": bars["close"].tolist(),
+        "volume": bars["volume"].tolist(),
+    }
+    payload.update(extra)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _float_bytes(values) -> bytes:
+    if isinstance(values, np.ndarray):
+        return values.astype("<f8").tobytes()
+    return np.array([np.nan if v is None else v for v in values], dtype="<f8").tobytes()
+
+
+def encode_msgpack(bars: dict, extra: dict) -> bytes:
+    columns = {
+        "time": time_ints(bars["time"]).tobytes(),
+        "open": bars["open"].astype("<f8").tobytes(),
+        "high": bars["high"].astype("<f8").tobytes(),
+        "low": bars["low"].astype("<f8").tobytes(),
+        "close": bars["close"].astype("<f8").tobytes(),
+        "volume": bars["volume"].astype("<i8").tobytes(),
+    }
+    dtypes = {"time": "int32", "volume": "int64"}
+    for key, values in extra.items():
+        columns[key] = _float_bytes(values)
+    return msgpack.packb(
+        {
+            "length": len(bars["time"]),
+            "dtypes": {key: dtypes.get(key, "float64") for key in columns},
+            "columns": columns,
+        },
+        use_bin_type=True,
+    )
@@ -1,27 +1,188 @@
 from .kis_api import fetch_candles
+from . import candle_store
+from .quote_service import fetch_price_output, quote_time
+from .resample import rows_to_arrays, resample
+from .indicators import compute_indicators
+from .chart_format import time_strings
+from ..utils.market_hours import now_kst, is_trading_day, MARKET_OPEN
+from ..core.log import get_logger
+from ..core.profiling import span
+from ..core.cache import mark_stale
 
-# fetch_candles + get_chart_data
-def format_chart_output(raw_data: list):
-    return [
+logger = get_logger(__name__)
+
+# 단위별 기본 조회 개수 (일봉은 최근 3개월치 약 65 거래일, None 이면 전체)
+DEFAULT_LIMITS = {
+    "daily": 65,
+    "weekly": 30,
+    "monthly": 30,
+    "quarterly": None,
+    "yearly": None,
+}
+
+
+# fetch_candles 원본 (최신순) → 컬럼 배열
+def kis_output_to_bars(raw_data: list) -> dict:
+    return rows_to_arrays(
+        [
+            (
+                item["stck_bsop_date"],
+                float(item["stck_oprc"]),
+                float(item["stck_hgpr"]),
+                float(item["stck_lwpr"]),
+                float(item["stck_clpr"]),
+                int(item["acml_vol"]),
+            )
+            for item in reversed(raw_data)
+        ]
+    )
+
+
+# 컬럼 배열 → 차트 응답 (봉 단위 dict 목록, 지표 컬럼이 있으면 같은 봉에 함께 포함)
+def format_bars(bars: dict, extra: dict | None = None):
+    chart = [
         {
-            "time": item["stck_bsop_date"],
-            "open": float(item["stck_oprc"]),
-            "high": float(item["stck_hgpr"]),
-            "low": float(item["stck_lwpr"]),
-            "close": float(item["stck_clpr"]),
-            "volume": int(item["acml_vol"]),
+            "time": day,
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
         }
-        for item in reversed(raw_data)
+        for day, open_, high, low, close, volume in zip(
+            time_strings(bars["time"]),
+            bars["open"].tolist(),
+            bars["high"].tolist(),
+            bars["low"].tolist(),
+            bars["close"].tolist(),
+            bars["volume"].tolist(),
+        )
     ]
+    for key, values in (extra or {}).items():
+        for bar, value in zip(chart, values):
+            bar[key] = value
+    return chart
+
+
+def _tail(columns: dict, limit: int | None) -> dict:
+    if limit is None:
+        return columns
+    return {key: values[-limit:] for key, values in columns.items()}
+
+
+async def _forming_daily_bar(symbol: str) -> tuple | None:
+    """장중 형성 중인 오늘 일봉 (시세 캐시 사용)"""
+    now = now_kst()
+    if not is_trading_day(now.date()) or now.time() < MARKET_OPEN:
+        return None
+    try:
+        output = await fetch_price_output(symbol)
+        return (
+            now.strftime("%Y%m%d"),
+            float(output["stck_oprc"]),
+            float(output["stck_hgpr"]),
+            float(output["stck_lwpr"]),
+            float(output["stck_prpr"]),
+            int(output["acml_vol"]),
+        )
+    except Exception:
+        return None
+
+
+async def sync_daily(symbol: str):
+    """저장소 최신 구간 동기화 (실패해도 저장된 데이터가 있으면 stale 표시 후 계속)"""
+    try:
+        await candle_store.sync_tail(symbol)
+    except Exception as e:
+        age = candle_store.sync_age(symbol)
+        if age == float("inf"):
+            # 한 번도 동기화하지 못한 종목은 내줄 데이터가 없으므로 오류 그대로 응답
+            raise
+        # 업스트림 실패 시에도 저장된 데이터는 그대로 제공 (stale 표시)
+        logger.warning("❌ 일봉 동기화 실패: %s %s", symbol, e)
+        mark_stale("candle_sync", age)
+
 
+# ✅ 차트 원본 데이터 버전 (저장된 일봉 + 형성 중인 봉) 과 마지막 변경 시각
+async def chart_version(symbol: str) -> tuple:
+    """
+    동기화까지 마친 뒤 계산하므로 이후 get_chart_columns(..., sync=False) 와 같은 데이터 기준
+    동기화 시각은 넣지 않음 → 바뀐 봉이 없으면 동기화 후에도 ETag 유지
+    """
+    await sync_daily(symbol)
+    version = candle_store.data_version(symbol)
+    forming = await _forming_daily_bar(symbol)
+    last_modified = candle_store.changed_at(symbol) or None
+    if forming:
+        last_modified = max(last_modified or 0.0, quote_time(symbol) or 0.0) or None
+    return (version, forming), last_modified
 
-def get_chart_data(symbol: str, timeframe: str):
-    output = fetch_candles(symbol, timeframe)
-    if not output:
-        return []
 
-    # 일봉일 경우 최근 3개월치만 자르기 (약 65 거래일)
+# ✅ 저장소 일봉 (+ 장중 형성 중인 봉) 배열
+async def load_daily_bars(symbol: str, limit: int | None = None, sync: bool = True) -> dict:
+    if sync:
+        await sync_daily(symbol)
+
+    with span("store"):
+        rows = candle_store.load_daily(symbol, limit)
+    if rows:
+        candle_store.schedule_backfill(symbol)
+
+    forming = await _forming_daily_bar(symbol)
+    if forming and (not rows or forming[0] > rows[-1][0]):
+        rows.append(forming)
+        if limit is not None:
+            rows = rows[-limit:]
+    return rows_to_arrays(rows)
+
+
+def validate_timeframe(timeframe: str):
+    """지원하지 않는 차트 단위면 ValueError (라우트에서 400)"""
+    if timeframe not in DEFAULT_LIMITS:
+        raise ValueError(f"지원하지 않는 차트 단위: {timeframe} ({', '.join(DEFAULT_LIMITS)})")
+
+
+async def get_chart_bars(
+    symbol: str, timeframe: str, limit: int | None = None, sync: bool = True
+) -> dict:
+    """단위별 OHLCV 컬럼 배열 (주/월/분기/년봉은 일봉에서 계산, limit=None 이면 전체 이력)"""
     if timeframe == "daily":
-        output = output[-65:]
+        return await load_daily_bars(symbol, limit, sync)
+    daily = await load_daily_bars(symbol, sync=sync)
+    with span("resample"):
+        return _tail(resample(daily, timeframe), limit)
+
+
+async def get_chart_columns(
+    symbol: str, timeframe: str, limit: int | None = None, indicators: tuple = (), sync: bool = True
+) -> tuple:
+    """
+    (OHLCV 컬럼 배열, 지표 컬럼) - 응답 형식(행/컬럼/바이너리)과 무관한 차트 데이터
+    sync=False 는 chart_version 으로 이미 동기화한 경우
+    """
+    validate_timeframe(timeframe)
+    limit = limit or DEFAULT_LIMITS[timeframe]
+
+    if indicators:
+        # 지표는 앞 구간이 있어야 값이 나오므로 전체 이력으로 계산한 뒤 잘라서 반환
+        bars = await get_chart_bars(symbol, timeframe, sync=sync)
+        with span("indicators"):
+            columns = compute_indicators((symbol, timeframe), bars, indicators)
+        bars, columns = _tail(bars, limit), _tail(columns, limit)
+    else:
+        bars = await get_chart_bars(symbol, timeframe, limit, sync)
+        columns = {}
+
+    # 저장소가 비어 있으면 (동기화 실패 등) KIS 주/월봉 조회로 대체
+    if not len(bars["time"]) and timeframe in ("weekly", "monthly"):
+        output = await fetch_candles(symbol, timeframe)
+        if output:
+            return kis_output_to_bars(output), {}
+    return bars, columns
+
 
-    return format_chart_output(output)
+async def get_chart_data(
+    symbol: str, timeframe: str, limit: int | None = None, indicators: tuple = ()
+):
+    bars, columns = await get_chart_columns(symbol, timeframe, limit, indicators)
+    return format_bars(bars, columns)
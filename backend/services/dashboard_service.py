@@ -0,0 +1,51 @@
+import asyncio
+from .chart_service import get_chart_data
+from .quote_service import fetch_price_output, build_stock_summary
+from .volatility_service import build_volatility
+from .supply_service import build_supply_risk
+from .financial_service import get_financial_ratios
+from .profitability_service import get_profitability_ratios
+
+# 종목 대시보드 (요약 + 차트 + 리스크 점수 4종) 를 한 번에 조회
+# - inquire-price 는 한 번만 호출해서 요약/변동성/수급에 함께 사용
+# - 나머지 업스트림 호출(캔들/안정성/수익성)은 동시에 실행
+# - 일부 섹션이 실패해도 나머지 결과는 그대로 반환 (errors 에 실패 사유 기록)
+
+
+async def get_dashboard(symbol: str, timeframe: str = "daily", indicators: tuple = ()) -> dict:
+    price, chart, financial, profitability = await asyncio.gather(
+        fetch_price_output(symbol),
+        get_chart_data(symbol, timeframe, indicators=indicators),
+        get_financial_ratios(symbol),
+        get_profitability_ratios(symbol),
+        return_exceptions=True,
+    )
+
+    result = {"symbol": symbol, "timeframe": timeframe, "errors": {}}
+
+    def section(name: str, value):
+        if isinstance(value, BaseException):
+            result[name] = None
+            result["errors"][name] = str(value)
+        else:
+            result[name] = value
+
+    # 시세 기반 섹션 (요약/변동성/수급)
+    if isinstance(price, BaseException):
+        for name in ("summary", "volatility", "supply_risk"):
+            section(name, price)
+    else:
+        for name, build in (
+            ("summary", build_stock_summary),
+            ("volatility", build_volatility),
+            ("supply_risk", build_supply_risk),
+        ):
+            try:
+                section(name, build(symbol, price))
+            except Exception as e:
+                section(name, e)
+
+    section("chart", chart)
+    section("financial", financial)
+    section("profitability", profitability)
+    return result
@@ -0,0 +1,400 @@
+import math
+import re
+from collections import OrderedDict, deque
+import numpy as np
+
+# 기술적 지표 계산 (SMA / EMA / 볼린저밴드 / RSI / MACD)
+# - 전체 구간은 NumPy 벡터 연산으로 한 번에 계산
+# - 계산이 끝난 상태(윈도우 합계, 마지막 EMA 값 등)를 보관해서 새 봉이 붙으면 O(1) 로 갱신
+# - 마지막 봉은 장중에 계속 바뀌므로 상태에 반영하지 않고 미리보기(peek)로만 계산
+
+DEFAULT_PERIODS = (5, 20, 60, 120)
+MAX_PERIOD = 250
+# 종목/단위/지표 조합별로 보관할 상태 개수
+MAX_CACHED_SERIES = 512
+
+
+# ✅ 벡터 연산 도우미
+def _ema_tail(x: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+    """seed 다음부터의 EMA: y_k = (1-a)^(k+1)·seed + a·Σ(1-a)^(k-j)·x_j 를 블록 단위 닫힌 식으로 계산"""
+    out = np.empty(len(x))
+    if len(x) == 0:
+        return out
+    decay = 1.0 - alpha
+    # (1-a)^-block 이 1e12 를 넘지 않도록 블록 크기 결정 (정밀도 유지)
+    block = int(min(256, max(1, 12 * math.log(10) / -math.log(decay)))) if decay > 0 else 1
+    steps = np.arange(block)
+    inv = decay ** -steps
+    fwd = decay ** steps
+    prev = seed
+    for start in range(0, len(x), block):
+        chunk = x[start : start + block]
+        m = len(chunk)
+        acc = np.cumsum(chunk * inv[:m]) * alpha
+        y = fwd[:m] * decay * prev + fwd[:m] * acc
+        out[start : start + m] = y
+        prev = y[-1]
+    return out
+
+
+def _seeded_ema(x: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    """처음 period 개의 단순평균을 시작값으로 하는 EMA (그 전 구간은 NaN)"""
+    out = np.full(len(x), np.nan)
+    if len(x) < period:
+        return out
+    seed = x[:period].mean()
+    out[period - 1] = seed
+    out[period:] = _ema_tail(x[period:], alpha, seed)
+    return out
+
+
+def _nan_to_none(value: float):
+    return None if value is None or math.isnan(value) else float(value)
+
+
+# ✅ 증분 계산용 상태
+class _EmaState:
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.seed_sum = 0.0
+        self.value = math.nan
+
+    def load(self, x: np.ndarray, ema: np.ndarray):
+        self.count = len(x)
+        self.seed_sum = float(x.sum()) if len(x) < self.period else 0.0
+        self.value = float(ema[-1]) if len(ema) else math.nan
+
+    def peek(self, v: float) -> float:
+        count = self.count + 1
+        if count < self.period:
+            return math.nan
+        if count == self.period:
+            return (self.seed_sum + v) / self.period
+        return self.alpha * v + (1 - self.alpha) * self.value
+
+    def push(self, v: float):
+        value = self.peek(v)
+        self.count += 1
+        if self.count < self.period:
+            self.seed_sum += v
+        self.value = value
+
+
+class _Window:
+    """최근 period-1 개 값 (새 값과 합쳐서 period 개 윈도우를 구성)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=max(period - 1, 1))
+        self.total = 0.0
+
+    def load(self, x: np.ndarray):
+        self.values.clear()
+        tail = x[-(self.period - 1) :] if self.period > 1 else x[:0]
+        self.values.extend(tail.tolist())
+        self.total = float(tail.sum())
+
+    def full(self) -> bool:
+        return len(self.values) >= self.period - 1
+
+    def push(self, v: float):
+        if self.period == 1:
+            return
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(v)
+        self.total += v
+
+
+# ✅ 지표 정의
+class SMA:
+    def __init__(self, period: int):
+        self.period = period
+        self.keys = (f"sma{period}",)
+        self.window = _Window(period)
+
+    def compute(self, close: np.ndarray) -> dict:
+        out = np.full(len(close), np.nan)
+        n = self.period
+        if len(close) >= n:
+            csum = np.concatenate(([0.0], np.cumsum(close)))
+            out[n - 1 :] = (csum[n:] - csum[:-n]) / n
+        self.window.load(close)
+        return {self.keys[0]: out}
+
+    def peek(self, v: float) -> dict:
+        if not self.window.full():
+            return {self.keys[0]: math.nan}
+        return {self.keys[0]: (self.window.total + v) / self.period}
+
+    def push(self, v: float):
+        self.window.push(v)
+
+
+class EMA:
+    def __init__(self, period: int):
+        self.period = period
+        self.keys = (f"ema{period}",)
+        self.state = _EmaState(period, 2 / (period + 1))
+
+    def compute(self, close: np.ndarray) -> dict:
+        out = _seeded_ema(close, self.period, self.state.alpha)
+        self.state.load(close, out)
+        return {self.keys[0]: out}
+
+    def peek(self, v: float) -> dict:
+        return {self.keys[0]: self.state.peek(v)}
+
+    def push(self, v: float):
+        self.state.push(v)
+
+
+class Bollinger:
+    def __init__(self, period: int = 20, width: float = 2.0):
+        self.period = period
+        self.width = width
+        self.keys = ("bb_upper", "bb_middle", "bb_lower")
+        self.window = _Window(period)
+
+    def compute(self, close: np.ndarray) -> dict:
+        n = len(close)
+        mid = np.full(n, np.nan)
+        std = np.full(n, np.nan)
+        if n >= self.period:
+            windows = np.lib.stride_tricks.sliding_window_view(close, self.period)
+            mid[self.period - 1 :] = windows.mean(axis=1)
+            std[self.period - 1 :] = windows.std(axis=1)
+        self.window.load(close)
+        return {
+            "bb_upper": mid + self.width * std,
+            "bb_middle": mid,
+            "bb_lower": mid - self.width * std,
+        }
+
+    def peek(self, v: float) -> dict:
+        if not self.window.full():
+            return dict.fromkeys(self.keys, math.nan)
+        values = np.fromiter(self.window.values, dtype=np.float64, count=len(self.window.values))
+        values = np.append(values, v)
+        mid, std = values.mean(), values.std()
+        return {
+            "bb_upper": mid + self.width * std,
+            "bb_middle": mid,
+            "bb_lower": mid - self.width * std,
+        }
+
+    def push(self, v: float):
+        self.window.push(v)
+
+
+class RSI:
+    """Wilder 방식 RSI (첫 period 개 변화량의 평균으로 시작)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.keys = (f"rsi{period}",)
+        self.gain = _EmaState(period, 1 / period)
+        self.loss = _EmaState(period, 1 / period)
+        self.prev_close = math.nan
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        return np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), rsi)
+
+    def compute(self, close: np.ndarray) -> dict:
+        out = np.full(len(close), np.nan)
+        diff = np.diff(close)
+        gains = np.clip(diff, 0, None)
+        losses = np.clip(-diff, 0, None)
+        avg_gain = _seeded_ema(gains, self.period, self.gain.alpha)
+        avg_loss = _seeded_ema(losses, self.period, self.loss.alpha)
+        if len(diff):
+            out[1:] = self._rsi(avg_gain, avg_loss)
+        self.gain.load(gains, avg_gain)
+        self.loss.load(losses, avg_loss)
+        self.prev_close = float(close[-1]) if len(close) else math.nan
+        return {self.keys[0]: out}
+
+    def peek(self, v: float) -> dict:
+        if math.isnan(self.prev_close):
+            return {self.keys[0]: math.nan}
+        diff = v - self.prev_close
+        avg_gain = self.gain.peek(max(diff, 0.0))
+        avg_loss = self.loss.peek(max(-diff, 0.0))
+        return {self.keys[0]: float(self._rsi(np.float64(avg_gain), np.float64(avg_loss)))}
+
+    def push(self, v: float):
+        if not math.isnan(self.prev_close):
+            diff = v - self.prev_close
+            self.gain.push(max(diff, 0.0))
+            self.loss.push(max(-diff, 0.0))
+        self.prev_close = v
+
+
+class MACD:
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.keys = ("macd", "macd_signal", "macd_hist")
+        self.fast = _EmaState(fast, 2 / (fast + 1))
+        self.slow = _EmaState(slow, 2 / (slow + 1))
+        self.signal = _EmaState(signal, 2 / (signal + 1))
+
+    def compute(self, close: np.ndarray) -> dict:
+        fast = _seeded_ema(close, self.fast.period, self.fast.alpha)
+        slow = _seeded_ema(close, self.slow.period, self.slow.alpha)
+        macd = fast - slow
+        signal = np.full(len(close), np.nan)
+        valid = ~np.isnan(macd)
+        signal[valid] = _seeded_ema(macd[valid], self.signal.period, self.signal.alpha)
+        self.fast.load(close, fast)
+        self.slow.load(close, slow)
+        self.signal.load(macd[valid], signal[valid])
+        return {"macd": macd, "macd_signal": signal, "macd_hist": macd - signal}
+
+    def _next(self, v: float):
+        macd = self.fast.peek(v) - self.slow.peek(v)
+        signal = math.nan if math.isnan(macd) else self.signal.peek(macd)
+        return macd, signal
+
+    def peek(self, v: float) -> dict:
+        macd, signal = self._next(v)
+        return {"macd": macd, "macd_signal": signal, "macd_hist": macd - signal}
+
+    def push(self, v: float):
+        macd, _ = self._next(v)
+        self.fast.push(v)
+        self.slow.push(v)
+        if not math.isnan(macd):
+            self.signal.push(macd)
+
+
+# ✅ indicators= 파라미터 해석 (ex. "sma20,ema60,bb,rsi,macd")
+_NAME_PATTERN = re.compile(r"^(sma|ema|rsi|bb)(\d*)$")
+
+
+def parse_indicators(spec: str | None) -> tuple:
+    if not spec:
+        return ()
+    names = []
+    for raw in spec.split(","):
+        name = raw.strip().lower()
+        if not name:
+            continue
+        if name in ("sma", "ema"):
+            names.extend(f"{name}{p}" for p in DEFAULT_PERIODS)
+            continue
+        if name == "macd":
+            names.append(name)
+            continue
+        match = _NAME_PATTERN.match(name)
+        if not match:
+            raise ValueError(f"지원하지 않는 지표: {raw.strip()}")
+        period = int(match.group(2) or (20 if match.group(1) == "bb" else 14))
+        if not 2 <= period <= MAX_PERIOD:
+            raise ValueError(f"지표 기간은 2~{MAX_PERIOD} 사이여야 합니다: {raw.strip()}")
+        names.append(f"{match.group(1)}{period}")
+    return tuple(dict.fromkeys(names))
+
+
+def _build(name: str):
+    if name == "macd":
+        return MACD()
+    kind, period = _NAME_PATTERN.match(name).groups()
+    return {"sma": SMA, "ema": EMA, "rsi": RSI, "bb": Bollinger}[kind](int(period))
+
+
+class IndicatorSet:
+    def __init__(self, names: tuple):
+        self.items = [_build(name) for name in names]
+        self.keys = [key for item in self.items for key in item.keys]
+
+    def compute(self, close: np.ndarray) -> dict:
+        columns = {}
+        for item in self.items:
+            columns.update(item.compute(close))
+        return columns
+
+    def peek(self, v: float) -> dict:
+        values = {}
+        for item in self.items:
+            values.update(item.peek(v))
+        return values
+
+    def push(self, v: float) -> dict:
+        values = self.peek(v)
+        for item in self.items:
+            item.push(v)
+        return values
+
+
+# ✅ 종목/단위별 증분 계산 상태
+class _Series:
+    def __init__(self, names: tuple):
+        self.names = names
+        self.indicators = IndicatorSet(names)
+        self.times: list = []
+        self.columns: dict = {}
+        # 처음 / 마지막 종가 - 수정주가 재계산(액면분할 등)으로 과거 가격이 바뀐 경우 감지
+        self.first_close = None
+        self.last_close = None
+
+    def matches(self, times: np.ndarray, close: np.ndarray) -> bool:
+        count = len(self.times)
+        return (
+            0 < count < len(times)
+            and times[0] == self.times[0]
+            and times[count - 1] == self.times[-1]
+            and float(close[0]) == self.first_close
+            and float(close[count - 1]) == self.last_close
+        )
+
+    def rebuild(self, times: np.ndarray, close: np.ndarray):
+        self.indicators = IndicatorSet(self.names)
+        self.times = list(times)
+        self.columns = {k: v.tolist() for k, v in self.indicators.compute(close).items()}
+        if len(close):
+            self.first_close = float(close[0])
+            self.last_close = float(close[-1])
+
+    def push(self, time, v: float):
+        self.times.append(time)
+        self.last_close = v
+        for key, value in self.indicators.push(v).items():
+            self.columns[key].append(value)
+
+
+_series: OrderedDict = OrderedDict()
+
+
+def compute_indicators(cache_key, bars: dict, names: tuple) -> dict:
+    """
+    bars(오름차순 OHLCV 배열) 에 맞춰 지표 컬럼을 반환 (NaN 은 None)
+    마지막 봉을 제외한 구간은 상태로 보관 → 다음 호출 때 새로 붙은 봉만 O(1) 로 갱신
+    """
+    times = bars["time"]
+    close = bars["close"]
+    if len(close) == 0:
+        return {}
+
+    key = (cache_key, names)
+    series = _series.get(key)
+    if series is None:
+        series = _Series(names)
+    if series.matches(times, close):
+        for i in range(len(series.times), len(close) - 1):
+            series.push(times[i], float(close[i]))
+    else:
+        series.rebuild(times[:-1], close[:-1])
+    _series[key] = series
+    _series.move_to_end(key)
+    while len(_series) > MAX_CACHED_SERIES:
+        _series.popitem(last=False)
+
+    last = series.indicators.peek(float(close[-1]))
+    return {
+        k: [_nan_to_none(v) for v in values] + [_nan_to_none(last[k])]
+        for k, values in series.columns.items()
+    }
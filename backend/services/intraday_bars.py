@@ -0,0 +1,143 @@
+import os
+from functools import lru_cache
+import numpy as np
+
+# 실시간 체결 → 분봉 (1 / 5 / 30분)
+# - 종목 · 단위별로 고정 크기 배열을 링 버퍼로 사용 (가득 차면 가장 오래된 봉부터 덮어씀)
+# - 마지막 칸이 형성 중인 봉이고, 다음 구간 체결이 들어오면 새 칸으로 넘어가면서 이전 봉이 확정됨
+# - 봉 시각은 KST 벽시계 기준 1970-01-01 00:00 부터의 분 (datetime64[m] 로 바로 변환 가능)
+
+INTERVALS = (1, 5, 30)
+# 단위별 보관 봉 개수 (1분봉 기준 정규장 390개 + 여유)
+CAPACITY = int(os.getenv("INTRADAY_BAR_CAPACITY", "512"))
+
+
+class RingBars:
+    def __init__(self, interval: int, capacity: int = CAPACITY):
+        self.interval = interval
+        self.capacity = capacity
+        self.start = np.zeros(capacity, dtype=np.int64)
+        self.open = np.zeros(capacity)
+        self.high = np.zeros(capacity)
+        self.low = np.zeros(capacity)
+        self.close = np.zeros(capacity)
+        self.volume = np.zeros(capacity, dtype=np.int64)
+        self.count = 0  # 지금까지 만든 봉 수
+
+    def update(self, minute: int, price: float, volume: int) -> tuple:
+        """
+        체결 1건 반영 → (확정된 이전 봉 칸 또는 None, 갱신된 봉 칸 또는 None)
+        이미 지나간 구간의 체결(늦게 도착한 체결)은 무시
+        """
+        bucket = minute - minute % self.interval
+        if self.count:
+            i = (self.count - 1) % self.capacity
+            last = self.start[i]
+            if bucket == last:
+                if price > self.high[i]:
+                    self.high[i] = price
+                if price < self.low[i]:
+                    self.low[i] = price
+                self.close[i] = price
+                self.volume[i] += volume
+                return None, i
+            if bucket < last:
+                return None, None
+            closed = i
+        else:
+            closed = None
+
+        i = self.count % self.capacity
+        self.start[i] = bucket
+        self.open[i] = self.high[i] = self.low[i] = self.close[i] = price
+        self.volume[i] = volume
+        self.count += 1
+        return closed, i
+
+    def bar(self, i: int) -> dict:
+        return {
+            "time": minute_strings(self.start[i : i + 1])[0],
+            "open": float(self.open[i]),
+            "high": float(self.high[i]),
+            "low": float(self.low[i]),
+            "close": float(self.close[i]),
+            "volume": int(self.volume[i]),
+        }
+
+    def snapshot(self, limit: int | None = None) -> dict:
+        """오래된 봉 → 최신 봉 순서의 컬럼 배열 (복사본)"""
+        n = min(self.count, self.capacity)
+        if limit is not None:
+            n = min(n, limit)
+        idx = np.arange(self.count - n, self.count) % self.capacity
+        return {
+            "time": self.start[idx],
+            "open": self.open[idx],
+            "high": self.high[idx],
+            "low": self.low[idx],
+            "close": self.close[idx],
+            "volume": self.volume[idx],
+        }
+
+
+def minute_strings(minutes: np.ndarray) -> list:
+    """KST 분 → "YYYYMMDDHHMM" """
+    text = np.datetime_as_string(minutes.astype("datetime64[m]"), unit="m")
+    return [t.replace("-", "").replace("T", "").replace(":", "") for t in text.tolist()]
+
+
+@lru_cache(maxsize=64)
+def _day_minute(date: str) -> int:
+    return int(np.datetime64(f"{date[:4]}-{date[4:6]}-{date[6:]}", "D").astype(np.int64)) * 1440
+
+
+def tick_minute(tick: dict) -> int:
+    time = tick["time"]
+    return _day_minute(tick["date"]) + int(time[:2]) * 60 + int(time[2:4])
+
+
+_bars: dict[str, dict[int, RingBars]] = {}
+
+
+# ✅ 체결 반영 → 갱신된 봉 메시지 목록 (확정된 봉이 있으면 먼저)
+def on_tick(tick: dict) -> list:
+    symbol = tick["symbol"]
+    rings = _bars.get(symbol)
+    if rings is None:
+        rings = _bars[symbol] = {interval: RingBars(interval) for interval in INTERVALS}
+
+    minute = tick_minute(tick)
+    messages = []
+    for interval, ring in rings.items():
+        closed, current = ring.update(minute, float(tick["price"]), int(tick["volume"]))
+        if closed is not None:
+            messages.append((interval, ring.bar(closed), True))
+        if current is not None:
+            messages.append((interval, ring.bar(current), False))
+    return messages
+
+
+def get_bars(symbol: str, interval: int, limit: int | None = None) -> dict | None:
+    rings = _bars.get(symbol)
+    if rings is None:
+        return None
+    return rings[interval].snapshot(limit)
+
+
+def drop(symbol: str):
+    """실시간 구독이 끝난 종목의 분봉 정리 (이후 구간이 비므로 보관하지 않음)"""
+    _bars.pop(symbol, None)
+
+
+def format_minute_bars(bars: dict) -> list:
+    return [
+        {"time": time, "open": open_, "high": high, "low": low, "close": close, "volume": volume}
+        for time, open_, high, low, close, volume in zip(
+            minute_strings(bars["time"]),
+            bars["open"].tolist(),
+            bars["high"].tolist(),
+            bars["low"].tolist(),
+            bars["close"].tolist(),
+            bars["volume"].tolist(),
+        )
+    ]
@@ -0,0 +1,190 @@
+import os
+import json
+import time
+import asyncio
+
+from ..core.db import get_connection
+from ..core.scheduler import background
+from ..core.log import get_logger
+from ..utils.market_hours import is_market_open, seconds_until_next_open
+from ..utils.popularity import symbol_popularity
+from . import candle_store, ratio_store
+from .quote_service import quote_cache, quote_ttl, fetch_price_output
+
+logger = get_logger(__name__)
+
+# 인기 종목 미리 조회 (캐시 예열)
+# - 사용자 요청 빈도(감소하는 LFU) 상위 N 종목의 시세 / 일봉 / 재무비율을 미리 조회
+# - 사용자 요청과 같은 캐시 / 저장소를 거치므로 이후 요청은 업스트림 호출 없이 응답
+# - 서버 시작 시, 정규장 시작 직후, 일정 주기마다 실행 (백그라운드 우선순위)
+# - 1회 실행당 업스트림 요청 수 예산을 넘지 않도록 이미 따뜻한 항목은 건너뜀
+# - 시세는 캐시 유지 시간이 주기보다 짧으면(장중 3초) 다음 요청 전에 만료되므로 미리 조회하지 않음
+# - 조회 빈도는 로컬 저장소에 저장해서 재시작 후에도 유지
+
+# 미리 조회할 상위 종목 수
+TOP_N = int(os.getenv("PREFETCH_TOP_N", "20"))
+# 1회 실행당 최대 업스트림 요청 수 (추정)
+BUDGET = int(os.getenv("PREFETCH_BUDGET", "60"))
+# 주기 (초)
+INTERVAL = float(os.getenv("PREFETCH_INTERVAL", "300"))
+# 동시에 조회하는 종목 수
+CONCURRENCY = int(os.getenv("PREFETCH_CONCURRENCY", "2"))
+# 정규장 시작 후 실행까지 대기 (초, 시작 직후 시세가 반영되도록)
+OPEN_DELAY = float(os.getenv("PREFETCH_OPEN_DELAY", "5"))
+# 서버 시작 시 자동 실행 여부
+AUTOSTART = os.getenv("PREFETCH_AUTOSTART", "1") == "1"
+
+_status = {
+    "runs": 0,
+    "last_started_at": None,
+    "last_finished_at": None,
+    "last_symbols": [],
+    "last_requests": 0,
+    "last_errors": 0,
+    "skipped_budget": 0,
+}
+_loop_task: asyncio.Task | None = None
+_run_task: asyncio.Task | None = None
+
+
+def _db():
+    conn = get_connection()
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS symbol_popularity (id INTEGER PRIMARY KEY, data TEXT NOT NULL, saved_at REAL NOT NULL)"
+    )
+    return conn
+
+
+def load_popularity():
+    row = _db().execute("SELECT data, saved_at FROM symbol_popularity WHERE id = 1").fetchone()
+    if row:
+        symbol_popularity.load(json.loads(row[0]), row[1])
+
+
+def save_popularity():
+    conn = _db()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO symbol_popularity VALUES (1, ?, ?)",
+            (json.dumps(symbol_popularity.items()), time.time()),
+        )
+
+
+def _cold_loaders(symbol: str) -> list:
+    """아직 캐시 / 저장소에 없는(또는 만료된) 항목의 조회 함수 목록"""
+    loaders = []
+    if quote_ttl() >= INTERVAL and not quote_cache.contains(symbol):
+        loaders.append(lambda: fetch_price_output(symbol))
+    if not candle_store.is_synced(symbol):
+        loaders.append(lambda: candle_store.sync_tail(symbol))
+    for kind in ratio_store.RATIO_TR_IDS:
+        if not ratio_store.is_fresh(symbol, kind):
+            loaders.append(lambda kind=kind: ratio_store.revalidate(symbol, kind))
+    return loaders
+
+
+async def _prefetch_symbol(symbol: str, loaders: list):
+    results = await asyncio.gather(*(loader() for loader in loaders), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        _status["last_errors"] += len(errors)
+        logger.warning("❌ 미리 조회 실패: %s %s", symbol, errors[0])
+
+
+async def run_prefetch(top_n: int = TOP_N, budget: int = BUDGET):
+    """인기 상위 종목 중 식은 항목만 예산 안에서 조회"""
+    _status.update(
+        runs=_status["runs"] + 1, last_started_at=time.time(), last_errors=0, skipped_budget=0
+    )
+    symbols = [symbol for symbol, _ in symbol_popularity.top(top_n)]
+
+    # 인기 순서대로 예산을 배정 (1개 항목 = 업스트림 요청 1건으로 추정)
+    plan = []
+    spent = 0
+    for symbol in symbols:
+        loaders = _cold_loaders(symbol)
+        if not loaders:
+            continue
+        if spent + len(loaders) > budget:
+            _status["skipped_budget"] += 1
+            continue
+        spent += len(loaders)
+        plan.append((symbol, loaders))
+
+    pending = iter(plan)
+
+    async def worker():
+        for symbol, loaders in pending:
+            await _prefetch_symbol(symbol, loaders)
+
+    await asyncio.gather(*(worker() for _ in range(max(CONCURRENCY, 1))))
+    _status.update(
+        last_finished_at=time.time(),
+        last_symbols=[symbol for symbol, _ in plan],
+        last_requests=spent,
+    )
+    save_popularity()
+
+
+def start_prefetch() -> bool:
+    """진행 중인 미리 조회가 없으면 새로 시작 (시작했으면 True)"""
+    global _run_task
+    if _run_task is not None and not _run_task.done():
+        return False
+    # 사용자 요청보다 뒤로 밀리도록 백그라운드 우선순위로 실행
+    with background():
+        _run_task = asyncio.create_task(run_prefetch())
+    return True
+
+
+def _next_delay() -> float:
+    """다음 주기와 다음 정규장 시작 중 빠른 쪽까지 대기"""
+    delay = INTERVAL
+    if not is_market_open():
+        delay = min(delay, seconds_until_next_open() + OPEN_DELAY)
+    return max(delay, 1.0)
+
+
+async def _prefetch_loop():
+    while True:
+        start_prefetch()
+        try:
+            await _run_task
+        except Exception as e:
+            logger.error("❌ 미리 조회 실패: %s", e)
+        await asyncio.sleep(_next_delay())
+
+
+def start_prefetcher():
+    """저장된 조회 빈도 복원 후 PREFETCH_AUTOSTART=1 이면 주기 실행 시작"""
+    global _loop_task
+    try:
+        load_popularity()
+    except Exception as e:
+        logger.warning("❌ 조회 빈도 복원 실패: %s", e)
+    if AUTOSTART and (_loop_task is None or _loop_task.done()):
+        _loop_task = asyncio.create_task(_prefetch_loop())
+
+
+async def stop_prefetcher():
+    tasks = [task for task in (_loop_task, _run_task) if task is not None]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        save_popularity()
+    except Exception as e:
+        logger.warning("❌ 조회 빈도 저장 실패: %s", e)
+
+
+def prefetch_status(top: int = TOP_N) -> dict:
+    return {
+        "top_n": TOP_N,
+        "budget": BUDGET,
+        "interval": INTERVAL,
+        **_status,
+        "tracked": len(symbol_popularity),
+        "popular": [
+            {"symbol": symbol, "score": round(score, 3)} for symbol, score in symbol_popularity.top(top)
+        ],
+    }
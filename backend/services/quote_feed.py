@@ -0,0 +1,263 @@
+import os
+import json
+import random
+import asyncio
+from typing import Callable
+
+import websockets
+
+from ..core import token_manager
+from ..core.log import get_logger
+from ..utils.market_hours import now_kst
+
+logger = get_logger(__name__)
+
+# 실시간 체결가 피드
+# - FeedSource 를 구현한 객체가 종목별 체결(tick)을 publish 콜백으로 전달
+# - KisFeedSource: 한국투자증권 실시간 체결가 (H0STCNT0) 웹소켓
+# - SimulatedFeedSource: 로컬 랜덤워크 체결 생성기 (개발 / 테스트용, QUOTE_FEED=simulated)
+
+KIS_WS_URL = os.getenv("KIS_WS_URL", "ws://ops.koreainvestment.com:21000")
+EXECUTION_TR_ID = "H0STCNT0"
+# 웹소켓 세션 1개당 실시간 등록 가능 종목 수
+KIS_WS_MAX_SUBSCRIPTIONS = int(os.getenv("KIS_WS_MAX_SUBSCRIPTIONS", "41"))
+# 잘못된 프레임 경고 로그 간격 (N건마다 1번)
+BAD_FRAME_LOG_EVERY = int(os.getenv("QUOTE_BAD_FRAME_LOG_EVERY", "100"))
+# 시뮬레이터 체결 간격 (초)
+SIM_INTERVAL = float(os.getenv("QUOTE_SIM_INTERVAL", "0.5"))
+
+
+class FeedLimitError(Exception):
+    """업스트림 실시간 등록 한도 초과"""
+
+
+class FeedSource:
+    """실시간 체결 피드 인터페이스"""
+
+    max_symbols: int | None = None
+
+    async def start(self, publish: Callable[[dict], None]):
+        raise NotImplementedError
+
+    async def subscribe(self, symbol: str):
+        raise NotImplementedError
+
+    async def unsubscribe(self, symbol: str):
+        raise NotImplementedError
+
+    async def stop(self):
+        raise NotImplementedError
+
+
+# ✅ KIS 실시간 체결 데이터 파싱
+# "0|H0STCNT0|002|필드0^필드1^...^필드45^필드0^..." (건수만큼 필드 묶음이 이어짐)
+# 형식이 잘못된 프레임(잘림, 숫자 아님 등)은 ValueError / IndexError / ZeroDivisionError
+def parse_execution_frame(raw: str) -> list:
+    parts = raw.split("|", 3)
+    if len(parts) < 4 or parts[1] != EXECUTION_TR_ID:
+        return []
+    count = int(parts[2])
+    fields = parts[3].split("^")
+    width = len(fields) // count
+    date = now_kst().strftime("%Y%m%d")
+
+    ticks = []
+    for i in range(count):
+        f = fields[i * width : (i + 1) * width]
+        ticks.append(
+            {
+                "symbol": f[0],
+                "date": date,
+                "time": f[1],  # HHMMSS
+                "price": int(f[2]),
+                "change": int(f[4]),
+                "change_rate": float(f[5]),
+                "open": int(f[7]),
+                "high": int(f[8]),
+                "low": int(f[9]),
+                "volume": int(f[12]),  # 체결 거래량
+                "acml_vol": int(f[13]),  # 누적 거래량
+            }
+        )
+    return ticks
+
+
+class KisFeedSource(FeedSource):
+    max_symbols = KIS_WS_MAX_SUBSCRIPTIONS
+
+    def __init__(self, url: str = KIS_WS_URL):
+        self.url = url
+        self._symbols: set[str] = set()
+        self._publish: Callable[[dict], None] | None = None
+        self._approval_key: str | None = None
+        self._ws = None
+        self._task: asyncio.Task | None = None
+        self.bad_frames = 0
+
+    async def start(self, publish):
+        self._publish = publish
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        # 연결이 끊기면 점점 간격을 늘려가며 재접속하고, 등록했던 종목을 다시 등록
+        delay = 1.0
+        while True:
+            try:
+                if self._approval_key is None:
+                    self._approval_key = await token_manager.issue_approval_key()
+                async with websockets.connect(self.url, ping_interval=None) as ws:
+                    self._ws = ws
+                    delay = 1.0
+                    for symbol in list(self._symbols):
+                        await self._send(symbol, "1")
+                    async for raw in ws:
+                        await self._handle(ws, raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("❌ 실시간 시세 연결 끊김: %s", e)
+            finally:
+                self._ws = None
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    def _skip_frame(self, raw: str, error: Exception):
+        """잘못된 프레임 1개만 건너뜀 (연결을 끊으면 모든 종목을 다시 등록해야 하므로)"""
+        self.bad_frames += 1
+        if self.bad_frames % BAD_FRAME_LOG_EVERY == 1:
+            logger.warning("❌ 잘못된 실시간 프레임 건너뜀 (누적 %d건): %s %r", self.bad_frames, error, raw[:80])
+
+    async def _handle(self, ws, raw: str):
+        if raw[:1] in ("0", "1"):
+            try:
+                ticks = parse_execution_frame(raw)
+            except (ValueError, IndexError, ZeroDivisionError) as e:
+                self._skip_frame(raw, e)
+                return
+            for tick in ticks:
+                self._publish(tick)
+            return
+
+        try:
+            message = json.loads(raw)
+        except ValueError as e:
+            self._skip_frame(raw, e)
+            return
+        if not isinstance(message, dict):
+            self._skip_frame(raw, TypeError("JSON 객체가 아님"))
+            return
+        header = message.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            await ws.send(raw)
+            return
+        body = message.get("body", {})
+        if body.get("rt_cd") not in (None, "0"):
+            logger.warning("❌ 실시간 등록 실패: %s %s", header.get("tr_key"), body.get("msg1"))
+            # 접속키 오류면 다음 재접속 때 새로 발급
+            if "approval" in str(body.get("msg1", "")).lower():
+                self._approval_key = None
+
+    async def _send(self, symbol: str, tr_type: str):
+        """tr_type: "1" 등록 / "2" 해제"""
+        if self._ws is None:
+            return
+        await self._ws.send(
+            json.dumps(
+                {
+                    "header": {
+                        "approval_key": self._approval_key,
+                        "custtype": "P",
+                        "tr_type": tr_type,
+                        "content-type": "utf-8",
+                    },
+                    "body": {"input": {"tr_id": EXECUTION_TR_ID, "tr_key": symbol}},
+                }
+            )
+        )
+
+    async def subscribe(self, symbol: str):
+        if symbol in self._symbols:
+            return
+        if len(self._symbols) >= self.max_symbols:
+            raise FeedLimitError(f"실시간 등록 한도({self.max_symbols}종목)를 초과했습니다.")
+        self._symbols.add(symbol)
+        await self._send(symbol, "1")
+
+    async def unsubscribe(self, symbol: str):
+        if symbol in self._symbols:
+            self._symbols.discard(symbol)
+            await self._send(symbol, "2")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+class SimulatedFeedSource(FeedSource):
+    def __init__(self, interval: float = SIM_INTERVAL, seed: int | None = None):
+        self.interval = interval
+        self._random = random.Random(seed)
+        self._state: dict[str, dict] = {}  # 종목 → 시가/고가/저가/현재가/누적 거래량
+        self._publish: Callable[[dict], None] | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self, publish):
+        self._publish = publish
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _tick(self, symbol: str) -> dict:
+        state = self._state[symbol]
+        price = max(1, round(state["price"] * (1 + self._random.gauss(0, 0.002))))
+        volume = self._random.randint(1, 500)
+        state["price"] = price
+        state["high"] = max(state["high"], price)
+        state["low"] = min(state["low"], price)
+        state["acml_vol"] += volume
+        now = now_kst()
+        change = price - state["base"]
+        return {
+            "symbol": symbol,
+            "date": now.strftime("%Y%m%d"),
+            "time": now.strftime("%H%M%S"),
+            "price": price,
+            "change": change,
+            "change_rate": round(change / state["base"] * 100, 2),
+            "open": state["open"],
+            "high": state["high"],
+            "low": state["low"],
+            "volume": volume,
+            "acml_vol": state["acml_vol"],
+        }
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            for symbol in list(self._state):
+                self._publish(self._tick(symbol))
+
+    async def subscribe(self, symbol: str):
+        if symbol not in self._state:
+            base = self._random.randint(100, 1000) * 100
+            self._state[symbol] = {
+                "base": base, "open": base, "high": base, "low": base, "price": base, "acml_vol": 0
+            }
+
+    async def unsubscribe(self, symbol: str):
+        self._state.pop(symbol, None)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+def create_feed_source() -> FeedSource:
+    """QUOTE_FEED 환경변수로 피드 선택 (kis / simulated)"""
+    if os.getenv("QUOTE_FEED", "kis") == "simulated":
+        return SimulatedFeedSource()
+    return KisFeedSource()
@@ -0,0 +1,214 @@
+import os
+import time
+import asyncio
+from collections import deque
+
+from . import intraday_bars
+from .quote_feed import FeedSource, create_feed_source
+
+# 실시간 시세 허브
+# - 종목별 업스트림 구독은 구독자 수와 무관하게 1개 (첫 구독자가 들어올 때 등록, 마지막 구독자가 나가면 해제)
+# - 체결이 들어오면 해당 종목 구독자 모두에게 전달
+# - 클라이언트마다 키(종목)별 최신 메시지 1개만 보관 → 느린 클라이언트는 밀린 체결을 건너뛰고 최신 값만 받음
+# - 체결로 분봉을 갱신하고, 분봉을 요청한 클라이언트에게 형성 중인 봉 / 확정된 봉을 전달
+
+# 분봉 차트 조회 후 클라이언트 구독 없이 실시간 구독을 유지하는 시간 (초)
+RETAIN_SECONDS = float(os.getenv("INTRADAY_RETAIN_SECONDS", "600"))
+
+
+class Subscriber:
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.symbols: set[str] = set()
+        self.bar_intervals: set[int] = set()  # 받을 분봉 단위
+        self._pending: dict = {}  # 키 → 아직 보내지 못한 최신 메시지
+        self._control: deque = deque()  # 구독 응답 / 오류 메시지 (건너뛰지 않음)
+        self._ready = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+
+    def offer(self, key, message: dict):
+        if key in self._pending:
+            self.dropped += 1
+        self._pending[key] = message
+        self._ready.set()
+
+    def send_control(self, message: dict):
+        self._control.append(message)
+        self._ready.set()
+
+    async def run_sender(self):
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self._control:
+                await self.websocket.send_json(self._control.popleft())
+            batch, self._pending = self._pending, {}
+            for message in batch.values():
+                await self.websocket.send_json(message)
+                self.sent += 1
+
+
+class _Retainer(Subscriber):
+    """클라이언트 없이 업스트림 구독만 유지 (분봉 차트를 조회한 종목)"""
+
+    def __init__(self):
+        super().__init__(None)
+        self.expires_at = 0.0
+        self.timer: asyncio.TimerHandle | None = None
+        self.ready = asyncio.Event()  # 업스트림 구독 완료 (성공 / 실패)
+        self.error: Exception | None = None
+
+    def offer(self, key, message: dict):
+        pass
+
+
+class QuoteHub:
+    def __init__(self, source: FeedSource):
+        self.source = source
+        self._subscribers: dict[str, set[Subscriber]] = {}
+        self._last_tick: dict[str, dict] = {}
+        self._retainers: dict[str, _Retainer] = {}
+        self._lock = asyncio.Lock()
+        self._started = False
+        self.ticks = 0
+
+    async def subscribe(self, subscriber: Subscriber, symbol: str):
+        async with self._lock:
+            if not self._started:
+                await self.source.start(self.publish)
+                self._started = True
+            clients = self._subscribers.get(symbol)
+            if clients is None:
+                await self.source.subscribe(symbol)
+                clients = self._subscribers[symbol] = set()
+            clients.add(subscriber)
+            subscriber.symbols.add(symbol)
+
+        # 이미 받은 체결이 있으면 바로 전달
+        last = self._last_tick.get(symbol)
+        if last is not None:
+            subscriber.offer(symbol, {"type": "tick", **last})
+
+    async def unsubscribe(self, subscriber: Subscriber, symbol: str):
+        async with self._lock:
+            subscriber.symbols.discard(symbol)
+            clients = self._subscribers.get(symbol)
+            if clients is None:
+                return
+            clients.discard(subscriber)
+            if not clients:
+                del self._subscribers[symbol]
+                self._last_tick.pop(symbol, None)
+                intraday_bars.drop(symbol)
+                await self.source.unsubscribe(symbol)
+
+    async def remove(self, subscriber: Subscriber):
+        for symbol in list(subscriber.symbols):
+            await self.unsubscribe(subscriber, symbol)
+
+    async def retain(self, symbol: str, seconds: float = RETAIN_SECONDS):
+        """접속한 클라이언트가 없어도 seconds 동안 실시간 구독 유지 (다시 호출하면 연장)"""
+        while True:
+            retainer = self._retainers.get(symbol)
+            if retainer is None:
+                # 구독(await) 전에 먼저 등록 → 동시에 들어온 호출이 _Retainer 를 중복 생성하지 않음
+                retainer = self._retainers[symbol] = _Retainer()
+                try:
+                    await self.subscribe(retainer, symbol)
+                except BaseException as e:
+                    if self._retainers.get(symbol) is retainer:
+                        del self._retainers[symbol]
+                    if isinstance(e, Exception):
+                        retainer.error = e
+                    raise
+                finally:
+                    retainer.ready.set()
+                break
+
+            # 다른 호출이 구독 중이면 완료를 기다린 뒤 같은 결과 사용
+            await retainer.ready.wait()
+            if self._retainers.get(symbol) is retainer:
+                break
+            if retainer.error is not None:
+                raise retainer.error
+
+        retainer.expires_at = time.monotonic() + seconds
+        # 타이머는 종목당 1개 - 연장은 expires_at 만 바꾸고 만료 시점에 다시 확인
+        if retainer.timer is None:
+            self._arm_release(symbol, retainer)
+
+    def _arm_release(self, symbol: str, retainer: _Retainer):
+        delay = max(0.0, retainer.expires_at - time.monotonic())
+        retainer.timer = asyncio.get_running_loop().call_later(
+            delay, lambda: asyncio.ensure_future(self._release(symbol, retainer))
+        )
+
+    async def _release(self, symbol: str, retainer: _Retainer):
+        retainer.timer = None
+        if self._retainers.get(symbol) is not retainer:
+            return
+        if retainer.expires_at > time.monotonic():
+            self._arm_release(symbol, retainer)
+            return
+        del self._retainers[symbol]
+        await self.unsubscribe(retainer, symbol)
+
+    def publish(self, tick: dict):
+        symbol = tick["symbol"]
+        clients = self._subscribers.get(symbol)
+        # 구독 해제 직후 도착한 체결은 무시
+        if not clients:
+            return
+        self.ticks += 1
+        self._last_tick[symbol] = tick
+        bars = intraday_bars.on_tick(tick)
+
+        message = {"type": "tick", **tick}
+        for subscriber in clients:
+            subscriber.offer(symbol, message)
+
+        # 봉 시작 시각별로 키를 나눠서 확정된 봉은 건너뛰지 않고 전달
+        for interval, bar, closed in bars:
+            message = {"type": "bar", "symbol": symbol, "interval": interval, "closed": closed, "bar": bar}
+            for subscriber in clients:
+                if interval in subscriber.bar_intervals:
+                    subscriber.offer((symbol, interval, bar["time"]), message)
+
+    async def stop(self):
+        await self.source.stop()
+        for retainer in self._retainers.values():
+            if retainer.timer is not None:
+                retainer.timer.cancel()
+        self._retainers.clear()
+        self._started = False
+
+    def stats(self) -> dict:
+        clients = {
+            sub for subs in self._subscribers.values() for sub in subs if not isinstance(sub, _Retainer)
+        }
+        return {
+            "feed": type(self.source).__name__,
+            "symbols": len(self._subscribers),
+            "retained": len(self._retainers),
+            "clients": len(clients),
+            "ticks": self.ticks,
+            "sent": sum(sub.sent for sub in clients),
+            "dropped": sum(sub.dropped for sub in clients),
+        }
+
+
+_hub: QuoteHub | None = None
+
+
+def get_hub() -> QuoteHub:
+    global _hub
+    if _hub is None:
+        _hub = QuoteHub(create_feed_source())
+    return _hub
+
+
+async def stop_quote_hub():
+    if _hub is not None:
+        await _hub.stop()
+
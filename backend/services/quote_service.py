@@ -1,12 +1,51 @@
 import os
-import requests
-from ..core.token_manager import get_access_token
-from dotenv import load_dotenv
+from ..core.cache import AsyncTTLCache
+from ..core.kis_client import kis_get
+from ..utils.market_hours import is_market_open, seconds_until_next_open
 
-load_dotenv()
+# 장중 시세 캐시 유지 시간 (초)
+QUOTE_TTL_SECONDS = float(os.getenv("QUOTE_TTL_SECONDS", "3"))
+# 업스트림 장애 / 지연 시 만료된 시세를 대신 제공할 수 있는 시간 (초)
+QUOTE_STALE_SECONDS = float(os.getenv("QUOTE_STALE_SECONDS", "600"))
 
 
-def get_stock_summary(symbol: str) -> dict:
+def quote_ttl() -> float:
+    """장중에는 짧게, 장 마감 후/휴장일에는 다음 정규장 시작까지 (시세가 바뀌지 않음)"""
+    if is_market_open():
+        return QUOTE_TTL_SECONDS
+    return max(seconds_until_next_open(), QUOTE_TTL_SECONDS)
+
+
+quote_cache = AsyncTTLCache(
+    "quote",
+    ttl=quote_ttl,
+    maxsize=int(os.getenv("QUOTE_CACHE_SIZE", "4096")),
+    stale_ttl=QUOTE_STALE_SECONDS,
+    # 여러 워커로 실행해도 같은 종목 시세는 TTL 동안 한 번만 조회
+    shared=True,
+)
+
+
+async def _fetch_price_output(symbol: str) -> dict:
+    res_json = await kis_get("FHKST01010100", symbol)
+    return res_json.get("output", {})
+
+
+# ✅ 주식현재가 시세 원본 (inquire-price output, 캐시 + 동시 요청 병합, 장애 시 마지막 시세)
+async def fetch_price_output(symbol: str) -> dict:
+    return await quote_cache.get_or_load_stale(symbol, lambda: _fetch_price_output(symbol))
+
+
+def quote_time(symbol: str) -> float | None:
+    """캐시된 시세를 KIS 에서 받은 시각 (epoch 초, stale 포함 / 없으면 None)"""
+    return quote_cache.stored_at(symbol)
+
+
+async def get_stock_summary(symbol: str) -> dict:
+    return build_stock_summary(symbol, await fetch_price_output(symbol))
+
+
+def build_stock_summary(symbol: str, output: dict) -> dict:
     def safe_int(value) -> int:
         try:
             return int(
@@ -25,31 +64,6 @@ def get_stock_summary(symbol: str) -> dict:
         except:
             return 0.0
 
-    token = get_access_token()
-
-    url = f"{os.getenv('BASE_URL')}/uapi/domestic-stock/v1/quotations/inquire-price"
-    params = {
-        "fid_cond_mrkt_div_code": "J",
-        "fid_input_iscd": symbol,
-    }
-
-    headers = {
-        "content-type": "application/json",
-        "authorization": f"Bearer {token}",
-        "appkey": os.getenv("APP_KEY"),
-        "appsecret": os.getenv("APP_SECRET"),
-        "tr_id": "FHKST01010100",
-        "custtype": "P",
-    }
-
-    response = requests.get(url, headers=headers, params=params)
-    res_json = response.json()
-
-    if res_json.get("rt_cd") != "0":
-        raise Exception(f"API 오류: {res_json}")
-
-    output = res_json.get("output", {})
-
     return {
         "symbol": symbol,
         "price": safe_int(output.get("stck_prpr")),
@@ -0,0 +1,159 @@
+import os
+import json
+import time
+import asyncio
+from ..core.cache import AsyncTTLCache
+from ..core.db import get_connection
+from ..core.kis_client import kis_get
+from ..core.scheduler import background
+from ..core.log import get_logger
+from ..utils.market_hours import now_kst
+
+logger = get_logger(__name__)
+
+# 재무비율(안정성 / 수익성) 로컬 저장소
+# - KIS 가 돌려주는 모든 결산 기간(stac_yymm)을 종목 · 기간별로 저장
+# - 요청은 저장소에서 바로 응답하고, 마지막 확인 후 일정 시간이 지났을 때만 KIS 에 다시 확인
+#   (저장된 값이 있으면 기존 값으로 먼저 응답하고 백그라운드에서 갱신)
+# - 실적 발표 시즌에는 확인 주기를 짧게 적용
+
+RATIO_TR_IDS = {
+    "stability": "FHKST66430600",  # 안정성비율
+    "profitability": "FHKST66430400",  # 수익성비율
+}
+# 재확인 주기 (초) - 평소 / 실적 발표 시즌
+REVALIDATE_SECONDS = float(os.getenv("RATIO_REVALIDATE_SECONDS", str(7 * 24 * 3600)))
+EARNINGS_REVALIDATE_SECONDS = float(os.getenv("RATIO_EARNINGS_REVALIDATE_SECONDS", str(12 * 3600)))
+
+# 실적 발표 시즌 (시작 월, 시작 일, 끝 월, 끝 일) - 분기 / 반기 / 사업보고서 제출 기한 전후
+EARNINGS_SEASONS = (
+    (2, 1, 3, 31),  # 사업보고서 (연간)
+    (4, 15, 5, 20),  # 1분기
+    (7, 15, 8, 20),  # 반기
+    (10, 15, 11, 20),  # 3분기
+)
+
+_revalidate_cache = AsyncTTLCache("ratio_revalidate", ttl=60)
+_background_tasks: set = set()
+_schema_ready = False
+
+
+def _db():
+    global _schema_ready
+    conn = get_connection()
+    if not _schema_ready:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS financial_ratios (
+                symbol TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                period TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (symbol, kind, period)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS ratio_meta (
+                symbol TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                checked_at REAL NOT NULL,
+                PRIMARY KEY (symbol, kind)
+            ) WITHOUT ROWID;
+            """
+        )
+        _schema_ready = True
+    return conn
+
+
+def is_earnings_season(day=None) -> bool:
+    day = day or now_kst().date()
+    key = (day.month, day.day)
+    return any((m1, d1) <= key <= (m2, d2) for m1, d1, m2, d2 in EARNINGS_SEASONS)
+
+
+def revalidate_interval() -> float:
+    return EARNINGS_REVALIDATE_SECONDS if is_earnings_season() else REVALIDATE_SECONDS
+
+
+# ✅ 저장소 조회 (최근 결산 기간 → 과거 순)
+def load_periods(symbol: str, kind: str, limit: int | None = None) -> list:
+    rows = _db().execute(
+        "SELECT data FROM financial_ratios WHERE symbol = ? AND kind = ?"
+        " ORDER BY period DESC LIMIT ?",
+        (symbol, kind, -1 if limit is None else limit),
+    ).fetchall()
+    return [json.loads(data) for (data,) in rows]
+
+
+def checked_at(symbol: str, kind: str) -> float | None:
+    """마지막으로 KIS 에서 확인한 시각 (epoch 초, 없으면 None)"""
+    row = _db().execute(
+        "SELECT checked_at FROM ratio_meta WHERE symbol = ? AND kind = ?", (symbol, kind)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def is_fresh(symbol: str, kind: str) -> bool:
+    """재확인 주기 안에 KIS 에서 확인한 적이 있는지"""
+    checked = checked_at(symbol, kind)
+    return checked is not None and time.time() - checked <= revalidate_interval()
+
+
+def _save(symbol: str, kind: str, rows: list):
+    conn = _db()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO financial_ratios VALUES (?, ?, ?, ?)",
+            [
+                (symbol, kind, row["stac_yymm"], json.dumps(row, ensure_ascii=False))
+                for row in rows
+                if row.get("stac_yymm")
+            ],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO ratio_meta VALUES (?, ?, ?)", (symbol, kind, time.time())
+        )
+
+
+# ✅ KIS 재확인 (모든 결산 기간 저장, 같은 종목 동시 요청은 한 번만 조회)
+async def revalidate(symbol: str, kind: str):
+    await _revalidate_cache.get_or_load((symbol, kind), lambda: _revalidate(symbol, kind))
+
+
+async def _revalidate(symbol: str, kind: str):
+    res_json = await kis_get(RATIO_TR_IDS[kind], symbol)
+    _save(symbol, kind, res_json.get("output", []))
+
+
+def _schedule_revalidate(symbol: str, kind: str):
+    async def run():
+        try:
+            await revalidate(symbol, kind)
+        except Exception as e:
+            logger.warning("❌ 재무비율 갱신 실패: %s %s %s", symbol, kind, e)
+
+    with background():
+        task = asyncio.create_task(run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def get_periods(symbol: str, kind: str, limit: int | None = None) -> list:
+    """결산 기간별 원본 (최근 → 과거), 저장된 값이 없을 때만 KIS 응답을 기다림"""
+    checked = checked_at(symbol, kind)
+    if checked is None:
+        await revalidate(symbol, kind)
+    elif time.time() - checked > revalidate_interval():
+        _schedule_revalidate(symbol, kind)
+    return load_periods(symbol, kind, limit)
+
+
+async def get_latest(symbol: str, kind: str) -> dict:
+    periods = await get_periods(symbol, kind, limit=1)
+    return periods[0] if periods else {}
+
+
+async def stop_ratio_tasks():
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,64 @@
+import numpy as np
+
+# 일봉 → 주/월/분기/년봉 변환 (NumPy 벡터 연산, 한 번의 패스)
+# - 시가: 기간 첫 거래일 시가 / 종가: 기간 마지막 거래일 종가
+# - 고가: 최대값 / 저가: 최소값 / 거래량: 합계
+# - 봉 날짜(time): 기간 마지막 거래일
+
+
+def rows_to_arrays(rows: list) -> dict:
+    """[(date, open, high, low, close, volume), ...] → 컬럼별 배열"""
+    if not rows:
+        return {
+            "time": np.empty(0, dtype="datetime64[D]"),
+            "open": np.empty(0),
+            "high": np.empty(0),
+            "low": np.empty(0),
+            "close": np.empty(0),
+            "volume": np.empty(0, dtype=np.int64),
+        }
+    days, opens, highs, lows, closes, volumes = zip(*rows)
+    return {
+        "time": np.array(
+            [f"{d[:4]}-{d[4:6]}-{d[6:]}" for d in days], dtype="datetime64[D]"
+        ),
+        "open": np.array(opens, dtype=np.float64),
+        "high": np.array(highs, dtype=np.float64),
+        "low": np.array(lows, dtype=np.float64),
+        "close": np.array(closes, dtype=np.float64),
+        "volume": np.array(volumes, dtype=np.int64),
+    }
+
+
+def _period_keys(days: np.ndarray, timeframe: str) -> np.ndarray:
+    if timeframe == "weekly":
+        # 1970-01-01 은 목요일 → +3 하면 월요일 시작 주 번호
+        return (days.astype(np.int64) + 3) // 7
+    months = days.astype("datetime64[M]").astype(np.int64)
+    if timeframe == "monthly":
+        return months
+    if timeframe == "quarterly":
+        return months // 3
+    if timeframe == "yearly":
+        return days.astype("datetime64[Y]").astype(np.int64)
+    raise ValueError(f"지원하지 않는 기간: {timeframe}")
+
+
+def resample(bars: dict, timeframe: str) -> dict:
+    """날짜 오름차순 일봉 배열 → 기간별 OHLCV 배열"""
+    days = bars["time"]
+    if len(days) == 0:
+        return bars
+
+    keys = _period_keys(days, timeframe)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.concatenate((starts[1:], [len(days)])) - 1
+
+    return {
+        "time": days[ends],
+        "open": bars["open"][starts],
+        "high": np.maximum.reduceat(bars["high"], starts),
+        "low": np.minimum.reduceat(bars["low"], starts),
+        "close": bars["close"][ends],
+        "volume": np.add.reduceat(bars["volume"], starts),
+    }
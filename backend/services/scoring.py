@@ -0,0 +1,212 @@
+import bisect
+import numpy as np
+from ..core.profiling import span
+
+# 리스크 점수 모델 (재무 안정성 / 수익성 / 변동성 / 수급)
+# - 지표별 기준값은 아래 구간표(Buckets)로만 정의하고, 계산 로직은 모든 모델이 공유
+# - 종목 1개: bisect 로 구간 탐색 (기존 응답 형식 그대로)
+# - 종목 여러 개: 지표 컬럼 배열에 np.searchsorted 한 번으로 일괄 계산
+
+
+class Buckets:
+    """
+    오름차순 경계값 → 구간별 점수 (scores 는 경계값 개수 + 1 개)
+    inclusive: 경계값이 위 구간에 속하는지 (True: 값 >= 경계, False: 값 > 경계)
+               경계마다 다르면 같은 길이의 tuple 로 지정
+    missing: 값이 없을 때(None / NaN) 점수 - 기존 if/elif 에서 어느 조건에도 안 걸리는 else 점수와 같게 지정
+    """
+
+    def __init__(self, edges, scores, inclusive=True, missing=0):
+        if len(scores) != len(edges) + 1:
+            raise ValueError("scores 는 경계값 개수 + 1 개여야 합니다.")
+        if isinstance(inclusive, bool):
+            inclusive = (inclusive,) * len(edges)
+        # "값 > 경계" 는 "값 >= 경계 바로 다음 실수" 와 같으므로 모든 경계를 >= 기준으로 통일
+        self.edges = np.array(
+            [float(e) if inc else np.nextafter(float(e), np.inf) for e, inc in zip(edges, inclusive)]
+        )
+        self._edge_list = self.edges.tolist()
+        self.scores = list(scores)
+        self._score_array = np.array(scores)
+        self.missing = missing
+
+    def lookup(self, value):
+        if value is None or value != value:
+            return self.missing
+        return self.scores[bisect.bisect_right(self._edge_list, value)]
+
+    def lookup_array(self, values: np.ndarray) -> np.ndarray:
+        result = self._score_array[np.searchsorted(self.edges, values, side="right")]
+        missing = np.isnan(values)
+        if missing.any():
+            result[missing] = self.missing
+        return result
+
+
+class Metric:
+    def __init__(self, label: str, field: str, parse, buckets: Buckets, transform=None, default=None):
+        """parse: KIS 원본 값 → 숫자 (값 없음은 None) / transform: 구간 탐색 전 변환 (ex. abs)"""
+        self.label = label
+        self.field = field
+        self.parse = parse
+        self.buckets = buckets
+        self.transform = transform
+        self.default = default
+
+
+class ScoreModel:
+    def __init__(self, metrics: list, levels: Buckets, scale=None, detail_scores=True):
+        """levels: 총점 → 리스크 구간 / scale: 총점 환산 비율 / detail_scores: 지표별 점수 응답 포함 여부"""
+        self.metrics = metrics
+        self.levels = levels
+        self.scale = scale
+        self.detail_scores = detail_scores
+
+    def score(self, data: dict) -> dict:
+        """종목 1개 점수 ({"score_by_metric", "total_score", "risk_level"})"""
+        with span("score"):
+            return self._score(data)
+
+    def _score(self, data: dict) -> dict:
+        details = []
+        total = 0
+        for metric in self.metrics:
+            value = metric.parse(data.get(metric.field, metric.default))
+            key = metric.transform(value) if metric.transform and value is not None else value
+            score = metric.buckets.lookup(key)
+            total += score
+            detail = {"label": metric.label, "value": value}
+            if self.detail_scores:
+                detail["score"] = score
+            details.append(detail)
+
+        if self.scale is not None:
+            total = total * self.scale
+        return {
+            "score_by_metric": details,
+            "total_score": total,
+            "risk_level": self.levels.lookup(total),
+        }
+
+    def parse_record(self, record: dict) -> list:
+        """KIS 원본 dict 1개 → 지표 순서대로 float (값 없음 = NaN)"""
+        values = [metric.parse(record.get(metric.field, metric.default)) for metric in self.metrics]
+        return [np.nan if value is None else float(value) for value in values]
+
+    def parse_records(self, records: list) -> dict:
+        """KIS 원본 dict 목록 → 지표별 float64 컬럼 (값 없음 = NaN)"""
+        columns = {}
+        for metric in self.metrics:
+            values = [metric.parse(record.get(metric.field, metric.default)) for record in records]
+            columns[metric.field] = np.array(
+                [np.nan if value is None else value for value in values], dtype=np.float64
+            )
+        return columns
+
+    def score_columns(self, columns: dict) -> dict:
+        """
+        지표 컬럼 배열 일괄 계산
+        → {"scores": (종목 수, 지표 수) 점수 배열, "total_score": 총점 배열, "risk_level": 구간 배열}
+        """
+        scores = np.empty((len(next(iter(columns.values()))), len(self.metrics)), dtype=np.int64)
+        for i, metric in enumerate(self.metrics):
+            values = columns[metric.field]
+            if metric.transform is not None:
+                values = metric.transform(values)
+            scores[:, i] = metric.buckets.lookup_array(values)
+
+        total = scores.sum(axis=1)
+        if self.scale is not None:
+            total = total * self.scale
+        return {
+            "scores": scores,
+            "total_score": total,
+            "risk_level": self.levels.lookup_array(total.astype(np.float64)),
+        }
+
+    def score_records(self, records: list) -> dict:
+        return self.score_columns(self.parse_records(records))
+
+
+# ✅ 값 파싱 (모델마다 기존 파싱 규칙 유지)
+def float_or_none(val):
+    try:
+        return float(str(val).replace(",", ""))
+    except Exception:
+        return None
+
+
+def percent_or_none(val):
+    try:
+        return float(str(val).replace(",", "").replace("%", ""))
+    except Exception:
+        return None
+
+
+def float_or_zero(val):
+    try:
+        return float(val)
+    except Exception:
+        return 0.0
+
+
+def int_or_zero(val):
+    try:
+        return int(val)
+    except Exception:
+        return 0
+
+
+# ✅ 재무 안정성 (120점 → 100점 환산)
+FINANCIAL_STABILITY = ScoreModel(
+    [
+        # 부채비율 / 고정비율: 낮을수록 좋음 (경계값 이하가 아래 구간)
+        Metric("부채비율", "lblt_rate", float_or_none, Buckets((100, 150, 200), (30, 20, 10, 0), inclusive=False)),
+        Metric("고정비율", "bram_depn", float_or_none, Buckets((50, 75, 100), (30, 20, 10, 0), inclusive=False)),
+        # 유동비율 / 당좌비율: 높을수록 좋음
+        Metric("유동비율", "crnt_rate", float_or_none, Buckets((70, 100, 150), (0, 10, 20, 30))),
+        Metric("당좌비율", "quck_rate", float_or_none, Buckets((50, 70, 100), (0, 10, 20, 30))),
+    ],
+    levels=Buckets((60, 90), ("위험", "보통", "안정")),
+    scale=100 / 120,
+)
+
+# ✅ 수익성
+PROFITABILITY = ScoreModel(
+    [
+        Metric("ROE", "self_cptl_ntin_inrt", percent_or_none, Buckets((5, 10, 15), (0, 10, 20, 30))),
+        Metric("ROA", "tot_assets_ntin_rate", percent_or_none, Buckets((4, 7, 10), (0, 10, 20, 30))),
+        Metric("영업이익률", "sale_totl_rate", percent_or_none, Buckets((5, 10, 20), (0, 5, 10, 20))),
+        Metric("순이익률", "sale_ntin_rate", percent_or_none, Buckets((5, 10, 15), (0, 5, 10, 20))),
+    ],
+    levels=Buckets((50, 80), ("취약", "보통", "우수")),
+)
+
+# ✅ 변동성 (등락률 / 괴리율은 절대값 기준)
+VOLATILITY = ScoreModel(
+    [
+        Metric("등락률", "prdy_ctrt", float, Buckets((1, 3, 5, 7), (0, 5, 15, 25, 30)), transform=abs, default=0),
+        Metric("거래량변동률", "prdy_vrss_vol_rate", float, Buckets((50, 100, 300, 500), (0, 5, 15, 25, 30)), default=0),
+        Metric("괴리율", "w52_hgpr_vrss_prpr_ctrt", float, Buckets((10, 20, 30, 40), (0, 5, 10, 15, 20)), transform=abs, default=0),
+        Metric("회전율", "vol_tnrt", float, Buckets((1, 5, 10, 20), (0, 5, 10, 15, 20)), default=0),
+    ],
+    levels=Buckets((40, 70), ("낮음", "보통", "높음")),
+    detail_scores=False,
+)
+
+# ✅ 수급 (순매수량은 경계값 초과 기준, 회전율은 0.1 ~ 2.0 이 적정 구간, NaN 은 기존처럼 5점)
+_NET_BUY = Buckets((-100_000, 0, 100_000, 1_000_000), (0, 5, 15, 20, 25), inclusive=False)
+SUPPLY_DEMAND = ScoreModel(
+    [
+        Metric("외국인 지분율", "hts_frgn_ehrt", float_or_zero, Buckets((20, 30, 40, 50), (5, 10, 20, 25, 30), missing=5)),
+        Metric("외국인 순매수", "frgn_ntby_qty", int_or_zero, _NET_BUY),
+        Metric("기관 순매수", "pgtr_ntby_qty", int_or_zero, _NET_BUY),
+        Metric(
+            "회전율(유동성)",
+            "vol_tnrt",
+            float_or_zero,
+            Buckets((0.1, 2.0, 5.0), (10, 20, 10, 5), inclusive=(True, False, False), missing=5),
+        ),
+    ],
+    levels=Buckets((40, 70), ("높음", "보통", "낮음")),
+)
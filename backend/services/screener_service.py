@@ -0,0 +1,285 @@
+import os
+import time
+import logging
+import asyncio
+from datetime import datetime
+import numpy as np
+
+from ..utils.symbol_table import current_table
+from ..utils.market_hours import KST
+from ..core.scheduler import background
+from ..core.log import get_logger, log_sampled
+from .quote_service import fetch_price_output
+from .financial_service import fetch_stability_output
+from .profitability_service import fetch_profitability_output
+from .supply_service import build_supply_summary
+from .scoring import FINANCIAL_STABILITY, PROFITABILITY, VOLATILITY, SUPPLY_DEMAND
+
+logger = get_logger(__name__)
+
+# 전 종목 리스크 스크리너
+# - 백그라운드 작업이 종목 리스트 전체를 돌며 시세 / 안정성비율 / 수익성비율을 조회 (동시 조회 수 제한)
+# - 지표 원본 값은 종목 순서대로 컬럼 배열에 저장하고, 점수는 조회 시점에 모델별로 한 번에 계산
+# - 정렬 / 필터 조회는 업스트림 호출 없이 메모리 테이블에서 바로 응답
+# - 종목 리스트(심볼 테이블)가 교체되면 다음 전체 조회 시작 시 컬럼을 새 종목 순서로 다시 만듦
+
+# 동시에 조회하는 종목 수
+CONCURRENCY = int(os.getenv("SCREENER_CONCURRENCY", "4"))
+# 전체 재조회 주기 (초)
+REFRESH_INTERVAL = float(os.getenv("SCREENER_REFRESH_INTERVAL", str(6 * 3600)))
+# 서버 시작 시 자동 실행 여부
+AUTOSTART = os.getenv("SCREENER_AUTOSTART", "0") == "1"
+
+
+class _Section:
+    """점수 모델 1개의 지표 컬럼 (종목 순서)"""
+
+    def __init__(self, model):
+        self.model = model
+        self.columns = {metric.field: np.full(SIZE, np.nan) for metric in model.metrics}
+        self.present = np.zeros(SIZE, dtype=bool)
+        self._scores = None
+
+    def update(self, i: int, record: dict):
+        values = self.model.parse_record(record)
+        for metric, value in zip(self.model.metrics, values):
+            self.columns[metric.field][i] = value
+        self.present[i] = True
+        self._scores = None
+
+    def clear(self, i: int):
+        """조회 / 파싱 실패 시 이전 조회 값이 현재 값처럼 보이지 않도록 비움"""
+        for column in self.columns.values():
+            column[i] = np.nan
+        self.present[i] = False
+        self._scores = None
+
+    def scores(self) -> dict:
+        # 값이 바뀐 뒤 첫 조회 때만 전 종목 재계산
+        if self._scores is None:
+            self._scores = self.model.score_columns(self.columns)
+        return self._scores
+
+
+_listing = None
+codes: list = []
+names: list = []
+markets = np.array([])
+SIZE = 0
+_sections: dict = {}
+_prices = np.zeros(0, dtype=np.int64)
+_change_rates = np.zeros(0)
+_updated_at = np.zeros(0)
+
+
+def _load_listing(table):
+    """종목 순서 / 지표 컬럼 초기화 (이전 조회 결과는 버림)"""
+    global _listing, codes, names, markets, SIZE, _sections, _prices, _change_rates, _updated_at
+    _listing = table
+    codes = [table.code(i) for i in range(len(table))]
+    names = [table.name(i) for i in range(len(table))]
+    markets = np.array([table.market(i) for i in range(len(table))])
+    SIZE = len(codes)
+    _sections = {
+        "stability": _Section(FINANCIAL_STABILITY),
+        "profitability": _Section(PROFITABILITY),
+        "volatility": _Section(VOLATILITY),
+        "supply": _Section(SUPPLY_DEMAND),
+    }
+    _prices = np.zeros(SIZE, dtype=np.int64)
+    _change_rates = np.full(SIZE, np.nan)
+    _updated_at = np.zeros(SIZE)
+
+
+_load_listing(current_table())
+
+_status = {
+    "state": "idle",
+    "scanned": 0,
+    "errors": 0,
+    "started_at": None,
+    "finished_at": None,
+    "last_completed_at": None,
+}
+_run_task: asyncio.Task | None = None
+_loop_task: asyncio.Task | None = None
+
+
+def _iso(ts: float | None) -> str | None:
+    return datetime.fromtimestamp(ts, KST).isoformat(timespec="seconds") if ts else None
+
+
+async def _scan_symbol(i: int):
+    code = codes[i]
+    price, stability, profit = await asyncio.gather(
+        fetch_price_output(code),
+        fetch_stability_output(code),
+        fetch_profitability_output(code),
+        return_exceptions=True,
+    )
+
+    def apply(key: str, result) -> bool:
+        """섹션 갱신 (실패하면 해당 종목 값을 비우고 False)"""
+        if not isinstance(result, BaseException):
+            try:
+                _sections[key].update(i, result)
+                return True
+            except (TypeError, ValueError, KeyError):
+                pass
+        _sections[key].clear(i)
+        return False
+
+    if isinstance(price, BaseException):
+        _prices[i] = 0
+        _change_rates[i] = np.nan
+        supply = price
+    else:
+        supply = build_supply_summary(code, price)
+        _prices[i] = supply["price"]
+        _change_rates[i] = supply["change_rate"]
+
+    applied = [
+        apply("volatility", price),
+        apply("supply", supply),
+        apply("stability", stability),
+        apply("profitability", profit),
+    ]
+    _updated_at[i] = time.time()
+    return not all(applied)
+
+
+async def _worker(pending):
+    # 여러 worker 가 같은 iterator 를 나눠서 소비 (동시 조회 수 = worker 수)
+    for i in pending:
+        try:
+            failed = await _scan_symbol(i)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 업스트림 장애 시 전 종목이 실패하므로 일부만 기록 (전체 건수는 status 의 errors)
+            log_sampled(logger, logging.WARNING, "❌ 스크리너 조회 실패: %s %s", codes[i], e)
+            failed = True
+        _status["scanned"] += 1
+        if failed:
+            _status["errors"] += 1
+
+
+# ✅ 전 종목 1회 조회
+async def run_screen():
+    table = current_table()
+    if table is not _listing:
+        _load_listing(table)
+    _status.update(state="running", scanned=0, errors=0, started_at=time.time(), finished_at=None)
+    try:
+        pending = iter(range(SIZE))
+        await asyncio.gather(*(_worker(pending) for _ in range(max(CONCURRENCY, 1))))
+        _status["last_completed_at"] = time.time()
+    finally:
+        _status.update(state="idle", finished_at=time.time())
+
+
+def start_screen() -> bool:
+    """진행 중인 조회가 없으면 새로 시작 (시작했으면 True)"""
+    global _run_task
+    if _run_task is not None and not _run_task.done():
+        return False
+    # 사용자 요청보다 뒤로 밀리도록 백그라운드 우선순위로 실행
+    with background():
+        _run_task = asyncio.create_task(run_screen())
+    return True
+
+
+async def _refresh_loop():
+    while True:
+        start_screen()
+        await _run_task
+        await asyncio.sleep(REFRESH_INTERVAL)
+
+
+def start_screener():
+    """SCREENER_AUTOSTART=1 이면 서버 시작 시 전체 조회 후 주기적으로 재조회"""
+    global _loop_task
+    if AUTOSTART and (_loop_task is None or _loop_task.done()):
+        _loop_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_screener():
+    tasks = [task for task in (_loop_task, _run_task) if task is not None]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def screener_status() -> dict:
+    completed = _status["last_completed_at"]
+    return {
+        "state": _status["state"],
+        "total": SIZE,
+        "scanned": _status["scanned"],
+        "errors": _status["errors"],
+        "progress": round(_status["scanned"] / SIZE, 4) if SIZE else 1.0,
+        "started_at": _iso(_status["started_at"]),
+        "finished_at": _iso(_status["finished_at"]),
+        "last_completed_at": _iso(completed),
+        "age_seconds": round(time.time() - completed, 1) if completed else None,
+        "coverage": {key: int(section.present.sum()) for key, section in _sections.items()},
+    }
+
+
+def _item(i: int, scores: dict) -> dict:
+    sections = {}
+    for key, section in _sections.items():
+        if section.present[i]:
+            sections[key] = {
+                "score": round(float(scores[key]["total_score"][i]), 2),
+                "risk_level": str(scores[key]["risk_level"][i]),
+            }
+        else:
+            sections[key] = None
+    return {
+        "symbol": codes[i],
+        "name": names[i],
+        "market": str(markets[i]),
+        "price": int(_prices[i]) if _sections["supply"].present[i] else None,
+        "change_rate": None if np.isnan(_change_rates[i]) else float(_change_rates[i]),
+        "updated_at": _iso(_updated_at[i]),
+        **sections,
+    }
+
+
+# ✅ 정렬 / 필터 조회
+def query_screener(
+    sort: str = "stability",
+    order: str = "asc",
+    market: str | None = None,
+    risk_level: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    offset: int = 0,
+    limit: int = 50,
+) -> dict:
+    scores = {key: section.scores() for key, section in _sections.items()}
+    totals = scores[sort]["total_score"]
+
+    mask = _sections[sort].present.copy()
+    if market is not None:
+        mask &= markets == market
+    if risk_level is not None:
+        mask &= scores[sort]["risk_level"] == risk_level
+    if min_score is not None:
+        mask &= totals >= min_score
+    if max_score is not None:
+        mask &= totals <= max_score
+
+    matched = np.flatnonzero(mask)
+    keys = totals[matched]
+    ranked = matched[np.argsort(keys if order == "asc" else -keys, kind="stable")]
+    page = ranked[offset : offset + limit]
+
+    return {
+        "sort": sort,
+        "order": order,
+        "total": int(len(matched)),
+        "status": screener_status(),
+        "items": [_item(i, scores) for i in page.tolist()],
+    }
@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+import pytest
+
+from ..core import db, shared_store
+from ..services import candle_store, ratio_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    """테스트마다 빈 로컬 저장소 / 공유 저장소 사용"""
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "market.sqlite3"))
+    monkeypatch.setattr(db, "_conn", None)
+    monkeypatch.setattr(candle_store, "_schema_ready", False)
+    monkeypatch.setattr(ratio_store, "_schema_ready", False)
+    monkeypatch.setattr(shared_store, "_store", shared_store.SQLiteSharedStore(str(tmp_path / "shared.sqlite3")))
+    yield
+    db.close_connection()
+
+
+@pytest.fixture
+def mock_kis(tmp_path, monkeypatch):
+    """
+    KIS 호출을 로컬 대역 서버 (mock_kis.server) 로 보냄 - 지연 / 오류 없음, 프로세스 내 ASGI 호출
+    반환값() → 대역 서버의 TR_ID 별 요청 수 (/mock/stats)
+    """
+    from fastapi.testclient import TestClient
+
+    from ..core import circuit_breaker, kis_client, token_manager
+    from ..core.scheduler import TokenBucketScheduler
+    from ..mock_kis.server import MockConfig, create_app
+    from ..services import quote_service
+
+    mock_app = create_app(MockConfig(latency=0, jitter=0, seed=0))
+    monkeypatch.setattr(
+        kis_client,
+        "_client",
+        httpx.AsyncClient(base_url="http://mock-kis", transport=httpx.ASGITransport(app=mock_app)),
+    )
+    monkeypatch.setattr(kis_client, "scheduler", TokenBucketScheduler(100_000, 100_000, 1000))
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    monkeypatch.setattr(token_manager, "TOKEN_CACHE_FILE", str(tmp_path / "token_cache.json"))
+    monkeypatch.setattr(token_manager, "_token", {"access_token": None, "expires_at": 0.0})
+    monkeypatch.setattr(token_manager, "_refresh_lock", asyncio.Lock())
+    # 백그라운드 backfill 은 테스트 범위 밖 (candle_store 테스트에서 따로 확인)
+    monkeypatch.setattr(candle_store, "schedule_backfill", lambda symbol: None)
+    for cache in (quote_service.quote_cache, candle_store._sync_cache, ratio_store._revalidate_cache):
+        cache.invalidate()
+
+    stats_client = TestClient(mock_app)
+    yield lambda: stats_client.get("/mock/stats").json()
+    for cache in (quote_service.quote_cache, candle_store._sync_cache, ratio_store._revalidate_cache):
+        cache.invalidate()
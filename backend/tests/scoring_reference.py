@@ -0,0 +1,336 @@
+"""
+점수 모델 도입 전 if/elif 구현 (scoring.py 구간표 검증용 기준, 수정하지 말 것)
+"""
+
+def score_financial_stability(data: dict) -> dict:
+    def safe_float(val):
+        try:
+            return float(str(val).replace(",", ""))
+        except:
+            return None
+
+    def score_lblt_rate(val):  # 부채비율 (낮을수록 좋음)
+        if val is None:
+            return 0
+        if val <= 100:
+            return 30
+        elif val <= 150:
+            return 20
+        elif val <= 200:
+            return 10
+        else:
+            return 0
+
+    def score_bram_depn(val):  # 고정비율 (낮을수록 좋음)
+        if val is None:
+            return 0
+        if val <= 50:
+            return 30
+        elif val <= 75:
+            return 20
+        elif val <= 100:
+            return 10
+        else:
+            return 0
+
+    def score_crnt_rate(val):  # 유동비율 (높을수록 좋음)
+        if val is None:
+            return 0
+        if val >= 150:
+            return 30
+        elif val >= 100:
+            return 20
+        elif val >= 70:
+            return 10
+        else:
+            return 0
+
+    def score_quck_rate(val):  # 당좌비율 (높을수록 좋음)
+        if val is None:
+            return 0
+        if val >= 100:
+            return 30
+        elif val >= 70:
+            return 20
+        elif val >= 50:
+            return 10
+        else:
+            return 0
+
+    # 값 파싱
+    lblt_rate = safe_float(data.get("lblt_rate"))
+    bram_depn = safe_float(data.get("bram_depn"))
+    crnt_rate = safe_float(data.get("crnt_rate"))
+    quck_rate = safe_float(data.get("quck_rate"))
+
+    # 개별 점수 계산
+    score1 = score_lblt_rate(lblt_rate)
+    score2 = score_bram_depn(bram_depn)
+    score3 = score_crnt_rate(crnt_rate)
+    score4 = score_quck_rate(quck_rate)
+
+    total_score = (score1 + score2 + score3 + score4) * (100/120) # 전체 점수 비율 100점으로 환산
+
+    risk_level = (
+        "안정" if total_score >= 90 else "보통" if total_score >= 60 else "위험"
+    )
+
+    return {
+        "score_by_metric": [
+            {"label": "부채비율", "value": lblt_rate, "score": score1},
+            {"label": "고정비율", "value": bram_depn, "score": score2},
+            {"label": "유동비율", "value": crnt_rate, "score": score3},
+            {"label": "당좌비율", "value": quck_rate, "score": score4},
+        ],
+        "total_score": total_score,
+        "risk_level": risk_level,
+    }
+
+
+def score_profitability(data: dict) -> dict:
+    def safe_float(val):
+        try:
+            return float(str(val).replace(",", "").replace("%", ""))
+        except:
+            return None
+
+    def score_roe(val):  # ROE (높을수록 좋음)
+        if val is None:
+            return 0
+        if val >= 15:
+            return 30
+        elif val >= 10:
+            return 20
+        elif val >= 5:
+            return 10
+        else:
+            return 0
+
+    def score_roa(val):  # ROA (높을수록 좋음)
+        if val is None:
+            return 0
+        if val >= 10:
+            return 30
+        elif val >= 7:
+            return 20
+        elif val >= 4:
+            return 10
+        else:
+            return 0
+
+    def score_op_margin(val):  # 영업이익률 (높을수록 좋음)
+        if val is None:
+            return 0
+        if val >= 20:
+            return 20
+        elif val >= 10:
+            return 10
+        elif val >= 5:
+            return 5
+        else:
+            return 0
+
+    def score_net_margin(val):  # 순이익률 (높을수록 좋음)
+        if val is None:
+            return 0
+        if val >= 15:
+            return 20
+        elif val >= 10:
+            return 10
+        elif val >= 5:
+            return 5
+        else:
+            return 0
+
+    # 값 파싱
+    roe = safe_float(data.get("self_cptl_ntin_inrt"))
+    roa = safe_float(data.get("tot_assets_ntin_rate"))
+    op_margin = safe_float(data.get("sale_totl_rate"))
+    net_margin = safe_float(data.get("sale_ntin_rate"))
+
+    # 개별 점수 계산
+    score1 = score_roe(roe)
+    score2 = score_roa(roa)
+    score3 = score_op_margin(op_margin)
+    score4 = score_net_margin(net_margin)
+
+    total_score = score1 + score2 + score3 + score4
+
+    risk_level = (
+        "우수" if total_score >= 80 else "보통" if total_score >= 50 else "취약"
+    )
+
+    return {
+        "score_by_metric": [
+            {"label": "ROE", "value": roe, "score": score1},
+            {"label": "ROA", "value": roa, "score": score2},
+            {"label": "영업이익률", "value": op_margin, "score": score3},
+            {"label": "순이익률", "value": net_margin, "score": score4},
+        ],
+        "total_score": total_score,
+        "risk_level": risk_level,
+    }
+
+
+def score_volatility(data: dict) -> dict:
+    def score_change_rate(value):
+        value = abs(float(value))
+        if value >= 7:
+            return 30
+        elif value >= 5:
+            return 25
+        elif value >= 3:
+            return 15
+        elif value >= 1:
+            return 5
+        else:
+            return 0
+
+    def score_volume_change(value):
+        value = float(value)
+        if value >= 500:
+            return 30
+        elif value >= 300:
+            return 25
+        elif value >= 100:
+            return 15
+        elif value >= 50:
+            return 5
+        else:
+            return 0
+
+    def score_disparity(value):
+        value = abs(float(value))
+        if value >= 40:
+            return 20
+        elif value >= 30:
+            return 15
+        elif value >= 20:
+            return 10
+        elif value >= 10:
+            return 5
+        else:
+            return 0
+
+    def score_turnover(value):
+        value = float(value)
+        if value >= 20:
+            return 20
+        elif value >= 10:
+            return 15
+        elif value >= 5:
+            return 10
+        elif value >= 1:
+            return 5
+        else:
+            return 0
+
+    # 개별 점수 계산
+    score1 = score_change_rate(data.get("prdy_ctrt", 0))
+    score2 = score_volume_change(data.get("prdy_vrss_vol_rate", 0))
+    score3 = score_disparity(data.get("w52_hgpr_vrss_prpr_ctrt", 0))
+    score4 = score_turnover(data.get("vol_tnrt", 0))
+
+    total_score = score1 + score2 + score3 + score4
+
+    return {
+        "score_by_metric": [
+            {"label": "등락률", "value": float(data.get("prdy_ctrt", 0))},
+            {
+                "label": "거래량변동률",
+                "value": float(data.get("prdy_vrss_vol_rate", 0)),
+            },
+            {"label": "괴리율", "value": float(data.get("w52_hgpr_vrss_prpr_ctrt", 0))},
+            {"label": "회전율", "value": float(data.get("vol_tnrt", 0))},
+        ],
+        "total_score": total_score,
+        "risk_level": (
+            "높음" if total_score >= 70 else "보통" if total_score >= 40 else "낮음"
+        ),
+    }
+
+
+def score_supply_demand(data: dict) -> dict:
+    def safe_float(val):
+        try:
+            return float(val)
+        except:
+            return 0.0
+
+    def safe_int(val):
+        try:
+            return int(val)
+        except:
+            return 0
+
+    def score_foreign_ratio(val):  # 외국인 지분율
+        val = safe_float(val)
+        if val >= 50:
+            return 30
+        elif val >= 40:
+            return 25
+        elif val >= 30:
+            return 20
+        elif val >= 20:
+            return 10
+        else:
+            return 5
+
+    def score_net_buy(qty):  # 순매수량
+        qty = safe_int(qty)
+        if qty > 1_000_000:
+            return 25
+        elif qty > 100_000:
+            return 20
+        elif qty > 0:
+            return 15
+        elif qty > -100_000:
+            return 5
+        else:
+            return 0
+
+    def score_turnover(val):  # 회전율
+        val = safe_float(val)
+        if 0.1 <= val <= 2.0:
+            return 20
+        elif val <= 5.0:
+            return 10
+        else:
+            return 5
+
+    # 개별 점수 계산
+    score1 = score_foreign_ratio(data.get("hts_frgn_ehrt"))
+    score2 = score_net_buy(data.get("frgn_ntby_qty"))
+    score3 = score_net_buy(data.get("pgtr_ntby_qty"))
+    score4 = score_turnover(data.get("vol_tnrt"))
+
+    total_score = score1 + score2 + score3 + score4
+
+    return {
+        "score_by_metric": [
+            {
+                "label": "외국인 지분율",
+                "value": safe_float(data.get("hts_frgn_ehrt")),
+                "score": score1,
+            },
+            {
+                "label": "외국인 순매수",
+                "value": safe_int(data.get("frgn_ntby_qty")),
+                "score": score2,
+            },
+            {
+                "label": "기관 순매수",
+                "value": safe_int(data.get("pgtr_ntby_qty")),
+                "score": score3,
+            },
+            {
+                "label": "회전율(유동성)",
+                "value": safe_float(data.get("vol_tnrt")),
+                "score": score4,
+            },
+        ],
+        "total_score": round(total_score, 2),
+        "risk_level": (
+            "낮음" if total_score >= 70 else "보통" if total_score >= 40 else "높음"
+        ),
+    }
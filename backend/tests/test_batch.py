@@ -0,0 +1,73 @@
+"""
+여러 종목 시세 / 차트 일괄 조회 (/stock/summary/batch, /chart/batch)
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ..main import app
+from ..services import batch_service
+from ..services.batch_service import parse_queries
+
+
+def test_parse_queries(monkeypatch):
+    assert parse_queries(" 삼성전자, 000660 ,,") == ["삼성전자", "000660"]
+    with pytest.raises(ValueError):
+        parse_queries(" , ")
+    monkeypatch.setattr(batch_service, "MAX_SYMBOLS", 2)
+    with pytest.raises(ValueError):
+        parse_queries("a,b,c")
+
+
+def test_summary_batch_dedupes_symbols(mock_kis):
+    response = TestClient(app).get("/stock/summary/batch", params={"query": "삼성전자,005930,000660,없는회사"})
+    assert response.status_code == 200
+    body = response.json()
+    assert [(r["query"], r["symbol"]) for r in body["results"]] == [
+        ("삼성전자", "005930"),
+        ("005930", "005930"),
+        ("000660", "000660"),
+        ("없는회사", None),
+    ]
+    assert body["results"][0]["data"] == body["results"][1]["data"]
+    assert body["errors"] == {"없는회사": "종목을 찾을 수 없습니다."}
+    # 같은 종목은 1번만 조회
+    assert mock_kis()["FHKST01010100"]["requests"] == 2
+
+
+def test_summary_batch_uses_cached_quotes(mock_kis):
+    client = TestClient(app)
+    client.get("/stock/summary", params={"query": "005930"})
+    client.get("/stock/summary/batch", params={"query": "005930,000660"})
+    assert mock_kis()["FHKST01010100"]["requests"] == 2
+
+
+def test_batch_limits_concurrency(monkeypatch):
+    monkeypatch.setattr(batch_service, "CONCURRENCY", 2)
+    running = peak = 0
+
+    async def load(symbol):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if symbol == "bad":
+            raise RuntimeError("failed")
+        return symbol
+
+    results = asyncio.run(batch_service._load_all(["a", "b", "c", "d", "bad"], load))
+    assert peak == 2
+    assert [results[s] for s in "abcd"] == list("abcd") and isinstance(results["bad"], RuntimeError)
+
+
+def test_chart_batch_matches_single_chart(mock_kis):
+    client = TestClient(app)
+    params = {"timeframe": "weekly", "limit": 10, "indicators": "rsi"}
+    body = client.get("/chart/batch", params={"query": "005930,000660", **params}).json()
+    assert body["errors"] == {}
+    single = client.get("/chart/weekly", params={"query": "000660", "limit": 10, "indicators": "rsi"}).json()
+    assert body["results"][1]["data"] == single
+    assert client.get("/chart/batch", params={"query": ""}).status_code == 400
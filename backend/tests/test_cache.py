@@ -0,0 +1,116 @@
+"""
+비동기 TTL 캐시 (동시 요청 병합 / 만료 / 실패 시 다음 요청에서 다시 조회)
+"""
+
+import asyncio
+
+import pytest
+
+from ..core.cache import AsyncTTLCache
+
+
+class Loader:
+    """호출 횟수를 세고, release 될 때까지 응답을 미루는 업스트림 대역"""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return f"value-{self.calls}"
+
+
+def test_concurrent_requests_share_one_load():
+    async def scenario():
+        cache = AsyncTTLCache("test_coalesce", ttl=60)
+        loader = Loader()
+        waiters = [asyncio.ensure_future(cache.get_or_load("005930", loader)) for _ in range(50)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert loader.calls == 1
+        assert results == ["value-1"] * 50
+        stats = cache.stats()
+        assert (stats["misses"], stats["coalesced"], stats["inflight"]) == (1, 49, 0)
+
+        # 만료 전에는 캐시 값
+        assert await cache.get_or_load("005930", loader) == "value-1"
+        assert loader.calls == 1 and cache.stats()["hits"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_expired_value_is_reloaded():
+    async def scenario():
+        cache = AsyncTTLCache("test_expire", ttl=60)
+        loader = Loader()
+        loader.release.set()
+        cache.set("005930", "old", ttl=-1)
+
+        assert cache.get("005930") is None and not cache.contains("005930")
+        assert await cache.get_or_load("005930", loader) == "value-1"
+        assert loader.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_callable_ttl_is_read_on_each_store():
+    async def scenario():
+        ttls = iter((60, -1))
+        cache = AsyncTTLCache("test_callable_ttl", ttl=lambda: next(ttls))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1 and cache.get("b") is None
+
+    asyncio.run(scenario())
+
+
+def test_failure_propagates_to_all_waiters_and_is_not_cached():
+    async def scenario():
+        cache = AsyncTTLCache("test_failure", ttl=60)
+        failing = Loader(fail=True)
+        waiters = [asyncio.ensure_future(cache.get_or_load("005930", failing)) for _ in range(5)]
+        await asyncio.sleep(0)
+        failing.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert failing.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        # 실패는 저장하지 않으므로 다음 요청이 다시 조회
+        loader = Loader()
+        loader.release.set()
+        assert await cache.get_or_load("005930", loader) == "value-1"
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_shared_load():
+    async def scenario():
+        cache = AsyncTTLCache("test_cancel", ttl=60)
+        loader = Loader()
+        first = asyncio.ensure_future(cache.get_or_load("005930", loader))
+        second = asyncio.ensure_future(cache.get_or_load("005930", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        loader.release.set()
+
+        assert await second == "value-1"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert loader.calls == 1 and cache.get("005930") == "value-1"
+
+    asyncio.run(scenario())
+
+
+def test_lru_eviction():
+    cache = AsyncTTLCache("test_lru", ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None and cache.get("b") == 2 and cache.get("c") == 3
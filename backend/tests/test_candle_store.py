@@ -0,0 +1,145 @@
+"""
+일봉 저장소 delta sync / backfill (KIS 기간별 시세는 가짜 구현으로 대체)
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from ..services import candle_store
+from ..utils.market_hours import KST
+
+SYMBOL = "005930"
+
+
+class FakeDaily:
+    """거래일 → 가격, 기간 조회는 최신 날짜부터 최대 100건 (KIS FHKST03010100 과 같은 제한)"""
+
+    def __init__(self, days: list, price: float = 10_000):
+        self.prices = {day: price for day in days}
+        self.calls = []
+
+    async def fetch(self, symbol: str, start: date, end: date) -> list:
+        self.calls.append((start, end))
+        lo, hi = candle_store._yyyymmdd(start), candle_store._yyyymmdd(end)
+        days = sorted((d for d in self.prices if lo <= d <= hi), reverse=True)[:100]
+        return [
+            {
+                "stck_bsop_date": d,
+                "stck_oprc": str(self.prices[d]),
+                "stck_hgpr": str(self.prices[d]),
+                "stck_lwpr": str(self.prices[d]),
+                "stck_clpr": str(self.prices[d]),
+                "acml_vol": "1000",
+            }
+            for d in days
+        ]
+
+
+def _weekdays(start: date, end: date, skip=None) -> list:
+    days = []
+    d = start
+    while d <= end:
+        if d.weekday() < 5 and not (skip and skip[0] <= d <= skip[1]):
+            days.append(candle_store._yyyymmdd(d))
+        d += timedelta(days=1)
+    return days
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    source = FakeDaily(_weekdays(date(2015, 1, 1), date(2024, 6, 28)))
+    monkeypatch.setattr(candle_store, "_fetch_range", source.fetch)
+    monkeypatch.setattr(candle_store, "BACKFILL_PAGE_DELAY", 0)
+    return source
+
+
+def _trade_until(monkeypatch, day: date):
+    """day 장 마감(시간외 포함) 이후 시점으로 설정"""
+    monkeypatch.setattr(candle_store, "last_trading_day", lambda: day)
+    monkeypatch.setattr(
+        candle_store, "now_kst", lambda: datetime(day.year, day.month, day.day, 20, tzinfo=KST)
+    )
+
+
+def _closes() -> set:
+    return {row[4] for row in candle_store.load_daily(SYMBOL)}
+
+
+def test_tail_sync_appends_only_new_bars(fake, monkeypatch):
+    _trade_until(monkeypatch, date(2024, 6, 3))
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+    oldest, newest = candle_store.date_range(SYMBOL)
+    assert newest == "20240603"
+
+    _trade_until(monkeypatch, date(2024, 6, 28))
+    fake.calls.clear()
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+    assert candle_store.date_range(SYMBOL) == (oldest, "20240628")
+    # 마지막 저장일부터만 조회
+    assert fake.calls == [(date(2024, 6, 3), date(2024, 6, 28))]
+
+
+def test_readjusted_prices_reload_symbol(fake, monkeypatch):
+    _trade_until(monkeypatch, date(2024, 6, 3))
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+    asyncio.run(candle_store.backfill(SYMBOL, max_pages=2))
+    assert _closes() == {10_000}
+
+    # 액면분할 → KIS 가 과거 가격 전체를 새 기준으로 다시 계산
+    for day in fake.prices:
+        fake.prices[day] = 5_000
+    _trade_until(monkeypatch, date(2024, 6, 28))
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+
+    assert _closes() == {5_000}
+    oldest, newest = candle_store.date_range(SYMBOL)
+    assert newest == "20240628"
+    assert oldest >= candle_store._yyyymmdd(date(2024, 6, 28) - timedelta(days=candle_store.INITIAL_DAYS))
+    assert candle_store._meta(SYMBOL)[1] == 0
+
+
+def test_backfill_crosses_long_halt(monkeypatch):
+    # 2018-01 ~ 2019-06 거래정지 (140일 구간 3개 이상이 빈 구간)
+    source = FakeDaily(_weekdays(date(2015, 1, 1), date(2020, 12, 31), skip=(date(2018, 1, 2), date(2019, 6, 30))))
+    monkeypatch.setattr(candle_store, "_fetch_range", source.fetch)
+    monkeypatch.setattr(candle_store, "BACKFILL_PAGE_DELAY", 0)
+    _trade_until(monkeypatch, date(2020, 12, 31))
+
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+    asyncio.run(candle_store.backfill(SYMBOL, max_pages=100))
+
+    assert candle_store.date_range(SYMBOL)[0] == "20150101"
+    assert candle_store._meta(SYMBOL)[1] == 1
+
+
+def test_resync_without_new_bars_keeps_chart_version(fake, monkeypatch):
+    from ..services import chart_service
+
+    async def no_forming(symbol):
+        return None
+
+    async def no_sync(symbol):
+        pass
+
+    monkeypatch.setattr(chart_service, "_forming_daily_bar", no_forming)
+    monkeypatch.setattr(chart_service, "sync_daily", no_sync)
+
+    _trade_until(monkeypatch, date(2024, 6, 3))
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+    version, last_modified = asyncio.run(chart_service.chart_version(SYMBOL))
+    synced = candle_store.synced_at(SYMBOL)
+
+    # 다음 거래일 봉이 아직 없음 → 마지막 봉만 다시 받고 바뀐 값 없음
+    _trade_until(monkeypatch, date(2024, 6, 4))
+    del fake.prices["20240604"]
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+    assert candle_store.synced_at(SYMBOL) > synced
+    assert asyncio.run(chart_service.chart_version(SYMBOL)) == (version, last_modified)
+
+    # 다음 거래일 봉 추가 → 버전 / 변경 시각 갱신
+    fake.prices["20240604"] = 10_000
+    asyncio.run(candle_store._sync_tail(SYMBOL))
+    new_version, new_last_modified = asyncio.run(chart_service.chart_version(SYMBOL))
+    assert new_version != version and new_last_modified > last_modified
@@ -0,0 +1,65 @@
+"""
+차트 응답 형식 (rows / columns / msgpack) - 같은 데이터를 담는지 확인
+"""
+
+import math
+
+import msgpack
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from ..main import app
+from ..services.chart_format import negotiate_format, time_ints, time_strings
+
+
+def test_time_ints_match_strings():
+    days = np.arange(np.datetime64("1999-12-25"), np.datetime64("2001-03-05"))
+    assert time_ints(days).tolist() == [int(s) for s in time_strings(days)]
+
+
+def test_negotiate_format():
+    assert negotiate_format(None, None) == "rows"
+    assert negotiate_format(None, "application/x-msgpack, */*") == "msgpack"
+    assert negotiate_format(None, "application/vnd.stockchart.columns+json") == "columns"
+    assert negotiate_format("rows", "application/x-msgpack") == "rows"
+    with pytest.raises(ValueError):
+        negotiate_format("csv", None)
+
+
+def _decode_msgpack(content: bytes) -> dict:
+    payload = msgpack.unpackb(content, raw=False)
+    return {
+        key: np.frombuffer(raw, dtype="<" + {"int32": "i4", "int64": "i8", "float64": "f8"}[payload["dtypes"][key]])
+        for key, raw in payload["columns"].items()
+    } | {"length": payload["length"]}
+
+
+def test_formats_carry_same_data(mock_kis):
+    client = TestClient(app)
+    params = {"query": "005930", "limit": 15, "indicators": "sma20,rsi"}
+    rows = client.get("/chart/weekly", params=params)
+    columns = client.get("/chart/weekly", params={**params, "format": "columns"}).json()
+    binary = client.get("/chart/weekly", params=params, headers={"Accept": "application/x-msgpack"})
+    assert binary.headers["content-type"] == "application/x-msgpack"
+    assert rows.headers["vary"] == "Accept"
+
+    rows = rows.json()
+    decoded = _decode_msgpack(binary.content)
+    assert len(rows) == decoded["length"] == len(columns["time"]) == 15
+    assert [bar["time"] for bar in rows] == columns["time"] == [str(t) for t in decoded["time"]]
+    for key in ("open", "high", "low", "close", "volume", "sma20", "rsi14"):
+        from_rows = [bar[key] for bar in rows]
+        assert from_rows == columns[key], key
+        assert [None if math.isnan(v) else v for v in decoded[key].tolist()] == from_rows, key
+
+
+def test_format_has_its_own_etag(mock_kis):
+    client = TestClient(app)
+    rows = client.get("/chart/daily", params={"query": "005930"})
+    columns = client.get("/chart/daily", params={"query": "005930", "format": "columns"})
+    assert rows.headers["etag"] != columns.headers["etag"]
+    assert client.get(
+        "/chart/daily", params={"query": "005930"}, headers={"If-None-Match": rows.headers["etag"]}
+    ).status_code == 304
+    assert client.get("/chart/daily", params={"query": "005930", "format": "csv"}).status_code == 400
@@ -0,0 +1,41 @@
+"""
+/stock/dashboard (요약 + 차트 + 리스크 점수 4종, inquire-price 1회)
+"""
+
+from fastapi.testclient import TestClient
+
+from ..main import app
+from ..services import dashboard_service
+
+SECTIONS = ("summary", "chart", "volatility", "supply_risk", "financial", "profitability")
+
+
+def test_dashboard_uses_one_price_call(mock_kis):
+    response = TestClient(app).get("/stock/dashboard", params={"query": "삼성전자", "indicators": "sma5"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["symbol"] == "005930" and body["errors"] == {}
+    assert all(body[name] is not None for name in SECTIONS)
+    assert body["chart"] and "sma5" in body["chart"][-1]
+    assert body["summary"]["price"] > 0
+
+    stats = mock_kis()
+    assert stats["FHKST01010100"]["requests"] == 1
+    assert stats["FHKST66430600"]["requests"] == 1 and stats["FHKST66430400"]["requests"] == 1
+
+
+def test_failed_section_does_not_fail_dashboard(mock_kis, monkeypatch):
+    async def down(symbol):
+        raise RuntimeError("stability-ratio down")
+
+    monkeypatch.setattr(dashboard_service, "get_financial_ratios", down)
+    body = TestClient(app).get("/stock/dashboard", params={"query": "005930"}).json()
+    assert body["financial"] is None
+    assert body["errors"] == {"financial": "stability-ratio down"}
+    assert all(body[name] is not None for name in SECTIONS if name != "financial")
+
+
+def test_unknown_symbol_is_404(mock_kis):
+    response = TestClient(app).get("/stock/dashboard", params={"query": "없는회사"})
+    assert response.status_code == 404
+    assert mock_kis() == {}
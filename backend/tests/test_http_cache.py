@@ -0,0 +1,102 @@
+"""
+조건부 요청 (ETag / Last-Modified → 304) 과 리소스 키별 응답 바이트 재사용
+"""
+
+from email.utils import formatdate
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from ..core.cache import StaleMarkerMiddleware, mark_stale
+from ..core.http_cache import ResponseCache, etag_matches, make_etag
+
+LAST_MODIFIED = 1_700_000_000.0
+
+
+@pytest.fixture
+def server():
+    state = {"version": 1, "builds": 0, "stale": False}
+    responses = ResponseCache("test_response", max_age=3)
+    app = FastAPI()
+    app.add_middleware(StaleMarkerMiddleware)
+
+    @app.get("/quote/{symbol}")
+    async def quote(request: Request, symbol: str):
+        if state["stale"]:
+            mark_stale("quote", 5.0)
+
+        def build():
+            state["builds"] += 1
+            return {"symbol": symbol, "version": state["version"]}
+
+        return await responses.respond(
+            request, symbol, state["version"], build, last_modified=LAST_MODIFIED + state["version"]
+        )
+
+    return TestClient(app), state, responses
+
+
+def test_etag_revalidation(server):
+    client, state, responses = server
+    first = client.get("/quote/005930")
+    assert first.status_code == 200 and first.json() == {"symbol": "005930", "version": 1}
+    assert first.headers["cache-control"] == "public, max-age=3"
+    etag = first.headers["etag"]
+
+    revalidated = client.get("/quote/005930", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    # 조건 없이 다시 요청하면 저장한 바이트 재전송
+    again = client.get("/quote/005930")
+    assert again.content == first.content and state["builds"] == 1
+
+    # 원본이 바뀌면 ETag 도 바뀌고 본문 다시 생성
+    state["version"] = 2
+    changed = client.get("/quote/005930", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert changed.json()["version"] == 2 and state["builds"] == 2
+
+    stats = responses.stats()
+    assert (stats["hits"], stats["misses"], stats["not_modified"]) == (1, 2, 1)
+
+
+def test_resources_have_separate_etags(server):
+    client, state, _ = server
+    a = client.get("/quote/005930").headers["etag"]
+    b = client.get("/quote/000660").headers["etag"]
+    assert a != b
+    assert client.get("/quote/000660", headers={"If-None-Match": a}).status_code == 200
+    assert state["builds"] == 2
+
+
+def test_if_modified_since(server):
+    client, _, _ = server
+    first = client.get("/quote/005930")
+    assert first.headers["last-modified"] == formatdate(LAST_MODIFIED + 1, usegmt=True)
+
+    since = {"If-Modified-Since": first.headers["last-modified"]}
+    assert client.get("/quote/005930", headers=since).status_code == 304
+    older = {"If-Modified-Since": formatdate(LAST_MODIFIED - 60, usegmt=True)}
+    assert client.get("/quote/005930", headers=older).status_code == 200
+    assert client.get("/quote/005930", headers={"If-Modified-Since": "garbage"}).status_code == 200
+    # If-None-Match 가 있으면 If-Modified-Since 는 무시
+    assert client.get("/quote/005930", headers={**since, "If-None-Match": '"other"'}).status_code == 200
+
+
+def test_stale_response_is_not_cached_by_proxies(server):
+    client, state, _ = server
+    state["stale"] = True
+    response = client.get("/quote/005930")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-data-stale"] == "quote;age=5.0"
+
+
+def test_etag_matching():
+    etag = make_etag("005930", 1)
+    assert etag.startswith('"') and etag == make_etag("005930", 1)
+    assert etag != make_etag("005930", 2) and etag != make_etag("000660", 1)
+    assert etag_matches(f'"x", W/{etag}', (etag,))
+    assert etag_matches("*", (etag,))
+    assert not etag_matches(None, (etag,)) and not etag_matches('"x"', (etag,))
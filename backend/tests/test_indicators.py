@@ -0,0 +1,164 @@
+"""
+기술적 지표 계산 (단순 반복 구현과 비교) / 증분 갱신 / 차트 단위 검증
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from ..main import app
+from ..services.indicators import compute_indicators, parse_indicators
+
+NAMES = ("sma5", "sma20", "ema12", "ema60", "bb20", "rsi14", "macd")
+
+
+def _bars(n: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    close = [10_000.0]
+    for _ in range(n - 1):
+        close.append(max(100.0, close[-1] * (1 + rng.gauss(0, 0.02))))
+    days = np.arange(np.datetime64("2020-01-01"), np.datetime64("2020-01-01") + n)
+    return {"time": days, "close": np.array(close)}
+
+
+# ✅ 기준 구현 (한 칸씩 반복)
+def _sma(x, n):
+    return [math.nan if i < n - 1 else sum(x[i - n + 1 : i + 1]) / n for i in range(len(x))]
+
+
+def _ema(x, n, alpha):
+    out = [math.nan] * len(x)
+    start = next((i for i, v in enumerate(x) if not math.isnan(v)), len(x))
+    if len(x) - start < n:
+        return out
+    prev = sum(x[start : start + n]) / n
+    out[start + n - 1] = prev
+    for i in range(start + n, len(x)):
+        prev = alpha * x[i] + (1 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+def _bollinger(x, n=20, width=2.0):
+    upper, mid, lower = [], [], []
+    for i in range(len(x)):
+        if i < n - 1:
+            upper.append(math.nan), mid.append(math.nan), lower.append(math.nan)
+            continue
+        w = x[i - n + 1 : i + 1]
+        m = sum(w) / n
+        sd = math.sqrt(sum((v - m) ** 2 for v in w) / n)
+        upper.append(m + width * sd), mid.append(m), lower.append(m - width * sd)
+    return upper, mid, lower
+
+
+def _rsi(x, n=14):
+    diff = [b - a for a, b in zip(x, x[1:])]
+    gain = _ema([max(d, 0.0) for d in diff], n, 1 / n)
+    loss = _ema([max(-d, 0.0) for d in diff], n, 1 / n)
+    out = [math.nan]
+    for g, l in zip(gain, loss):
+        if math.isnan(g):
+            out.append(math.nan)
+        elif l == 0:
+            out.append(50.0 if g == 0 else 100.0)
+        else:
+            out.append(100 - 100 / (1 + g / l))
+    return out
+
+
+def _macd(x):
+    macd = [f - s for f, s in zip(_ema(x, 12, 2 / 13), _ema(x, 26, 2 / 27))]
+    signal = _ema(macd, 9, 2 / 10)
+    return macd, signal, [m - s for m, s in zip(macd, signal)]
+
+
+def _expected(close: list) -> dict:
+    upper, mid, lower = _bollinger(close)
+    macd, signal, hist = _macd(close)
+    return {
+        "sma5": _sma(close, 5),
+        "sma20": _sma(close, 20),
+        "ema12": _ema(close, 12, 2 / 13),
+        "ema60": _ema(close, 60, 2 / 61),
+        "bb_upper": upper,
+        "bb_middle": mid,
+        "bb_lower": lower,
+        "rsi14": _rsi(close),
+        "macd": macd,
+        "macd_signal": signal,
+        "macd_hist": hist,
+    }
+
+
+def _assert_close(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys()
+    for key, want in expected.items():
+        got = actual[key]
+        assert len(got) == len(want), key
+        for i, (g, w) in enumerate(zip(got, want)):
+            if math.isnan(w):
+                assert g is None, (key, i, g)
+            else:
+                assert g == pytest.approx(w, rel=1e-9, abs=1e-9), (key, i)
+
+
+def test_full_compute_matches_reference():
+    bars = _bars(400)
+    actual = compute_indicators(("full", 0), bars, NAMES)
+    _assert_close(actual, _expected(bars["close"].tolist()))
+
+
+def test_incremental_matches_full_compute():
+    bars = _bars(300, seed=1)
+    # 같은 키로 한 봉씩 늘려가며 조회 → 매번 처음부터 계산한 값과 같아야 함
+    for n in range(30, 300, 7):
+        part = {"time": bars["time"][:n], "close": bars["close"][:n]}
+        incremental = compute_indicators(("incremental", 0), part, NAMES)
+        _assert_close(incremental, _expected(part["close"].tolist()))
+
+
+def test_forming_bar_is_not_committed():
+    bars = _bars(120, seed=2)
+    key = ("forming", 0)
+    compute_indicators(key, bars, NAMES)
+    # 마지막 봉(형성 중) 값만 바뀐 경우
+    moved = {"time": bars["time"], "close": bars["close"].copy()}
+    moved["close"][-1] *= 1.05
+    _assert_close(compute_indicators(key, moved, NAMES), _expected(moved["close"].tolist()))
+
+
+def test_rewritten_history_rebuilds_state():
+    bars = _bars(200, seed=3)
+    key = ("rewritten", 0)
+    compute_indicators(key, {"time": bars["time"][:150], "close": bars["close"][:150]}, NAMES)
+    # 액면분할 등으로 과거 가격 전체가 다시 계산된 경우 (날짜는 같음)
+    adjusted = {"time": bars["time"], "close": bars["close"] / 2}
+    _assert_close(compute_indicators(key, adjusted, NAMES), _expected(adjusted["close"].tolist()))
+
+
+def test_parse_indicators():
+    assert parse_indicators("sma,rsi,BB,macd,ema20,sma5") == (
+        "sma5", "sma20", "sma60", "sma120", "rsi14", "bb20", "macd", "ema20",
+    )
+    assert parse_indicators(None) == ()
+    for bad in ("vwap", "sma1", "ema999"):
+        with pytest.raises(ValueError):
+            parse_indicators(bad)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/chart/hourly?query=005930",
+        "/chart/batch?query=005930&timeframe=hourly",
+        "/stock/dashboard?query=005930&timeframe=minute",
+    ],
+)
+def test_unknown_timeframe_is_400(url):
+    response = TestClient(app).get(url)
+    assert response.status_code == 400
+    assert "지원하지 않는 차트 단위" in response.json()["detail"]
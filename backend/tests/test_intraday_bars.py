@@ -0,0 +1,96 @@
+"""
+실시간 체결 → 분봉 링 버퍼 (단순 집계와 비교 / 늦게 도착한 체결 / 덮어쓰기)
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from ..services import intraday_bars
+from ..services.intraday_bars import RingBars, minute_strings, on_tick, tick_minute
+
+DAY = "20240603"
+
+
+def _ticks(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    minute = tick_minute({"date": DAY, "time": "090000"})
+    price = 70_000
+    ticks = []
+    for _ in range(n):
+        minute += rng.choice((0, 0, 0, 1, 2, 7))
+        price += rng.randint(-3, 3) * 100
+        ticks.append((minute, float(price), rng.randint(1, 50)))
+    return ticks
+
+
+def _naive(ticks: list, interval: int) -> list:
+    bars = {}
+    for minute, price, volume in ticks:
+        start = minute - minute % interval
+        bar = bars.get(start)
+        if bar is None:
+            bars[start] = [start, price, price, price, price, volume]
+        else:
+            bar[2], bar[3], bar[4] = max(bar[2], price), min(bar[3], price), price
+            bar[5] += volume
+    return [tuple(bar) for _, bar in sorted(bars.items())]
+
+
+def _rows(ring: RingBars, limit=None) -> list:
+    snap = ring.snapshot(limit)
+    return list(zip(*(snap[key].tolist() for key in ("time", "open", "high", "low", "close", "volume"))))
+
+
+@pytest.mark.parametrize("interval", intraday_bars.INTERVALS)
+def test_matches_naive_aggregation(interval):
+    ticks = _ticks(3000, seed=interval)
+    ring = RingBars(interval, capacity=10_000)
+    for tick in ticks:
+        ring.update(*tick)
+    assert _rows(ring) == _naive(ticks, interval)
+
+
+def test_late_tick_for_closed_bar_is_ignored():
+    ring = RingBars(5)
+    ring.update(600, 100.0, 1)
+    ring.update(605, 101.0, 1)
+    assert ring.update(603, 999.0, 1) == (None, None)
+    assert [bar[2] for bar in _rows(ring)] == [100.0, 101.0]
+
+
+def test_ring_overwrites_oldest_bars():
+    ticks = [(minute, float(minute), 1) for minute in range(100)]
+    ring = RingBars(1, capacity=16)
+    for tick in ticks:
+        ring.update(*tick)
+    assert _rows(ring) == _naive(ticks, 1)[-16:]
+    assert _rows(ring, limit=3) == _naive(ticks, 1)[-3:]
+
+
+def test_on_tick_reports_closed_bar_first(monkeypatch):
+    monkeypatch.setattr(intraday_bars, "_bars", {})
+    tick = {"symbol": "005930", "date": DAY, "price": 70000, "volume": 10}
+    first = on_tick({**tick, "time": "090010"})
+    assert [(interval, closed) for interval, _, closed in first] == [(1, False), (5, False), (30, False)]
+
+    messages = on_tick({**tick, "time": "090105", "price": 70100})
+    # 1분봉만 새 구간 → 확정된 09:00 봉 먼저, 이어서 형성 중인 09:01 봉
+    assert [(interval, bar["time"], closed) for interval, bar, closed in messages] == [
+        (1, "202406030900", True),
+        (1, "202406030901", False),
+        (5, "202406030900", False),
+        (30, "202406030900", False),
+    ]
+    assert messages[2][1] == {
+        "time": "202406030900", "open": 70000.0, "high": 70100.0, "low": 70000.0, "close": 70100.0, "volume": 20,
+    }
+    assert minute_strings(intraday_bars.get_bars("005930", 1)["time"]) == ["202406030900", "202406030901"]
+    intraday_bars.drop("005930")
+    assert intraday_bars.get_bars("005930", 1) is None
+
+
+def test_minute_strings():
+    minutes = np.array([tick_minute({"date": "20241231", "time": "235900"})])
+    assert minute_strings(minutes) == ["202412312359"]
@@ -0,0 +1,57 @@
+"""
+공용 KIS 클라이언트 (커넥션 풀 1개 공유 / TR_ID 별 요청 정의)
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from ..core import kis_client, token_manager
+from ..main import app
+
+
+def test_client_is_shared_until_closed(monkeypatch):
+    monkeypatch.setattr(kis_client, "_client", None)
+    first = kis_client.get_client()
+    assert kis_client.get_client() is first
+
+    asyncio.run(kis_client.close_client())
+    assert first.is_closed and kis_client._client is None
+    second = kis_client.get_client()
+    assert second is not first
+    asyncio.run(kis_client.close_client())
+
+
+def test_request_definition(monkeypatch):
+    monkeypatch.setenv("APP_KEY", "key")
+    monkeypatch.setenv("APP_SECRET", "secret")
+    headers = kis_client.build_headers("FHKST01010100", "token")
+    assert headers["authorization"] == "Bearer token" and headers["tr_id"] == "FHKST01010100"
+    assert (headers["appkey"], headers["appsecret"]) == ("key", "secret")
+
+    params = kis_client.build_params("FHKST03010100", "005930", fid_input_date_1="20240101")
+    assert params == {
+        "fid_cond_mrkt_div_code": "J",
+        "fid_period_div_code": "D",
+        "fid_org_adj_prc": "0",
+        "fid_input_iscd": "005930",
+        "fid_input_date_1": "20240101",
+    }
+    # 기본 파라미터는 요청마다 복사
+    assert "fid_input_iscd" not in kis_client.TR_SPECS["FHKST03010100"]["params"]
+
+
+def test_routes_share_one_client_and_token(mock_kis):
+    shared = kis_client._client
+    client = TestClient(app)
+    for path in ("/stock/summary", "/stock/volatility", "/stock/supply-risk", "/stock/financial", "/stock/profitability"):
+        assert client.get(path, params={"query": "005930"}).status_code == 200, path
+
+    assert kis_client._client is shared and not shared.is_closed
+    assert token_manager._token["access_token"] == "mock-access-token"
+    # 시세 기반 3개 라우트는 inquire-price 1회를 함께 사용
+    assert {tr_id: entry["requests"] for tr_id, entry in mock_kis().items()} == {
+        "FHKST01010100": 1,
+        "FHKST66430600": 1,
+        "FHKST66430400": 1,
+    }
@@ -0,0 +1,86 @@
+"""
+Prometheus 메트릭 (/metrics) 과 샘플링 로그
+"""
+
+import logging
+import re
+
+from fastapi.testclient import TestClient
+
+from ..core import metrics
+from ..core.log import log_sampled, preview
+from ..core.metrics import Callback, Counter, Histogram, render_metrics
+from ..main import app
+
+
+def test_metric_text_format(monkeypatch):
+    monkeypatch.setattr(metrics, "_registry", [])
+    errors = Counter("test_errors_total", "오류 수", ("tr_id", "reason"))
+    latency = Histogram("test_latency_seconds", "응답 시간", ("route",), buckets=(0.1, 1.0))
+    Callback("test_queue", "대기열", "gauge", lambda: [((), 3)])
+
+    errors.inc("FHKST01010100", 'say "hi"')
+    errors.inc("FHKST01010100", 'say "hi"', amount=2)
+    for value in (0.05, 0.5, 0.7, 5.0):
+        latency.observe(value, "/chart/{timeframe}")
+
+    assert render_metrics().splitlines() == [
+        "# HELP test_errors_total 오류 수",
+        "# TYPE test_errors_total counter",
+        'test_errors_total{tr_id="FHKST01010100",reason="say \\"hi\\""} 3.0',
+        "# HELP test_latency_seconds 응답 시간",
+        "# TYPE test_latency_seconds histogram",
+        'test_latency_seconds_bucket{route="/chart/{timeframe}",le="0.1"} 1',
+        'test_latency_seconds_bucket{route="/chart/{timeframe}",le="1.0"} 3',
+        'test_latency_seconds_bucket{route="/chart/{timeframe}",le="+Inf"} 4',
+        'test_latency_seconds_sum{route="/chart/{timeframe}"} 6.25',
+        'test_latency_seconds_count{route="/chart/{timeframe}"} 4',
+        "# HELP test_queue 대기열",
+        "# TYPE test_queue gauge",
+        "test_queue 3",
+    ]
+
+
+def _value(text: str, series: str) -> float:
+    match = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_metrics_endpoint(mock_kis):
+    client = TestClient(app)
+    before = client.get("/metrics").text
+    client.get("/stock/summary", params={"query": "005930"})
+    client.get("/stock/summary", params={"query": "005930"})
+    client.get("/chart/weekly", params={"query": "005930"})
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    def delta(series):
+        return _value(text, series) - _value(before, series)
+
+    # 경로 템플릿 단위로 집계 (/chart/weekly → /chart/{timeframe})
+    assert delta('http_request_duration_seconds_count{method="GET",route="/stock/summary",status="200"}') == 2
+    assert delta('http_request_duration_seconds_count{method="GET",route="/chart/{timeframe}",status="200"}') == 1
+    assert delta('kis_upstream_request_duration_seconds_count{tr_id="FHKST01010100"}') == 1
+    assert delta('kis_token_refresh_total{result="success"}') == 1
+    assert 'cache_hits_total{cache="quote"}' in text
+    assert 'kis_circuit_state{tr_id="FHKST01010100"} 0' in text
+
+
+def test_log_sampled(caplog):
+    logger = logging.getLogger("backend.tests.sampled")
+    with caplog.at_level(logging.DEBUG, logger="backend.tests.sampled"):
+        # DEBUG 는 꺼진 레벨
+        logger.setLevel(logging.INFO)
+        for _ in range(20):
+            log_sampled(logger, logging.INFO, "kept %s", 1, rate=1.0)
+            log_sampled(logger, logging.INFO, "dropped", rate=0.0)
+            log_sampled(logger, logging.DEBUG, "disabled level", rate=1.0)
+    assert [r.getMessage() for r in caplog.records] == ["kept 1"] * 20
+
+
+def test_preview_truncates():
+    assert preview("abc", limit=5) == "abc"
+    assert preview("x" * 10, limit=4) == "xxxx... (10자)"
@@ -0,0 +1,79 @@
+"""
+로컬 KIS 대역 서버 (mock_kis) 와 부하 테스트 도구 (bench/load_test)
+"""
+
+import json
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from ..bench.load_test import run_scenario
+from ..main import app
+from ..mock_kis.server import LISTING_DATE, MockConfig, create_app, synth_itemchart
+
+PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-price"
+ITEMCHART_PATH = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+
+
+def _get(client: TestClient, path: str, tr_id: str, **params):
+    return client.get(path, headers={"tr_id": tr_id}, params={"fid_input_iscd": "005930", **params})
+
+
+def test_synthetic_data_is_deterministic():
+    a = TestClient(create_app(MockConfig(latency=0, jitter=0)))
+    b = TestClient(create_app(MockConfig(latency=0, jitter=0)))
+    params = {"fid_input_date_1": "20240101", "fid_input_date_2": "20240630"}
+    first = _get(a, ITEMCHART_PATH, "FHKST03010100", **params).json()
+    assert first["rt_cd"] == "0"
+    assert first == _get(b, ITEMCHART_PATH, "FHKST03010100", **params).json()
+
+    rows = first["output2"]
+    days = [row["stck_bsop_date"] for row in rows]
+    # 최신순, 최대 100건, 주말 제외
+    assert len(rows) == 100 and days == sorted(days, reverse=True) and days[0] == "20240628"
+    for row in rows:
+        assert int(row["stck_lwpr"]) <= min(int(row["stck_oprc"]), int(row["stck_clpr"]))
+        assert int(row["stck_hgpr"]) >= max(int(row["stck_oprc"]), int(row["stck_clpr"]))
+
+
+def test_history_ends_at_listing_date():
+    assert synth_itemchart("005930", "20100101", LISTING_DATE.strftime("%Y%m%d"))[-1]["stck_bsop_date"] == (
+        LISTING_DATE.strftime("%Y%m%d")
+    )
+    assert synth_itemchart("005930", "20100101", "20141231") == []
+
+
+def test_errors_throttling_and_stats():
+    failing = TestClient(create_app(MockConfig(latency=0, jitter=0, error_rate=1.0)))
+    response = _get(failing, PRICE_PATH, "FHKST01010100")
+    assert response.status_code == 500 and response.json()["rt_cd"] == "1"
+
+    limited = TestClient(create_app(MockConfig(latency=0, jitter=0, rate_limit=2)))
+    codes = [_get(limited, PRICE_PATH, "FHKST01010100").json().get("msg_cd") for _ in range(3)]
+    assert codes[2] == "EGW00201" and "EGW00201" not in codes[:2]
+    assert limited.get("/mock/stats").json() == {"FHKST01010100": {"requests": 3, "errors": 0, "throttled": 1}}
+
+
+def test_recorded_fixtures_take_precedence(tmp_path):
+    (tmp_path / "FHKST01010100").mkdir()
+    recorded = {"rt_cd": "0", "output": {"stck_prpr": "12345"}}
+    (tmp_path / "FHKST01010100" / "005930.json").write_text(json.dumps(recorded), encoding="utf-8")
+    client = TestClient(create_app(MockConfig(latency=0, jitter=0, fixtures=str(tmp_path))))
+
+    assert _get(client, PRICE_PATH, "FHKST01010100").json() == recorded
+    other = client.get(PRICE_PATH, headers={"tr_id": "FHKST01010100"}, params={"fid_input_iscd": "000660"})
+    assert other.json()["output"]["stck_prpr"] != "12345"
+
+
+def test_load_scenario_against_mock(mock_kis):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://backend") as client:
+            return await run_scenario(client, "/stock/summary?query={q}", ["005930", "000660"], 4, 30, 20)
+
+    result = asyncio.run(scenario())
+    assert result["requests"] == 20 and result["errors"] == 0
+    assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"] <= result["max_ms"]
+    # 시세 캐시 → 종목당 업스트림 1회
+    assert mock_kis()["FHKST01010100"]["requests"] == 2
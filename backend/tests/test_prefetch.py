@@ -0,0 +1,20 @@
+"""
+미리 조회 대상 선정 (캐시 유지 시간이 주기보다 짧은 시세는 제외)
+"""
+
+from ..services import prefetch_service, ratio_store
+
+
+def _kinds(monkeypatch, ttl: float) -> int:
+    monkeypatch.setattr(prefetch_service, "quote_ttl", lambda: ttl)
+    return len(prefetch_service._cold_loaders("005930"))
+
+
+def test_quote_skipped_while_ttl_shorter_than_interval(monkeypatch):
+    # 장중: 시세 3초 → 일봉 + 재무비율만
+    assert _kinds(monkeypatch, 3) == 1 + len(ratio_store.RATIO_TR_IDS)
+
+
+def test_quote_prefetched_when_ttl_outlives_interval(monkeypatch):
+    # 장 마감 후: 다음 정규장 시작까지 유지 → 시세도 미리 조회
+    assert _kinds(monkeypatch, prefetch_service.INTERVAL * 10) == 2 + len(ratio_store.RATIO_TR_IDS)
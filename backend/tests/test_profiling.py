@@ -0,0 +1,75 @@
+"""
+요청 단위 프로파일링 (Server-Timing / cProfile 결과 저장 · 조회)
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ..core import profiling
+from ..core.profiling import server_timing, span
+from ..main import _chart_responses, app
+
+TOKEN = "test-profile-token"
+
+
+@pytest.fixture
+def profiled(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_TOKEN", TOKEN)
+    monkeypatch.setattr(profiling, "SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiling, "DUMP_RATE", 0.0)
+    monkeypatch.setattr(profiling, "DUMP_DIR", str(tmp_path / "profiles"))
+    return TestClient(app)
+
+
+def _timings(header: str) -> dict:
+    return {part.split(";")[0]: part for part in header.split(", ")}
+
+
+def test_server_timing_merges_repeated_spans():
+    assert server_timing([("parse", 0.001), ("score", 0.002), ("parse", 0.003)], 0.01) == (
+        'parse;dur=4.00;desc="x2", score;dur=2.00, total;dur=10.00'
+    )
+
+
+def test_span_outside_profiled_request_is_noop():
+    with span("parse") as s:
+        pass
+    assert s._spans is None
+
+
+def test_unprofiled_request_has_no_timing(profiled, mock_kis):
+    response = profiled.get("/stock/summary", params={"query": "005930"})
+    assert response.status_code == 200 and "server-timing" not in response.headers
+    response = profiled.get("/stock/summary", params={"query": "005930"}, headers={"X-Profile": "wrong"})
+    assert "server-timing" not in response.headers
+
+
+def test_admin_header_reports_spans(profiled, mock_kis):
+    # 다른 테스트가 같은 차트 응답 바이트를 남겼으면 store / encode 구간 없이 재전송하므로 비움
+    _chart_responses.invalidate()
+    response = profiled.get("/chart/daily", params={"query": "005930"}, headers={"X-Profile": TOKEN})
+    timings = _timings(response.headers["server-timing"])
+    assert {"lookup", "token", "queue", "upstream.FHKST03010100", "store", "encode", "total"} <= set(timings)
+    assert "x-profile-dump" not in response.headers
+
+
+def test_dump_saved_and_listed(profiled, mock_kis, monkeypatch):
+    admin = {"X-Profile": TOKEN}
+    response = profiled.get("/stock/summary", params={"query": "005930"}, headers={**admin, "X-Profile-Dump": "1"})
+    name = response.headers["x-profile-dump"]
+    assert name.endswith("-stock_summary.prof")
+
+    assert profiled.get("/profiles").status_code == 403
+    assert profiled.get("/profiles", headers=admin).json() == [name]
+    text = profiled.get(f"/profiles/{name}", params={"limit": 5, "sort": "tottime"}, headers=admin)
+    assert text.status_code == 200 and "function calls" in text.text
+    raw = profiled.get(f"/profiles/{name}", params={"format": "raw"}, headers=admin)
+    assert raw.headers["content-type"] == "application/octet-stream" and raw.content
+    assert profiled.get("/profiles/missing.prof", headers=admin).status_code == 404
+
+    # 보관 개수 초과분은 오래된 것부터 삭제
+    monkeypatch.setattr(profiling, "DUMP_KEEP", 1)
+    newer = profiled.get(
+        "/stock/volatility", params={"query": "005930"}, headers={**admin, "X-Profile-Dump": "1"}
+    ).headers["x-profile-dump"]
+    assert profiling.list_dumps() == [newer]
@@ -0,0 +1,68 @@
+"""
+KIS 실시간 체결 프레임 파싱 / 잘못된 입력 처리
+"""
+
+import json
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from ..main import app
+from ..services.quote_feed import KisFeedSource, parse_execution_frame
+
+
+def _fields(symbol: str, price: int) -> list:
+    f = ["0"] * 46
+    f[0], f[1], f[2], f[4], f[5] = symbol, "093001", str(price), "100", "0.15"
+    f[7], f[8], f[9], f[12], f[13] = str(price - 10), str(price + 10), str(price - 20), "5", "1000"
+    return f
+
+
+def _frame(*ticks) -> str:
+    fields = [v for symbol, price in ticks for v in _fields(symbol, price)]
+    return f"0|H0STCNT0|{len(ticks):03d}|" + "^".join(fields)
+
+
+def test_parse_multiple_ticks():
+    ticks = parse_execution_frame(_frame(("005930", 70000), ("000660", 180000)))
+    assert [(t["symbol"], t["price"], t["acml_vol"]) for t in ticks] == [
+        ("005930", 70000, 1000),
+        ("000660", 180000, 1000),
+    ]
+    assert ticks[0]["change_rate"] == 0.15 and ticks[0]["time"] == "093001"
+
+
+def test_malformed_frames_are_skipped_without_dropping_connection():
+    published = []
+    source = KisFeedSource()
+    source._publish = published.append
+
+    good = _frame(("005930", 70000))
+    bad = [
+        good[:40],  # 잘린 프레임
+        good.replace("^70000^", "^7x000^"),  # 숫자 아님
+        "0|H0STCNT0|000|",  # 건수 0
+        "0|H0STCNT0|abc|1^2",
+        "{not json",
+        "[1, 2]",
+    ]
+
+    async def run():
+        for raw in bad + [good]:
+            await source._handle(None, raw)
+
+    asyncio.run(run())
+    assert source.bad_frames == len(bad)
+    assert [t["symbol"] for t in published] == ["005930"]
+
+
+def test_ws_rejects_non_list_payloads():
+    client = TestClient(app)
+    with client.websocket_connect("/ws/quotes") as ws:
+        for message in (
+            {"action": "subscribe", "symbols": "005930"},
+            {"action": "bars", "intervals": "15"},
+        ):
+            ws.send_text(json.dumps(message))
+            reply = ws.receive_json()
+            assert reply["type"] == "error" and "배열" in reply["detail"]
@@ -0,0 +1,112 @@
+"""
+실시간 시세 허브 retain (동시 호출 / 연장 / 만료 후 구독 해제 / 구독 실패)
+"""
+
+import asyncio
+
+import pytest
+
+from ..services.quote_hub import QuoteHub
+from ..services.quote_feed import FeedSource
+
+
+class SlowSource(FeedSource):
+    """구독 / 해제가 업스트림 왕복만큼 걸리는 피드"""
+
+    def __init__(self):
+        self.symbols = set()
+        self.subscribe_calls = 0
+        self.fail = False
+
+    async def start(self, publish):
+        await asyncio.sleep(0.01)
+
+    async def subscribe(self, symbol: str):
+        self.subscribe_calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("subscribe rejected")
+        self.symbols.add(symbol)
+
+    async def unsubscribe(self, symbol: str):
+        await asyncio.sleep(0.01)
+        self.symbols.discard(symbol)
+
+    async def stop(self):
+        pass
+
+
+def test_concurrent_retain_subscribes_once():
+    async def scenario():
+        source = SlowSource()
+        hub = QuoteHub(source)
+        await asyncio.gather(*(hub.retain("005930", 60) for _ in range(10)))
+
+        assert source.subscribe_calls == 1
+        assert len(hub._subscribers["005930"]) == 1 and list(hub._retainers) == ["005930"]
+        await hub.stop()
+
+    asyncio.run(scenario())
+
+
+def test_extending_retain_keeps_single_timer():
+    async def scenario():
+        source = SlowSource()
+        hub = QuoteHub(source)
+        await hub.retain("005930", 0.05)
+        retainer = hub._retainers["005930"]
+        timer = retainer.timer
+
+        for _ in range(10_000):
+            await hub.retain("005930", 0.05)
+        assert retainer.timer is timer
+
+        # 처음 만료 시각이 지나도 연장된 동안은 유지
+        await asyncio.sleep(0.03)
+        await hub.retain("005930", 0.05)
+        await asyncio.sleep(0.03)
+        assert "005930" in source.symbols and hub._retainers.get("005930") is retainer
+
+        await asyncio.sleep(0.1)
+        assert not source.symbols and not hub._subscribers and not hub._retainers
+        await hub.stop()
+
+    asyncio.run(scenario())
+
+
+def test_failed_subscribe_raises_for_every_caller():
+    async def scenario():
+        source = SlowSource()
+        source.fail = True
+        hub = QuoteHub(source)
+        results = await asyncio.gather(
+            *(hub.retain("000660", 60) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert source.subscribe_calls == 1 and not hub._retainers and not hub._subscribers
+
+        # 다음 호출은 다시 구독 시도
+        source.fail = False
+        await hub.retain("000660", 60)
+        assert source.symbols == {"000660"}
+        await hub.stop()
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_first_retain_lets_next_caller_subscribe():
+    async def scenario():
+        source = SlowSource()
+        hub = QuoteHub(source)
+        first = asyncio.ensure_future(hub.retain("005930", 60))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert not hub._retainers
+
+        await hub.retain("005930", 60)
+        assert "005930" in hub._retainers
+        await hub.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,76 @@
+"""
+재무비율 로컬 저장소 (결산 기간별 저장 / 재확인 주기 / 이력 API)
+"""
+
+import asyncio
+import time
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from ..main import app
+from ..services import ratio_store
+
+SYMBOL = "005930"
+
+
+def _requests(stats: dict, kind: str) -> int:
+    return stats.get(ratio_store.RATIO_TR_IDS[kind], {}).get("requests", 0)
+
+
+def test_periods_are_stored_and_served_locally(mock_kis):
+    async def scenario():
+        periods = await asyncio.gather(*(ratio_store.get_periods(SYMBOL, "stability") for _ in range(5)))
+        assert all(p == periods[0] for p in periods)
+        assert len(periods[0]) == 8
+        keys = [row["stac_yymm"] for row in periods[0]]
+        assert keys == sorted(keys, reverse=True)
+        assert await ratio_store.get_latest(SYMBOL, "stability") == periods[0][0]
+        assert await ratio_store.get_periods(SYMBOL, "stability", limit=3) == periods[0][:3]
+
+    asyncio.run(scenario())
+    # 동시 요청은 1번만 조회, 이후 요청은 저장소에서 응답
+    assert _requests(mock_kis(), "stability") == 1
+    assert ratio_store.is_fresh(SYMBOL, "stability")
+
+
+def test_expired_periods_are_served_then_revalidated(mock_kis):
+    async def scenario():
+        await ratio_store.get_periods(SYMBOL, "profitability")
+        old = time.time() - ratio_store.REVALIDATE_SECONDS - ratio_store.EARNINGS_REVALIDATE_SECONDS - 1
+        ratio_store._db().execute("UPDATE ratio_meta SET checked_at = ?", (old,))
+        ratio_store._revalidate_cache.invalidate()
+
+        # 저장된 값으로 바로 응답하고 재확인은 백그라운드에서
+        assert len(await ratio_store.get_periods(SYMBOL, "profitability")) == 8
+        assert ratio_store.checked_at(SYMBOL, "profitability") == old
+        await asyncio.gather(*ratio_store._background_tasks)
+        assert ratio_store.is_fresh(SYMBOL, "profitability")
+
+    asyncio.run(scenario())
+    assert _requests(mock_kis(), "profitability") == 2
+
+
+def test_earnings_season():
+    assert ratio_store.is_earnings_season(date(2024, 3, 31))
+    assert ratio_store.is_earnings_season(date(2024, 8, 20))
+    assert not ratio_store.is_earnings_season(date(2024, 4, 14))
+    assert not ratio_store.is_earnings_season(date(2024, 12, 1))
+
+
+def test_history_route(mock_kis):
+    client = TestClient(app)
+    response = client.get("/stock/ratios/history", params={"query": SYMBOL, "limit": 4})
+    assert response.status_code == 200
+    history = response.json()["history"]
+    assert set(history) == {"stability", "profitability"}
+    assert all(len(items) == 4 for items in history.values())
+    assert {"report_date", "score", "risk_level", "raw_data", "score_details"} <= set(history["stability"][0])
+
+    again = client.get(
+        "/stock/ratios/history", params={"query": SYMBOL, "limit": 4}, headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert again.status_code == 304
+    only = client.get("/stock/ratios/history", params={"query": SYMBOL, "kind": "stability"}).json()["history"]
+    assert list(only) == ["stability"] and len(only["stability"]) == 8
+    assert _requests(mock_kis(), "stability") == 1
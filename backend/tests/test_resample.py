@@ -0,0 +1,75 @@
+"""
+일봉 → 주/월/분기/년봉 변환 (단순 그룹핑 구현과 비교)
+"""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from ..services.resample import rows_to_arrays, resample
+
+PERIODS = {
+    "weekly": lambda d: d.isocalendar()[:2],
+    "monthly": lambda d: (d.year, d.month),
+    "quarterly": lambda d: (d.year, (d.month - 1) // 3),
+    "yearly": lambda d: d.year,
+}
+
+
+def _daily_rows(seed: int = 0) -> list:
+    rng = random.Random(seed)
+    rows = []
+    d = date(2021, 12, 27)
+    price = 50_000.0
+    while d <= date(2024, 3, 8):
+        # 주말 + 임의 휴장일 제외
+        if d.weekday() < 5 and rng.random() > 0.05:
+            o = price
+            c = max(1.0, o + rng.uniform(-1500, 1500))
+            rows.append((d.strftime("%Y%m%d"), o, max(o, c) + rng.uniform(0, 800), min(o, c) - rng.uniform(0, 800), c, rng.randint(1, 10**6)))
+            price = c
+        d += timedelta(days=1)
+    return rows
+
+
+def _naive(rows: list, timeframe: str) -> list:
+    groups: dict = {}
+    for row in rows:
+        day = date(int(row[0][:4]), int(row[0][4:6]), int(row[0][6:]))
+        groups.setdefault(PERIODS[timeframe](day), []).append(row)
+    return [
+        (
+            np.datetime64(f"{g[-1][0][:4]}-{g[-1][0][4:6]}-{g[-1][0][6:]}"),
+            g[0][1],
+            max(r[2] for r in g),
+            min(r[3] for r in g),
+            g[-1][4],
+            sum(r[5] for r in g),
+        )
+        for g in groups.values()
+    ]
+
+
+@pytest.mark.parametrize("timeframe", PERIODS)
+def test_resample_matches_naive_grouping(timeframe):
+    rows = _daily_rows()
+    bars = resample(rows_to_arrays(rows), timeframe)
+    got = list(zip(bars["time"], bars["open"], bars["high"], bars["low"], bars["close"], bars["volume"]))
+    assert got == _naive(rows, timeframe)
+
+
+def test_week_spans_year_boundary():
+    # 2024-12-30(월) ~ 2025-01-03(금) 은 같은 주
+    rows = [("20241230", 1, 2, 1, 2, 10), ("20250102", 2, 5, 2, 3, 20), ("20250103", 3, 4, 0.5, 4, 30)]
+    bars = resample(rows_to_arrays(rows), "weekly")
+    assert bars["time"].tolist() == [date(2025, 1, 3)]
+    assert (bars["open"][0], bars["high"][0], bars["low"][0], bars["close"][0], bars["volume"][0]) == (1, 5, 0.5, 4, 60)
+
+
+def test_empty_and_unknown_timeframe():
+    empty = rows_to_arrays([])
+    assert len(resample(empty, "weekly")["time"]) == 0
+    with pytest.raises(ValueError):
+        resample(rows_to_arrays([("20240102", 1, 1, 1, 1, 1)]), "hourly")
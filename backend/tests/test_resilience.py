@@ -0,0 +1,201 @@
+"""
+업스트림 장애 대응 (서킷 브레이커 / 재시도 / stale-while-revalidate)
+KIS 응답은 httpx.MockTransport 로 대체
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ..core import circuit_breaker, kis_client, token_manager
+from ..core.cache import AsyncTTLCache, StaleMarkerMiddleware, mark_stale
+from ..core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen
+from ..core.scheduler import TokenBucketScheduler
+
+TR_ID = "FHKST01010100"
+
+
+def _expire(breaker: CircuitBreaker):
+    breaker.opened_at -= breaker.recovery_seconds
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_seconds=30)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    # 중간 성공이 있으면 연속 실패 수 초기화
+    breaker.before_call()
+    breaker.record_success()
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpen) as raised:
+        breaker.before_call()
+    assert 0 < raised.value.retry_after <= 30
+    assert breaker.stats()["rejected"] == 1 and breaker.stats()["opened"] == 1
+
+
+def test_breaker_half_open_allows_limited_trials():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_seconds=30, half_open_max=1)
+    breaker.before_call()
+    breaker.record_failure()
+    _expire(breaker)
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+    # 판정 없이 끝난 시험 요청은 반환
+    breaker.release()
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_breaker_half_open_failure_reopens():
+    breaker = CircuitBreaker("test", failure_threshold=5, recovery_seconds=30)
+    for _ in range(5):
+        breaker.record_failure()
+    _expire(breaker)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.opened_count == 2
+
+
+@pytest.fixture
+def kis(monkeypatch):
+    """KIS 응답을 순서대로 돌려주는 MockTransport (응답 목록이 끝나면 마지막 응답 반복)"""
+    responses = []
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses[min(len(requests), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        status, body = response
+        return httpx.Response(status, json=body)
+
+    async def token():
+        return "test-token"
+
+    monkeypatch.setattr(kis_client, "_client", httpx.AsyncClient(base_url="https://kis.test", transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(kis_client, "scheduler", TokenBucketScheduler(1000, 1000, 100))
+    monkeypatch.setattr(kis_client, "BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(token_manager, "get_access_token", token)
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    return responses, requests
+
+
+OK = (200, {"rt_cd": "0", "output": {"stck_prpr": "70000"}})
+SERVER_ERROR = (500, {"rt_cd": "1", "msg1": "internal"})
+
+
+def test_transient_errors_are_retried(kis):
+    responses, requests = kis
+    responses += [httpx.ConnectError("refused"), SERVER_ERROR, OK]
+    result = asyncio.run(kis_client.kis_get(TR_ID, "005930"))
+    assert result["output"]["stck_prpr"] == "70000"
+    assert len(requests) == 3
+    assert circuit_breaker.breaker_for(TR_ID).state == CLOSED
+
+
+def test_retries_are_bounded(kis):
+    responses, requests = kis
+    responses.append(httpx.ReadTimeout("slow"))
+    with pytest.raises(kis_client.UpstreamTimeout):
+        asyncio.run(kis_client.kis_get(TR_ID, "005930"))
+    assert len(requests) == kis_client.UPSTREAM_RETRIES + 1
+
+
+def test_open_breaker_skips_upstream(kis, monkeypatch):
+    responses, requests = kis
+    responses.append(SERVER_ERROR)
+    breaker = circuit_breaker.breaker_for(TR_ID)
+    monkeypatch.setattr(breaker, "failure_threshold", kis_client.UPSTREAM_RETRIES + 1)
+
+    with pytest.raises(kis_client.UpstreamUnavailable):
+        asyncio.run(kis_client.kis_get(TR_ID, "005930"))
+    assert breaker.state == OPEN
+
+    called = len(requests)
+    with pytest.raises(CircuitOpen):
+        asyncio.run(kis_client.kis_get(TR_ID, "005930"))
+    assert len(requests) == called
+
+
+def test_business_error_is_not_a_failure(kis):
+    responses, requests = kis
+    responses.append((200, {"rt_cd": "1", "msg_cd": "EGW00000", "msg1": "잘못된 종목"}))
+    with pytest.raises(kis_client.KisApiError):
+        asyncio.run(kis_client.kis_get(TR_ID, "999999"))
+    assert len(requests) == 1
+    assert circuit_breaker.breaker_for(TR_ID).failures == 0
+
+
+def test_stale_value_served_while_refresh_is_slow():
+    async def scenario():
+        cache = AsyncTTLCache("test_swr_slow", ttl=60, stale_ttl=600)
+        cache.set("005930", "old", ttl=-1)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "new"
+
+        assert await cache.get_or_load_stale("005930", slow, wait=0.01) == "old"
+        assert cache.stats()["stale_served"] == 1
+
+        # 갱신은 백그라운드에서 계속 → 끝나면 새 값
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert cache.get("005930") == "new"
+
+    asyncio.run(scenario())
+
+
+def test_stale_value_served_when_refresh_fails():
+    async def scenario():
+        cache = AsyncTTLCache("test_swr_fail", ttl=60, stale_ttl=600)
+        cache.set("005930", "old", ttl=-1)
+
+        async def failing():
+            raise kis_client.UpstreamUnavailable(TR_ID, "down")
+
+        assert await cache.get_or_load_stale("005930", failing) == "old"
+
+        # stale_ttl 도 지난 값은 제공하지 않음
+        cache.set("005930", "older", ttl=-601)
+        with pytest.raises(kis_client.UpstreamUnavailable):
+            await cache.get_or_load_stale("005930", failing)
+
+    asyncio.run(scenario())
+
+
+def test_stale_response_is_marked():
+    app = FastAPI()
+    app.add_middleware(StaleMarkerMiddleware)
+
+    @app.get("/fresh")
+    async def fresh():
+        return {}
+
+    @app.get("/stale")
+    async def stale():
+        mark_stale("quote", 12.34)
+        return {}
+
+    client = TestClient(app)
+    assert "x-data-stale" not in client.get("/fresh").headers
+    response = client.get("/stale")
+    assert response.headers["x-data-stale"] == "quote;age=12.3"
+    assert response.headers["warning"].startswith("110")
@@ -0,0 +1,113 @@
+"""
+KIS 요청 스케줄러 (토큰 버킷 속도 제한 / 우선순위 / 대기열 상한 / 취소)
+"""
+
+import time
+import asyncio
+
+import pytest
+
+from ..core.scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    SchedulerBusy,
+    TokenBucketScheduler,
+    background,
+    current_priority,
+)
+
+
+def test_burst_then_rate_limited():
+    async def scenario():
+        scheduler = TokenBucketScheduler(rate=50, burst=5, max_queue=100)
+        started = time.monotonic()
+        await asyncio.gather(*(scheduler.acquire() for _ in range(15)))
+        elapsed = time.monotonic() - started
+        # 처음 5건은 바로, 나머지 10건은 초당 50건 → 약 0.2초
+        assert 0.18 <= elapsed < 0.5
+        stats = scheduler.stats()["priorities"]["interactive"]
+        assert stats["granted"] == 15 and stats["wait_histogram"]["le_0.01"] >= 5
+
+    asyncio.run(scenario())
+
+
+def test_interactive_requests_overtake_background():
+    async def scenario():
+        scheduler = TokenBucketScheduler(rate=100, burst=1, max_queue=100)
+        await scheduler.acquire()  # 버킷 비움
+        order = []
+
+        async def request(name, priority):
+            await scheduler.acquire(priority)
+            order.append(name)
+
+        tasks = [asyncio.create_task(request(f"bg{i}", BACKGROUND)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(request(f"user{i}", INTERACTIVE)) for i in range(2)]
+        await asyncio.gather(*tasks)
+        assert order == ["user0", "user1", "bg0", "bg1", "bg2"]
+
+    asyncio.run(scenario())
+
+
+def test_background_context_sets_priority():
+    async def priority():
+        return current_priority()
+
+    async def scenario():
+        assert current_priority() == INTERACTIVE
+        with background():
+            assert current_priority() == BACKGROUND
+            # 블록 안에서 만든 task 도 백그라운드
+            assert await asyncio.create_task(priority()) == BACKGROUND
+        assert await asyncio.create_task(priority()) == INTERACTIVE
+        assert current_priority() == INTERACTIVE
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_rejects_immediately():
+    async def scenario():
+        scheduler = TokenBucketScheduler(rate=10, burst=1, max_queue=3)
+        await scheduler.acquire()
+        waiting = [asyncio.create_task(scheduler.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(SchedulerBusy) as raised:
+            await scheduler.acquire()
+        assert raised.value.queue_depth == 3 and raised.value.retry_after == pytest.approx(0.3)
+        assert scheduler.stats()["rejected"] == 1
+        for task in waiting:
+            task.cancel()
+        await asyncio.gather(*waiting, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_consume_token():
+    async def scenario():
+        scheduler = TokenBucketScheduler(rate=20, burst=1, max_queue=10)
+        await scheduler.acquire()
+        cancelled = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        started = time.monotonic()
+        await scheduler.acquire()
+        # 취소된 요청 몫을 건너뛰고 다음 토큰 (0.05초) 에 바로 통과
+        assert time.monotonic() - started < 0.09
+        assert scheduler.stats()["queue_depth"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_throttle_drains_tokens():
+    async def scenario():
+        scheduler = TokenBucketScheduler(rate=20, burst=5, max_queue=10)
+        scheduler.throttle()
+        started = time.monotonic()
+        await scheduler.acquire()
+        assert time.monotonic() - started >= 0.04
+        assert scheduler.stats()["throttled"] == 1
+
+    asyncio.run(scenario())
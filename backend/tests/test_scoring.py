@@ -0,0 +1,165 @@
+"""
+리스크 점수 구간표(scoring.py) 가 기존 if/elif 구현과 같은 결과를 내는지 확인
+
+    python -m pytest backend/tests
+
+- 경계값 그대로 / 바로 위아래 실수 / 무작위 값 / 문자열 형식(쉼표, %) / 값 없음 / 파싱 불가 / NaN
+- 종목 1개 경로 (score_*) 와 일괄 경로 (score_records) 모두 기준 구현과 비교
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from . import scoring_reference as reference
+from ..services.financial_service import score_financial_stability
+from ..services.profitability_service import score_profitability
+from ..services.volatility_service import score_volatility
+from ..services.supply_service import score_supply_demand
+from ..services.scoring import FINANCIAL_STABILITY, PROFITABILITY, VOLATILITY, SUPPLY_DEMAND
+
+CASES = 20_000
+
+# 모델별 (현재 함수, 기준 함수, 모델, 필드별 기준 구현의 경계값, 값 형식)
+MODELS = {
+    "financial": (
+        score_financial_stability,
+        reference.score_financial_stability,
+        FINANCIAL_STABILITY,
+        {
+            "lblt_rate": (100, 150, 200),
+            "bram_depn": (50, 75, 100),
+            "crnt_rate": (70, 100, 150),
+            "quck_rate": (50, 70, 100),
+        },
+        "text",
+    ),
+    "profitability": (
+        score_profitability,
+        reference.score_profitability,
+        PROFITABILITY,
+        {
+            "self_cptl_ntin_inrt": (5, 10, 15),
+            "tot_assets_ntin_rate": (4, 7, 10),
+            "sale_totl_rate": (5, 10, 20),
+            "sale_ntin_rate": (5, 10, 15),
+        },
+        "text",
+    ),
+    "volatility": (
+        score_volatility,
+        reference.score_volatility,
+        VOLATILITY,
+        {
+            "prdy_ctrt": (1, 3, 5, 7),
+            "prdy_vrss_vol_rate": (50, 100, 300, 500),
+            "w52_hgpr_vrss_prpr_ctrt": (10, 20, 30, 40),
+            "vol_tnrt": (1, 5, 10, 20),
+        },
+        "numeric",  # 기존 구현도 파싱 실패 시 예외이므로 숫자 / 숫자 문자열만
+    ),
+    "supply": (
+        score_supply_demand,
+        reference.score_supply_demand,
+        SUPPLY_DEMAND,
+        {
+            "hts_frgn_ehrt": (20, 30, 40, 50),
+            "frgn_ntby_qty": (-100_000, 0, 100_000, 1_000_000),
+            "pgtr_ntby_qty": (-100_000, 0, 100_000, 1_000_000),
+            "vol_tnrt": (0.1, 2.0, 5.0),
+        },
+        "text",
+    ),
+}
+
+
+def _number(rng: random.Random, edges: tuple) -> float:
+    edge = float(rng.choice(edges))
+    kind = rng.randrange(6)
+    if kind == 0:
+        return edge
+    if kind == 1:
+        return math.nextafter(edge, math.inf)
+    if kind == 2:
+        return math.nextafter(edge, -math.inf)
+    if kind == 3:
+        return -edge if rng.random() < 0.5 else edge + rng.choice((-0.01, 0.01))
+    if kind == 4:
+        return float(rng.randint(-2, 2) * max(abs(e) for e in edges))
+    spread = max(abs(e) for e in edges) * 2
+    return rng.uniform(-spread, spread)
+
+
+def _value(rng: random.Random, edges: tuple, style: str):
+    number = _number(rng, edges)
+    kind = rng.randrange(10 if style == "text" else 4)
+    if kind == 0:
+        return number
+    if kind == 1:
+        return repr(number)
+    if kind == 2:
+        return str(int(number))
+    if kind == 3:
+        return f"{number:.2f}"
+    if kind == 4:
+        return f"{number:,.2f}"
+    if kind == 5:
+        return f"{number:.2f}%"
+    if kind == 6:
+        return int(number)
+    return rng.choice((None, "", "-", "N/A", "nan", " 12 "))
+
+
+def _records(name: str, seed: int = 0) -> list:
+    _, _, _, fields, style = MODELS[name]
+    rng = random.Random(f"{name}:{seed}")
+    records = []
+    for _ in range(CASES):
+        record = {}
+        for field, edges in fields.items():
+            # 필드 자체가 없는 경우 (기본값 경로)
+            if rng.random() < 0.05:
+                continue
+            record[field] = _value(rng, edges, style)
+        records.append(record)
+    return records
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return type(a) is type(b) and a == b
+
+
+def _assert_same_result(actual: dict, expected: dict, record: dict):
+    assert actual.keys() == expected.keys(), record
+    assert _same(actual["total_score"], expected["total_score"]), record
+    assert actual["risk_level"] == expected["risk_level"], record
+    assert len(actual["score_by_metric"]) == len(expected["score_by_metric"]), record
+    for got, want in zip(actual["score_by_metric"], expected["score_by_metric"]):
+        assert got.keys() == want.keys(), record
+        assert all(_same(got[key], want[key]) for key in want), (record, got, want)
+
+
+@pytest.mark.parametrize("name", MODELS)
+def test_score_matches_reference(name):
+    score, expected_score, _, _, _ = MODELS[name]
+    for record in _records(name):
+        _assert_same_result(score(record), expected_score(record), record)
+
+
+@pytest.mark.parametrize("name", MODELS)
+def test_score_records_matches_reference(name):
+    _, expected_score, model, _, _ = MODELS[name]
+    records = _records(name, seed=1)
+    batch = model.score_records(records)
+    expected = [expected_score(record) for record in records]
+
+    # 변동성은 기존에도 지표별 점수를 응답에 넣지 않았으므로 총점 / 구간만 비교
+    if model.detail_scores:
+        expected_scores = [[detail["score"] for detail in result["score_by_metric"]] for result in expected]
+        assert np.array_equal(batch["scores"], np.array(expected_scores))
+    assert batch["total_score"].tolist() == [result["total_score"] for result in expected]
+    assert batch["risk_level"].tolist() == [result["risk_level"] for result in expected]
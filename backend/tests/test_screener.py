@@ -0,0 +1,75 @@
+"""
+스크리너 행 갱신 (조회 / 파싱 실패 시 이전 값을 현재 값처럼 남기지 않음)
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from ..services import screener_service
+
+PRICE = {
+    "stck_prpr": "70000",
+    "prdy_ctrt": "1.5",
+    "prdy_vrss_vol_rate": "120",
+    "w52_hgpr_vrss_prpr_ctrt": "-12",
+    "vol_tnrt": "0.8",
+    "hts_frgn_ehrt": "51",
+    "frgn_ntby_qty": "1000",
+    "pgtr_ntby_qty": "-10",
+}
+STABILITY = {"lblt_rate": "80", "bram_depn": "60", "crnt_rate": "160", "quck_rate": "90"}
+PROFIT = {"self_cptl_ntin_inrt": "12", "tot_assets_ntin_rate": "8", "sale_totl_rate": "11", "sale_ntin_rate": "9"}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    results = {"price": PRICE, "stability": STABILITY, "profitability": PROFIT}
+
+    def fake(key):
+        async def fetch(code):
+            value = results[key]
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        return fetch
+
+    monkeypatch.setattr(screener_service, "fetch_price_output", fake("price"))
+    monkeypatch.setattr(screener_service, "fetch_stability_output", fake("stability"))
+    monkeypatch.setattr(screener_service, "fetch_profitability_output", fake("profitability"))
+    screener_service._load_listing(screener_service.current_table())
+    return results
+
+
+def _present(i: int) -> dict:
+    return {key: bool(section.present[i]) for key, section in screener_service._sections.items()}
+
+
+def test_failed_sections_are_cleared(upstream):
+    assert asyncio.run(screener_service._scan_symbol(0)) is False
+    assert all(_present(0).values())
+
+    # 변동성 값 파싱 실패 + 안정성비율 조회 실패
+    upstream["price"] = {**PRICE, "prdy_ctrt": "N/A"}
+    upstream["stability"] = RuntimeError("upstream")
+    assert asyncio.run(screener_service._scan_symbol(0)) is True
+
+    assert _present(0) == {"stability": False, "profitability": True, "volatility": False, "supply": True}
+    for key in ("stability", "volatility"):
+        section = screener_service._sections[key]
+        assert all(np.isnan(column[0]) for column in section.columns.values())
+    item = screener_service._item(0, {key: s.scores() for key, s in screener_service._sections.items()})
+    assert item["volatility"] is None and item["stability"] is None
+    assert item["supply"] is not None and item["price"] == 70000
+
+
+def test_failed_quote_clears_price_sections(upstream):
+    asyncio.run(screener_service._scan_symbol(0))
+    upstream["price"] = RuntimeError("upstream")
+    asyncio.run(screener_service._scan_symbol(0))
+
+    assert _present(0) == {"stability": True, "profitability": True, "volatility": False, "supply": False}
+    item = screener_service._item(0, {key: s.scores() for key, s in screener_service._sections.items()})
+    assert item["price"] is None and item["change_rate"] is None
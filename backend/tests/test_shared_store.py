@@ -0,0 +1,116 @@
+"""
+워커 간 공유 저장소 (SQLite) - 값 만료 / 락 / 다른 워커가 쓰기 중일 때 이벤트 루프 유지
+다른 워커는 같은 파일에 연결한 별도 sqlite3 커넥션으로 대신함
+"""
+
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from ..core import shared_store
+from ..core.shared_store import LockTimeout, SQLiteSharedStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteSharedStore(str(tmp_path / "shared.sqlite3"))
+
+
+@pytest.fixture
+def other_worker(store):
+    asyncio.run(store.set("init", True))
+    conn = sqlite3.connect(store.path, isolation_level=None)
+    yield conn
+    if conn.in_transaction:
+        conn.execute("COMMIT")
+    conn.close()
+
+
+def test_values_and_ttl(store):
+    async def scenario():
+        await store.set("quote:005930", {"price": 70000})
+        await store.set("token", "abc", ttl=-1)
+        assert await store.get("quote:005930") == {"price": 70000}
+        assert await store.get("token") is None
+        await store.delete("quote:005930")
+        assert await store.get("quote:005930") is None
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_blocked_write_does_not_stall_event_loop(store, other_worker):
+    async def scenario():
+        other_worker.execute("BEGIN IMMEDIATE")
+        lags = []
+
+        async def ticker():
+            last = time.monotonic()
+            for _ in range(20):
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                lags.append(now - last - 0.01)
+                last = now
+
+        async def commit_later():
+            await asyncio.sleep(0.2)
+            other_worker.execute("COMMIT")
+
+        started = time.monotonic()
+        await asyncio.gather(ticker(), store.set("quote", 1), commit_later())
+        # 상대가 커밋할 때까지 기다렸다가 저장하되, 그동안 다른 작업은 계속 실행
+        assert time.monotonic() - started >= 0.2
+        assert max(lags) < 0.05
+        assert await store.get("quote") == 1
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_blocked_write_gives_up_after_busy_timeout(store, other_worker, monkeypatch):
+    monkeypatch.setattr(shared_store, "BUSY_TIMEOUT", 0.1)
+
+    async def scenario():
+        other_worker.execute("BEGIN IMMEDIATE")
+        with pytest.raises(sqlite3.OperationalError):
+            await store.set("quote", 1)
+        # 읽기는 WAL 이므로 쓰기 중에도 가능
+        assert await store.get("init") is True
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_lock_waits_for_other_writer(store, other_worker):
+    async def scenario():
+        other_worker.execute("BEGIN IMMEDIATE")
+        asyncio.get_running_loop().call_later(0.1, lambda: other_worker.execute("COMMIT"))
+        async with store.lock("token_refresh", timeout=2):
+            pass
+
+        other_worker.execute("BEGIN IMMEDIATE")
+        with pytest.raises(LockTimeout):
+            async with store.lock("token_refresh", timeout=0.1):
+                pass
+        other_worker.execute("COMMIT")
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_lock_is_exclusive_until_lease_expires(store):
+    async def scenario():
+        other = SQLiteSharedStore(store.path)
+        async with store.lock("token_refresh", lease=0.2):
+            with pytest.raises(LockTimeout):
+                async with other.lock("token_refresh", timeout=0.1):
+                    pass
+            # lease 가 지나면 다른 워커가 가져갈 수 있음
+            async with other.lock("token_refresh", timeout=1):
+                pass
+        await other.close()
+        await store.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,59 @@
+"""
+/stocks 종목 리스트 (시장구분 필터 / 페이지 / gzip / ETag)
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ..main import app
+from ..utils import symbol_table
+
+ITEMS = [
+    {"회사명": f"종목{i}", "종목코드": f"{i:06d}", "시장구분": "KOSPI" if i % 3 else "KOSDAQ"}
+    for i in range(30)
+]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    source = tmp_path / "stock_list.json"
+    source.write_text(json.dumps(ITEMS, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(symbol_table, "SOURCE_PATH", str(source))
+    monkeypatch.setattr(symbol_table, "TABLE_PATH", str(tmp_path / "stock_list.bin"))
+    monkeypatch.setattr(symbol_table, "_table", None)
+    return TestClient(app)
+
+
+def test_market_filter_and_paging(client):
+    everything = client.get("/stocks")
+    assert everything.json() == ITEMS and everything.headers["x-total-count"] == "30"
+
+    kosdaq = [item for item in ITEMS if item["시장구분"] == "KOSDAQ"]
+    page = client.get("/stocks", params={"market": "KOSDAQ", "offset": 2, "limit": 3})
+    assert page.json() == kosdaq[2:5]
+    assert page.headers["x-total-count"] == str(len(kosdaq))
+
+    assert client.get("/stocks", params={"offset": 100}).json() == []
+    assert client.get("/stocks", params={"market": "NYSE"}).status_code == 422
+    assert client.get("/stocks", params={"limit": 0}).status_code == 422
+
+
+def test_gzip_and_etag(client):
+    plain = client.get("/stocks", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/stocks", headers={"Accept-Encoding": "gzip"})
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    # httpx 가 압축을 풀어서 돌려주므로 본문은 같음
+    assert compressed.content == plain.content
+    assert plain.headers["etag"] != compressed.headers["etag"]
+
+    # 어느 표현의 ETag 든 같은 내용이면 304
+    for etag in (plain.headers["etag"], compressed.headers["etag"]):
+        response = client.get("/stocks", headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+        assert response.status_code == 304
+
+    other_page = client.get("/stocks", params={"limit": 5}, headers={"If-None-Match": plain.headers["etag"]})
+    assert other_page.status_code == 200
@@ -0,0 +1,71 @@
+"""
+종목 검색 (종목코드 / 회사명 정확 일치, 접두어 + 초성 자동완성)
+"""
+
+import json
+
+import pytest
+
+from ..utils import symbol_table
+from ..utils.stock_lookup import find_symbol, find_symbols, search_symbols
+
+ITEMS = [
+    {"회사명": "삼성전자", "종목코드": "005930", "시장구분": "KOSPI"},
+    {"회사명": "삼성SDI", "종목코드": "006400", "시장구분": "KOSPI"},
+    {"회사명": "삼성전기", "종목코드": "009150", "시장구분": "KOSPI"},
+    {"회사명": "삼성전자우", "종목코드": "005935", "시장구분": "KOSPI"},
+    {"회사명": "산성앨엔에스", "종목코드": "016100", "시장구분": "KOSDAQ"},
+    {"회사명": "SK하이닉스", "종목코드": "000660", "시장구분": "KOSPI"},
+    {"회사명": "카카오", "종목코드": "035720", "시장구분": "KOSPI"},
+]
+
+
+@pytest.fixture(autouse=True)
+def table(tmp_path, monkeypatch):
+    source = tmp_path / "stock_list.json"
+    source.write_text(json.dumps(ITEMS, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(symbol_table, "SOURCE_PATH", str(source))
+    monkeypatch.setattr(symbol_table, "TABLE_PATH", str(tmp_path / "stock_list.bin"))
+    monkeypatch.setattr(symbol_table, "_table", None)
+    return symbol_table.current_table()
+
+
+def _names(results: list) -> list:
+    return [item["회사명"] for item in results]
+
+
+def test_find_symbol_by_code_or_name():
+    assert find_symbol("005930") == "005930"
+    assert find_symbol(" 삼성전자 ") == "005930"
+    assert find_symbol("카카오") == "035720"
+    assert find_symbol("삼성") is None
+    assert find_symbols(["삼성전자", "000660", "없는회사", "삼성전자"]) == {
+        "삼성전자": "005930",
+        "000660": "000660",
+        "없는회사": None,
+    }
+
+
+def test_name_prefix_exact_match_first_then_shorter_names():
+    assert _names(search_symbols("삼성전자")) == ["삼성전자", "삼성전자우"]
+    assert _names(search_symbols("삼성")) == ["삼성전기", "삼성전자", "삼성SDI", "삼성전자우"]
+    # 영문은 대소문자 구분 없음
+    assert _names(search_symbols("sk")) == ["SK하이닉스"]
+
+
+def test_code_prefix():
+    assert [item["종목코드"] for item in search_symbols("0059")] == ["005930", "005935"]
+
+
+def test_choseong_search():
+    assert _names(search_symbols("ㅅㅅㅈㅈ")) == ["삼성전자", "삼성전자우"]
+    assert _names(search_symbols("ㅅㅅㅈ")) == ["삼성전기", "삼성전자", "삼성전자우"]
+    assert "산성앨엔에스" in _names(search_symbols("ㅅㅅ"))
+    # 초성 + 완성형 혼합은 완성형 글자도 맞아야 함
+    assert "산성앨엔에스" not in _names(search_symbols("삼ㅅ"))
+    assert _names(search_symbols("ㅋㅋ")) == ["카카오"]
+
+
+def test_limit_and_empty_query():
+    assert len(search_symbols("ㅅ", limit=2)) == 2
+    assert search_symbols("  ") == [] and search_symbols("삼성", limit=0) == []
@@ -0,0 +1,84 @@
+"""
+심볼 테이블 교체 (원본 JSON 변경 → 다시 빌드 후 교체, 실패 시 기존 테이블 유지)
+"""
+
+import os
+import json
+
+import pytest
+
+from ..utils import symbol_table
+
+ITEMS = [
+    {"회사명": "삼성전자", "종목코드": "005930", "시장구분": "KOSPI"},
+    {"회사명": "SK하이닉스", "종목코드": "000660", "시장구분": "KOSPI"},
+]
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    source = tmp_path / "stock_list.json"
+    table = tmp_path / "stock_list.bin"
+    source.write_text(json.dumps(ITEMS, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(symbol_table, "SOURCE_PATH", str(source))
+    monkeypatch.setattr(symbol_table, "TABLE_PATH", str(table))
+    monkeypatch.setattr(symbol_table, "CHECK_INTERVAL", 0)
+    monkeypatch.setattr(symbol_table, "_table", None)
+    monkeypatch.setattr(symbol_table, "_listeners", [])
+    return source, table
+
+
+def _touch_later(path):
+    # 같은 시각에 다시 쓰면 mtime 이 같을 수 있으므로 확실히 바뀌게 함
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_build_and_lookup(paths):
+    table = symbol_table.current_table()
+    assert len(table) == 2
+    assert table.code(table.find_name("삼성전자")) == "005930"
+    assert table.name(table.find_code("000660")) == "SK하이닉스"
+    assert [table.code(i) for i in table.chosung_prefix("ㅅㅅ")] == ["005930"]
+
+
+def test_hot_swap_on_source_change(paths):
+    source, _ = paths
+    swapped = []
+    symbol_table.on_swap(swapped.append)
+    symbol_table.current_table()
+
+    items = ITEMS + [{"회사명": "카카오", "종목코드": "035720", "시장구분": "KOSPI"}]
+    source.write_text(json.dumps(items, ensure_ascii=False), encoding="utf-8")
+    _touch_later(source)
+
+    table = symbol_table.current_table()
+    assert len(table) == 3 and table.find_code("035720") is not None
+    assert swapped == [table]
+
+
+def test_corrupt_source_keeps_current_table(paths):
+    source, _ = paths
+    swapped = []
+    symbol_table.on_swap(swapped.append)
+    before = symbol_table.current_table()
+
+    # 쓰는 도중 잘린 JSON
+    source.write_text(json.dumps(ITEMS, ensure_ascii=False)[:40], encoding="utf-8")
+    _touch_later(source)
+    table = symbol_table.current_table()
+    assert table is before and not swapped
+    assert table.code(table.find_name("삼성전자")) == "005930"
+
+    # 원본이 복구되면 다음 확인 때 교체
+    source.write_text(json.dumps(ITEMS[:1], ensure_ascii=False), encoding="utf-8")
+    _touch_later(source)
+    table = symbol_table.current_table()
+    assert len(table) == 1 and swapped == [table]
+
+
+def test_corrupt_source_without_table_raises(paths):
+    source, _ = paths
+    source.write_text("[{", encoding="utf-8")
+    with pytest.raises(ValueError):
+        symbol_table.current_table()
@@ -0,0 +1,106 @@
+"""
+토큰 발급 single-flight (워커 내 동시 요청 / 워커 간 공유 저장소)
+KIS 토큰 발급은 httpx.MockTransport 로 대체
+"""
+
+import json
+import time
+import asyncio
+
+import httpx
+import pytest
+
+from ..core import kis_client, token_manager
+from ..core.shared_store import get_store
+
+
+@pytest.fixture
+def issuer(tmp_path, monkeypatch):
+    """토큰 발급 요청 기록 (발급마다 다른 토큰, 응답은 조금 늦게)"""
+    issued = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/oauth2/token"
+        issued.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"access_token": f"token-{len(issued)}", "expires_in": 86400})
+
+    monkeypatch.setattr(
+        kis_client, "_client", httpx.AsyncClient(base_url="https://kis.test", transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(token_manager, "TOKEN_CACHE_FILE", str(tmp_path / "token_cache.json"))
+    _new_worker(monkeypatch)
+    return issued
+
+
+def _new_worker(monkeypatch):
+    """메모리 상태만 비움 (공유 저장소는 그대로) → 새로 뜬 워커와 같은 상태"""
+    monkeypatch.setattr(token_manager, "_token", {"access_token": None, "expires_at": 0.0})
+    monkeypatch.setattr(token_manager, "_refresh_lock", asyncio.Lock())
+
+
+def test_concurrent_requests_issue_one_token(issuer):
+    async def scenario():
+        tokens = await asyncio.gather(*(token_manager.get_access_token() for _ in range(50)))
+        assert set(tokens) == {"token-1"}
+        assert len(issuer) == 1
+
+    asyncio.run(scenario())
+
+
+def test_other_worker_reuses_shared_token(issuer, monkeypatch):
+    assert asyncio.run(token_manager.get_access_token()) == "token-1"
+    _new_worker(monkeypatch)
+    assert asyncio.run(token_manager.get_access_token()) == "token-1"
+    assert len(issuer) == 1
+
+
+def test_workers_refreshing_together_issue_one_token(issuer):
+    async def worker():
+        # 워커마다 자기 메모리 상태 / 락을 가지고 같은 공유 저장소 사용
+        token_manager._token = {"access_token": None, "expires_at": 0.0}
+        token_manager._refresh_lock = asyncio.Lock()
+        return await token_manager.refresh_token()
+
+    async def scenario():
+        tokens = await asyncio.gather(*(asyncio.create_task(worker()) for _ in range(4)))
+        assert set(tokens) == {"token-1"}
+        assert len(issuer) == 1
+
+    asyncio.run(scenario())
+
+
+def test_expired_token_is_reissued(issuer):
+    async def scenario():
+        await token_manager.save_token_to_cache("old", expires_in=30)  # 1분 여유를 빼면 이미 만료
+        assert await token_manager.get_access_token() == "token-1"
+        assert await get_store().get(token_manager.TOKEN_KEY) == {
+            "access_token": "token-1",
+            "expires_at": token_manager._token["expires_at"],
+        }
+
+    asyncio.run(scenario())
+
+
+def test_forced_refresh_only_near_expiry(issuer):
+    async def scenario():
+        await token_manager.save_token_to_cache("fresh", expires_in=86400)
+        assert await token_manager.refresh_token(force=True) == "fresh"
+
+        await token_manager.save_token_to_cache("expiring", expires_in=token_manager.REFRESH_MARGIN)
+        assert await token_manager.refresh_token(force=True) == "token-1"
+        assert len(issuer) == 1
+
+    asyncio.run(scenario())
+
+
+def test_legacy_token_file_is_migrated(issuer):
+    with open(token_manager.TOKEN_CACHE_FILE, "w") as f:
+        json.dump({"access_token": "legacy", "expires_at": time.time() + 3600}, f)
+
+    async def scenario():
+        assert await token_manager.get_access_token() == "legacy"
+        assert (await get_store().get(token_manager.TOKEN_KEY))["access_token"] == "legacy"
+        assert not issuer
+
+    asyncio.run(scenario())
@@ -0,0 +1,61 @@
+import json
+import os
+from datetime import date, datetime, time, timedelta, timezone
+
+# KRX 정규장 시간 계산 (한국은 서머타임이 없으므로 고정 UTC+9 사용)
+
+KST = timezone(timedelta(hours=9), "KST")
+MARKET_OPEN = time(9, 0)
+MARKET_CLOSE = time(15, 30)
+
+holiday_path = os.path.join(os.path.dirname(__file__), "../data/krx_holidays.json")
+
+with open(holiday_path, encoding="utf-8") as f:
+    KRX_HOLIDAYS = {date.fromisoformat(d) for d in json.load(f)}
+
+# 임시 휴장일 등은 환경변수로 추가 (ex. KRX_EXTRA_HOLIDAYS=2026-06-03,2026-12-30)
+KRX_HOLIDAYS |= {
+    date.fromisoformat(d.strip())
+    for d in os.getenv("KRX_EXTRA_HOLIDAYS", "").split(",")
+    if d.strip()
+}
+
+
+def now_kst() -> datetime:
+    return datetime.now(KST)
+
+
+def is_trading_day(d: date) -> bool:
+    return d.weekday() < 5 and d not in KRX_HOLIDAYS
+
+
+def is_market_open(now: datetime | None = None) -> bool:
+    now = (now or now_kst()).astimezone(KST)
+    return is_trading_day(now.date()) and MARKET_OPEN <= now.time() < MARKET_CLOSE
+
+
+def next_open(now: datetime | None = None) -> datetime:
+    """다음 정규장 시작 시각 (장중이면 다음 거래일 시작 시각)"""
+    now = (now or now_kst()).astimezone(KST)
+    d = now.date()
+    if now.time() >= MARKET_OPEN or not is_trading_day(d):
+        d += timedelta(days=1)
+    while not is_trading_day(d):
+        d += timedelta(days=1)
+    return datetime.combine(d, MARKET_OPEN, tzinfo=KST)
+
+
+def seconds_until_next_open(now: datetime | None = None) -> float:
+    now = (now or now_kst()).astimezone(KST)
+    return (next_open(now) - now).total_seconds()
+
+
+def last_trading_day(now: datetime | None = None) -> date:
+    """종가가 확정된 가장 최근 거래일 (장 마감 전이면 이전 거래일)"""
+    now = (now or now_kst()).astimezone(KST)
+    d = now.date()
+    if not is_trading_day(d) or now.time() < MARKET_CLOSE:
+        d -= timedelta(days=1)
+        while not is_trading_day(d):
+            d -= timedelta(days=1)
+    return d
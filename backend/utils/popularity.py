@@ -0,0 +1,73 @@
+import os
+import math
+import time
+import heapq
+
+# 종목별 조회 빈도 (시간에 따라 감소하는 LFU 카운터)
+# - 조회 1건의 가중치는 half_life 초마다 절반으로 줄어듦 → 최근에 많이 본 종목이 위로
+# - 매번 전체 값을 줄이지 않고, 새 조회일수록 큰 가중치(2^(경과/half_life))를 더한 뒤 읽을 때 나눔
+# - 가중치가 너무 커지면 기준 시각을 옮겨서 전체 값을 한 번 줄임 (아주 작아진 종목은 제거)
+
+HALF_LIFE_SECONDS = float(os.getenv("POPULARITY_HALF_LIFE_SECONDS", str(6 * 3600)))
+# 이 값보다 작아진 종목은 기준 시각을 옮길 때 제거
+MIN_SCORE = 0.01
+# 가중치 지수가 이 값을 넘으면 기준 시각 이동
+_RESCALE_EXPONENT = 32
+
+
+class DecayingCounter:
+    def __init__(self, half_life: float = HALF_LIFE_SECONDS):
+        self.half_life = half_life
+        self._origin = time.time()
+        self._scores: dict[str, float] = {}
+
+    def _exponent(self, now: float) -> float:
+        return (now - self._origin) / self.half_life
+
+    def _rescale(self, now: float):
+        factor = 2.0 ** -self._exponent(now)
+        self._scores = {
+            key: score * factor for key, score in self._scores.items() if score * factor >= MIN_SCORE
+        }
+        self._origin = now
+
+    def hit(self, key: str, count: float = 1.0, now: float | None = None):
+        now = time.time() if now is None else now
+        if self._exponent(now) > _RESCALE_EXPONENT:
+            self._rescale(now)
+        self._scores[key] = self._scores.get(key, 0.0) + count * 2.0 ** self._exponent(now)
+
+    def score(self, key: str, now: float | None = None) -> float:
+        now = time.time() if now is None else now
+        return self._scores.get(key, 0.0) * 2.0 ** -self._exponent(now)
+
+    def top(self, n: int, now: float | None = None) -> list:
+        """[(키, 현재 점수)] 점수 높은 순"""
+        now = time.time() if now is None else now
+        factor = 2.0 ** -self._exponent(now)
+        best = heapq.nlargest(n, self._scores.items(), key=lambda item: item[1])
+        return [(key, score * factor) for key, score in best]
+
+    def items(self, now: float | None = None) -> dict:
+        """현재 시점 기준으로 줄어든 점수 전체 (저장용)"""
+        now = time.time() if now is None else now
+        factor = 2.0 ** -self._exponent(now)
+        return {key: score * factor for key, score in self._scores.items()}
+
+    def load(self, scores: dict, saved_at: float, now: float | None = None):
+        """저장된 점수 복원 (저장 후 지난 시간만큼 줄여서 기존 값을 대체)"""
+        now = time.time() if now is None else now
+        self._origin = now
+        self._scores = {}
+        elapsed = max(now - saved_at, 0.0)
+        for key, score in scores.items():
+            decayed = score * 2.0 ** -(elapsed / self.half_life)
+            if decayed >= MIN_SCORE and math.isfinite(decayed):
+                self.hit(key, decayed, now)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+# 사용자 요청 기준 종목 조회 빈도
+symbol_popularity = DecayingCounter()
@@ -1,15 +1,110 @@
-import json
-import os
+import heapq
+from functools import lru_cache
+from .popularity import symbol_popularity
+from .symbol_table import CHOSEONG, to_choseong, current_table, on_swap
+from ..core.profiling import span
 
-file_path = os.path.join(os.path.dirname(__file__), "../data/stock_list.json")
+# 종목 리스트는 바이너리 심볼 테이블 (utils/symbol_table, mmap) 에서 조회
+# - 워커마다 JSON 을 파싱해서 dict 를 만들지 않음
+# - stock_list.json 이 바뀌면 테이블이 교체되고 검색 결과 캐시도 비움
 
-with open(file_path, encoding="utf-8") as f:
-    stock_list = json.load(f)
+_CHOSEONG_SET = set(CHOSEONG)
+
+# 검색 결과 순위 (낮을수록 우선)
+RANK_EXACT = 0
+RANK_NAME_PREFIX = 1
+RANK_CODE_PREFIX = 2
+RANK_CHOSEONG_PREFIX = 3
+
+
+def _chars_match(query: str, name: str) -> bool:
+    """초성/완성형이 섞인 검색어 확인 (ex. 삼ㅅ → 삼성전자 O, 산성앨엔에스 X)"""
+    for q, ch in zip(query, name):
+        if q in _CHOSEONG_SET:
+            if to_choseong(ch) != q:
+                return False
+        elif q != ch.lower():
+            return False
+    return True
+
+
+# 같은 검색어가 반복되므로 (테이블, 검색어) → 종목 번호를 메모이즈
+@lru_cache(maxsize=4096)
+def _resolve(table, query: str) -> int | None:
+    idx = table.find_code(query)
+    if idx is None:
+        idx = table.find_name(query)
+    return idx
 
 
 def find_symbol(query: str) -> str | None:
+    with span("lookup"):
+        table = current_table()
+        idx = _resolve(table, query.strip())
+    if idx is None:
+        return None
+    symbol = table.code(idx)
+    # 사용자 요청으로 조회한 종목 빈도 기록 (인기 종목 미리 조회용)
+    symbol_popularity.hit(symbol)
+    return symbol
+
+
+def find_symbols(queries: list) -> dict:
+    """여러 검색어를 한 번에 종목코드로 변환 → {검색어: 종목코드 또는 None} (중복 검색어는 1번만 처리)"""
+    resolved = {}
+    for query in queries:
+        if query not in resolved:
+            resolved[query] = find_symbol(query)
+    return resolved
+
+
+def search_symbols(query: str, limit: int = 10) -> list:
+    """
+    회사명/종목코드 접두어 + 초성 검색 (자동완성용)
+    정확 일치 → 회사명 접두어 → 종목코드 접두어 → 초성 접두어 순, 같은 순위는 짧은 이름 우선
+    """
     query = query.strip()
-    for item in stock_list:
-        if item["회사명"] == query or item["종목코드"] == query:
-            return item["종목코드"]
-    return None
+    if not query or limit <= 0:
+        return []
+    table = current_table()
+    return [table.item(idx) for idx in _search(table, query, limit)]
+
+
+# 테이블이 불변이므로 결과를 그대로 메모이즈 (짧은 접두어처럼 후보가 많은 검색어가 가장 자주 반복됨)
+@lru_cache(maxsize=4096)
+def _search(table, query: str, limit: int) -> tuple:
+    lowered = query.lower()
+    ranks: dict[int, int] = {}
+
+    def add(idx: int, rank: int):
+        if rank < ranks.get(idx, RANK_CHOSEONG_PREFIX + 1):
+            ranks[idx] = rank
+
+    for idx in table.name_prefix(lowered):
+        add(idx, RANK_NAME_PREFIX)
+    if lowered.isdigit():
+        for idx in table.code_prefix(lowered):
+            add(idx, RANK_CODE_PREFIX)
+    if any(ch in _CHOSEONG_SET for ch in query):
+        # 초성만 입력한 경우는 초성 키 접두어 일치만으로 충분
+        pure = all(ch in _CHOSEONG_SET for ch in query)
+        for idx in table.chosung_prefix(to_choseong(query)):
+            if pure or _chars_match(lowered, table.name(idx)):
+                add(idx, RANK_CHOSEONG_PREFIX)
+
+    exact = table.find_code(query)
+    if exact is None:
+        exact = table.find_name_lower(lowered)
+    if exact is not None:
+        ranks[exact] = RANK_EXACT
+
+    return tuple(heapq.nsmallest(limit, ranks, key=lambda idx: (ranks[idx], table.tiebreak(idx))))
+
+
+# 이전 테이블 기준 결과는 더 이상 쓰이지 않으므로 교체 시 비움
+def _clear_caches(table):
+    _resolve.cache_clear()
+    _search.cache_clear()
+
+
+on_swap(_clear_caches)
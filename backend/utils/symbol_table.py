@@ -0,0 +1,326 @@
+import os
+import sys
+import json
+import mmap
+import time
+import struct
+import argparse
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Callable
+
+from ..core.log import get_logger
+
+logger = get_logger(__name__)
+
+# 종목 리스트 바이너리 심볼 테이블
+# - stock_list.json 을 한 번 컴파일해 두고 워커마다 읽기 전용 mmap 으로 열기
+#   → JSON 파싱 / 종목별 dict 생성 없이 바로 사용, 같은 파일을 여는 워커끼리 페이지 캐시 공유
+# - 종목코드는 고정 폭, 회사명 / 초성은 하나의 UTF-8 blob + 오프셋 배열
+# - 회사명(소문자) / 종목코드 / 초성 순으로 정렬한 종목 번호 배열 → bisect 로 정확 일치 / 접두어 탐색
+# - 원본 JSON 이 바뀌면 다음 조회 때 다시 컴파일해서 교체 (서버 재시작 없음, 확인은 CHECK_INTERVAL 마다)
+#
+# 파일 구조 (정수는 빌드한 머신의 바이트 순서, 헤더에 기록)
+#   header  : magic, byteorder, 종목 수, 원본 mtime_ns / size, 섹션 오프셋
+#   codes   : 종목 수 × CODE_WIDTH 바이트 (ASCII)
+#   markets : 종목별 시장 번호 (uint8) + 시장 이름 blob ("\n" 구분)
+#   names   : uint32 오프셋 (종목 수 + 1) + UTF-8 blob
+#   choseong: uint32 오프셋 (종목 수 + 1) + UTF-8 blob
+#   orders  : uint32 종목 번호 배열 3개 (회사명 소문자 / 종목코드 / 초성 정렬) + 동순위 정렬 순서
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data"))
+SOURCE_PATH = os.getenv("STOCK_LIST_PATH", os.path.join(DATA_DIR, "stock_list.json"))
+TABLE_PATH = os.getenv("SYMBOL_TABLE_PATH", os.path.join(DATA_DIR, "stock_list.bin"))
+# 원본 / 테이블 파일 변경 확인 간격 (초)
+CHECK_INTERVAL = float(os.getenv("SYMBOL_TABLE_CHECK_INTERVAL", "5"))
+
+MAGIC = b"STKSYM01"
+CODE_WIDTH = 6
+SECTIONS = (
+    "codes", "market_ids", "market_names", "name_offsets", "names",
+    "chosung_offsets", "chosungs", "name_order", "code_order", "chosung_order", "tiebreak",
+)
+# magic, byteorder (b"L" / b"B"), 종목 수, 원본 mtime_ns, 원본 size, 섹션별 (오프셋, 길이)
+_HEADER = struct.Struct("=8sc3xIqq" + "II" * len(SECTIONS))
+
+# 한글 초성 (유니코드 음절 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절은 초성으로 바꾸고 나머지 문자는 소문자로 유지 (ex. 삼성전자 → ㅅㅅㅈㅈ)"""
+    out = []
+    for ch in text:
+        if "가" <= ch <= "힣":
+            out.append(CHOSEONG[(ord(ch) - 0xAC00) // 588])
+        else:
+            out.append(ch.lower())
+    return "".join(out)
+
+
+def _blob(strings: list) -> tuple:
+    offsets = array("I", [0])
+    chunks = []
+    for s in strings:
+        encoded = s.encode("utf-8")
+        chunks.append(encoded)
+        offsets.append(offsets[-1] + len(encoded))
+    return offsets.tobytes(), b"".join(chunks)
+
+
+# ✅ 빌드 (stock_list.json → 바이너리 테이블, 임시 파일에 쓴 뒤 교체)
+def build(source: str = SOURCE_PATH, output: str = TABLE_PATH) -> int:
+    stat = os.stat(source)
+    with open(source, encoding="utf-8") as f:
+        items = json.load(f)
+
+    codes = [item["종목코드"] for item in items]
+    names = [item["회사명"] for item in items]
+    for code in codes:
+        if len(code) != CODE_WIDTH or not code.isascii():
+            raise ValueError(f"종목코드 형식 오류: {code!r} ({CODE_WIDTH}자리 ASCII)")
+    market_names = sorted({item["시장구분"] for item in items})
+    market_index = {market: i for i, market in enumerate(market_names)}
+    chosungs = [to_choseong(name) for name in names]
+    ids = range(len(items))
+
+    name_offsets, name_blob = _blob(names)
+    chosung_offsets, chosung_blob = _blob(chosungs)
+    # 같은 순위 내 정렬 순서 (짧은 이름 → 가나다순)
+    tiebreak = array("I", [0] * len(items))
+    for order, idx in enumerate(sorted(ids, key=lambda i: (len(names[i]), names[i]))):
+        tiebreak[idx] = order
+
+    sections = {
+        "codes": "".join(codes).encode("ascii"),
+        "market_ids": bytes(market_index[item["시장구분"]] for item in items),
+        "market_names": "\n".join(market_names).encode("utf-8"),
+        "name_offsets": name_offsets,
+        "names": name_blob,
+        "chosung_offsets": chosung_offsets,
+        "chosungs": chosung_blob,
+        "name_order": array("I", sorted(ids, key=lambda i: (names[i].lower(), i))).tobytes(),
+        "code_order": array("I", sorted(ids, key=lambda i: (codes[i], i))).tobytes(),
+        "chosung_order": array("I", sorted(ids, key=lambda i: (chosungs[i], i))).tobytes(),
+        "tiebreak": tiebreak.tobytes(),
+    }
+
+    # 섹션은 4바이트 정렬 (uint32 배열을 memoryview 로 바로 읽기 위해)
+    layout = []
+    body = bytearray()
+    for name in SECTIONS:
+        body.extend(b"\0" * (-(_HEADER.size + len(body)) % 4))
+        layout.extend((_HEADER.size + len(body), len(sections[name])))
+        body.extend(sections[name])
+    header = _HEADER.pack(
+        MAGIC,
+        b"L" if sys.byteorder == "little" else b"B",
+        len(items),
+        stat.st_mtime_ns,
+        stat.st_size,
+        *layout,
+    )
+
+    tmp_path = f"{output}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(body)
+        # 다른 워커가 열어 둔 이전 파일은 그대로 유지되고 새로 여는 쪽만 새 파일을 봄
+        os.replace(tmp_path, output)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(items)
+
+
+class SymbolTable:
+    """읽기 전용 mmap 심볼 테이블 (종목 번호 = 원본 JSON 순서)"""
+
+    def __init__(self, path: str = TABLE_PATH):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            stat = os.fstat(f.fileno())
+        self.path = path
+        self.file_id = (stat.st_ino, stat.st_mtime_ns)
+
+        fields = _HEADER.unpack_from(self._mm, 0)
+        magic, byteorder, self.size, self.source_mtime_ns, self.source_size = fields[:5]
+        if magic != MAGIC:
+            raise ValueError(f"심볼 테이블 형식이 아님: {path}")
+        if byteorder != (b"L" if sys.byteorder == "little" else b"B"):
+            raise ValueError(f"바이트 순서가 다른 머신에서 빌드한 심볼 테이블: {path}")
+
+        view = memoryview(self._mm)
+        layout = fields[5:]
+        sections = {
+            name: view[layout[2 * i] : layout[2 * i] + layout[2 * i + 1]]
+            for i, name in enumerate(SECTIONS)
+        }
+        self._codes = sections["codes"]
+        self._market_ids = sections["market_ids"]
+        self._markets = bytes(sections["market_names"]).decode("utf-8").split("\n")
+        self._name_offsets = sections["name_offsets"].cast("I")
+        self._names = sections["names"]
+        self._chosung_offsets = sections["chosung_offsets"].cast("I")
+        self._chosungs = sections["chosungs"]
+        self._name_order = sections["name_order"].cast("I")
+        self._code_order = sections["code_order"].cast("I")
+        self._chosung_order = sections["chosung_order"].cast("I")
+        self._tiebreak = sections["tiebreak"].cast("I")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def code(self, idx: int) -> str:
+        start = idx * CODE_WIDTH
+        return str(self._codes[start : start + CODE_WIDTH], "ascii")
+
+    def name(self, idx: int) -> str:
+        return str(self._names[self._name_offsets[idx] : self._name_offsets[idx + 1]], "utf-8")
+
+    def chosung(self, idx: int) -> str:
+        return str(self._chosungs[self._chosung_offsets[idx] : self._chosung_offsets[idx + 1]], "utf-8")
+
+    def market(self, idx: int) -> str:
+        return self._markets[self._market_ids[idx]]
+
+    def tiebreak(self, idx: int) -> int:
+        return self._tiebreak[idx]
+
+    def item(self, idx: int) -> dict:
+        """원본 JSON 과 같은 형식의 종목 dict (필요할 때만 생성)"""
+        return {"회사명": self.name(idx), "종목코드": self.code(idx), "시장구분": self.market(idx)}
+
+    def items(self):
+        return (self.item(idx) for idx in range(self.size))
+
+    def _lower_name(self, idx: int) -> str:
+        return self.name(idx).lower()
+
+    def _range(self, order, key: Callable, prefix: str):
+        i = bisect_left(order, prefix, key=key)
+        while i < len(order):
+            idx = order[i]
+            if not key(idx).startswith(prefix):
+                break
+            yield idx
+            i += 1
+
+    def find_code(self, code: str) -> int | None:
+        if len(code) != CODE_WIDTH or not code.isascii():
+            return None
+        i = bisect_left(self._code_order, code, key=self.code)
+        if i < self.size and self.code(self._code_order[i]) == code:
+            return self._code_order[i]
+        return None
+
+    def find_name(self, name: str) -> int | None:
+        """회사명 정확 일치 (대소문자 구분)"""
+        lowered = name.lower()
+        i = bisect_left(self._name_order, lowered, key=self._lower_name)
+        while i < self.size and self._lower_name(self._name_order[i]) == lowered:
+            if self.name(self._name_order[i]) == name:
+                return self._name_order[i]
+            i += 1
+        return None
+
+    def find_name_lower(self, lowered: str) -> int | None:
+        """회사명 정확 일치 (소문자 기준)"""
+        i = bisect_left(self._name_order, lowered, key=self._lower_name)
+        if i < self.size and self._lower_name(self._name_order[i]) == lowered:
+            return self._name_order[i]
+        return None
+
+    def name_prefix(self, lowered: str):
+        return self._range(self._name_order, self._lower_name, lowered)
+
+    def code_prefix(self, prefix: str):
+        return self._range(self._code_order, self.code, prefix)
+
+    def chosung_prefix(self, prefix: str):
+        return self._range(self._chosung_order, self.chosung, prefix)
+
+    def matches_source(self, source: str = SOURCE_PATH) -> bool:
+        try:
+            stat = os.stat(source)
+        except FileNotFoundError:
+            # 원본 없이 테이블만 배포한 경우
+            return True
+        return (stat.st_mtime_ns, stat.st_size) == (self.source_mtime_ns, self.source_size)
+
+
+_table: SymbolTable | None = None
+_checked_at = 0.0
+_swap_lock = threading.Lock()
+_listeners: list = []
+
+
+def on_swap(callback: Callable[[SymbolTable], None]):
+    """테이블이 교체될 때 호출 (테이블 기준으로 만든 캐시 / 인덱스 재생성용)"""
+    _listeners.append(callback)
+
+
+def _open() -> SymbolTable:
+    """테이블 파일을 열고, 없거나 원본보다 오래됐으면 다시 빌드"""
+    try:
+        table = SymbolTable(TABLE_PATH)
+        if table.matches_source(SOURCE_PATH):
+            return table
+    except (FileNotFoundError, ValueError, struct.error) as e:
+        logger.info("🔧 심볼 테이블 없음 / 형식 오류: %s", e)
+    count = build(SOURCE_PATH, TABLE_PATH)
+    logger.info("🔧 심볼 테이블 빌드: %d 종목 → %s", count, TABLE_PATH)
+    return SymbolTable(TABLE_PATH)
+
+
+def _changed(table: SymbolTable) -> bool:
+    if not table.matches_source(SOURCE_PATH):
+        return True
+    try:
+        stat = os.stat(TABLE_PATH)
+    except FileNotFoundError:
+        return True
+    # 다른 워커 / 빌드 명령이 테이블 파일을 교체한 경우
+    return (stat.st_ino, stat.st_mtime_ns) != table.file_id
+
+
+# ✅ 현재 테이블 (CHECK_INTERVAL 마다 원본 / 테이블 파일 변경 확인 후 교체)
+def current_table() -> SymbolTable:
+    global _table, _checked_at
+    now = time.monotonic()
+    if _table is not None and now - _checked_at < CHECK_INTERVAL:
+        return _table
+    with _swap_lock:
+        if _table is None or (now - _checked_at >= CHECK_INTERVAL and _changed(_table)):
+            previous = _table
+            try:
+                _table = _open()
+            except Exception as e:
+                # 원본을 쓰는 중(잘린 JSON 등)이거나 잘못된 경우 - 기존 테이블로 계속 응답하고 다음 확인 때 재시도
+                if previous is None:
+                    raise
+                logger.warning("❌ 심볼 테이블 교체 실패 (기존 테이블 유지): %s", e)
+                _checked_at = now
+                return previous
+            if previous is not None:
+                logger.info("🔄 심볼 테이블 교체: %d → %d 종목", len(previous), len(_table))
+                for callback in _listeners:
+                    callback(_table)
+        _checked_at = now
+    return _table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="stock_list.json → 바이너리 심볼 테이블 빌드")
+    parser.add_argument("--source", default=SOURCE_PATH)
+    parser.add_argument("--output", default=TABLE_PATH)
+    args = parser.parse_args()
+    count = build(args.source, args.output)
+    print(f"✅ {count} 종목 → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
 import axios from 'axios';
-import { StockCandle } from '../types/stock';
+import { StockCandle, SymbolInfo, Timeframe } from '../types/stock';
+
+// ✅ 종목 자동완성 검색 (회사명/종목코드 접두어, 초성 지원)
+export const searchStocks = async (q: string, limit = 5): Promise<SymbolInfo[]> => {
+  const res = await fetch(
+    `http://localhost:8000/stocks/search?${new URLSearchParams({ q, limit: String(limit) })}`
+  );
+  if (!res.ok) throw new Error('종목 검색 실패');
+  return res.json();
+};
 
 // ✅ 종목 요약 정보
 export interface StockSummary {
@@ -16,7 +25,7 @@ export interface StockSummary {
 }
 
 export const fetchStockSummary = async (query: string): Promise<StockSummary> => {
-  const { data } = await axios.get(`http://localhost:8000/stock/summary?query=${query}`);
+  const { data } = await axios.get(`http://localhost:8000/stock/summary?${new URLSearchParams({ query })}`);
   return data;
 };
 
@@ -42,7 +51,7 @@ export interface FinancialResponse {
 }
 
 export const fetchFinancialRatios = async (query: string): Promise<FinancialResponse> => {
-  const res = await fetch(`http://localhost:8000/stock/financial?query=${query}`);
+  const res = await fetch(`http://localhost:8000/stock/financial?${new URLSearchParams({ query })}`);
   if (!res.ok) throw new Error('재무비율 데이터 조회 실패');
   return res.json();
 };
@@ -69,18 +78,25 @@ export interface ProfitabilityResponse {
 }
 
 export const fetchProfitabilityRatios = async (query: string): Promise<ProfitabilityResponse> => {
-  const res = await fetch(`http://localhost:8000/stock/profitability?query=${query}`);
+  const res = await fetch(`http://localhost:8000/stock/profitability?${new URLSearchParams({ query })}`);
   if (!res.ok) throw new Error('수익성 점수 조회 실패');
   return res.json();
 };
 
-// ✅ 캔들 차트 데이터
+// ✅ 캔들 차트 데이터 (이동평균선은 서버에서 계산)
+const CHART_INDICATORS = 'sma5';
+
 export async function fetchCandles(
   query: string,
-  timeframe: 'daily' | 'weekly' | 'monthly'
+  timeframe: Timeframe
 ): Promise<StockCandle[]> {
   try {
-    const response = await axios.get(`http://localhost:8000/chart/${timeframe}?query=${query}`);
+    // 분봉은 실시간 체결로 만든 당일 1분봉
+    const url =
+      timeframe === 'minute'
+        ? `http://localhost:8000/chart/minute?${new URLSearchParams({ query, interval: '1' })}`
+        : `http://localhost:8000/chart/${timeframe}?${new URLSearchParams({ query, indicators: CHART_INDICATORS })}`;
+    const response = await axios.get(url);
     return response.data;
   } catch (err) {
     console.error('❌ Error fetching stock data:', err);
@@ -107,7 +123,7 @@ export interface VolatilityResponse {
 }
 
 export const fetchVolatility = async (query: string): Promise<VolatilityResponse> => {
-  const res = await fetch(`http://localhost:8000/stock/volatility?query=${query}`);
+  const res = await fetch(`http://localhost:8000/stock/volatility?${new URLSearchParams({ query })}`);
   if (!res.ok) throw new Error('변동성 점수 조회 실패');
   return res.json();
 };
@@ -128,7 +144,90 @@ export interface SupplyRiskResponse {
 }
 
 export const fetchSupplyRisk = async (query: string): Promise<SupplyRiskResponse> => {
-  const res = await fetch(`http://localhost:8000/stock/supply-risk?query=${query}`);
+  const res = await fetch(`http://localhost:8000/stock/supply-risk?${new URLSearchParams({ query })}`);
   if (!res.ok) throw new Error('수급 리스크 점수 조회 실패');
   return res.json();
 };
+
+// ✅ 종목 대시보드 (요약 + 차트 + 리스크 점수 통합, 실패한 섹션은 null)
+export interface DashboardResponse {
+  symbol: string;
+  timeframe: string;
+  summary: StockSummary | null;
+  chart: StockCandle[] | null;
+  financial: FinancialResponse | null;
+  profitability: ProfitabilityResponse | null;
+  volatility: VolatilityResponse | null;
+  supply_risk: SupplyRiskResponse | null;
+  errors: Record<string, string>;
+}
+
+export const fetchDashboard = async (
+  query: string,
+  timeframe: Timeframe
+): Promise<DashboardResponse> => {
+  const res = await fetch(
+    `http://localhost:8000/stock/dashboard?${new URLSearchParams({ query, timeframe, indicators: CHART_INDICATORS })}`
+  );
+  if (!res.ok) throw new Error('대시보드 조회 실패');
+  return res.json();
+};
+
+// ✅ 실시간 체결가 (웹소켓, 연결이 끊기면 3초 후 재접속)
+export interface QuoteTick {
+  type: 'tick';
+  symbol: string;
+  date: string;
+  time: string;
+  price: number;
+  change: number;
+  change_rate: number;
+  open: number;
+  high: number;
+  low: number;
+  volume: number;
+  acml_vol: number;
+}
+
+// 분봉 갱신 메시지 (closed: 확정된 봉 여부)
+export interface LiveBarMessage {
+  type: 'bar';
+  symbol: string;
+  interval: number;
+  closed: boolean;
+  bar: StockCandle;
+}
+
+export const subscribeQuotes = (
+  symbol: string,
+  onTick: (tick: QuoteTick) => void,
+  options?: { bars: number[]; onBar: (message: LiveBarMessage) => void }
+): (() => void) => {
+  let ws: WebSocket | null = null;
+  let closed = false;
+  let retry: number | undefined;
+  const bars = options ? `&bars=${options.bars.join(',')}` : '';
+
+  const connect = () => {
+    ws = new WebSocket(
+      `ws://localhost:8000/ws/quotes?symbols=${encodeURIComponent(symbol)}${bars}`
+    );
+    ws.onmessage = (event) => {
+      const message = JSON.parse(event.data);
+      if (message.symbol !== symbol) return;
+      if (message.type === 'tick') onTick(message);
+      if (message.type === 'bar') options?.onBar(message);
+    };
+    ws.onclose = () => {
+      if (!closed) retry = window.setTimeout(connect, 3000);
+    };
+  };
+  connect();
+
+  // 구독 해제 함수
+  return () => {
+    closed = true;
+    window.clearTimeout(retry);
+    ws?.close();
+  };
+};
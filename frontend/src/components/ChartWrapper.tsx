@@ -1,18 +1,16 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import {
   fetchCandles,
-  fetchStockSummary,
-  fetchFinancialRatios,
-  fetchProfitabilityRatios,
-  fetchVolatility,
-  fetchSupplyRisk,
+  fetchDashboard,
+  searchStocks,
+  subscribeQuotes,
   StockSummary,
   FinancialResponse,
   ProfitabilityResponse,
   VolatilityResponse,
   SupplyRiskResponse,
 } from '../api/stockApi';
-import { StockCandle } from '../types/stock';
+import { StockCandle, SymbolInfo, Timeframe } from '../types/stock';
 import { D3CandlestickChart } from './D3CandlestickChart';
 import { StockSummaryCard } from './StockSummaryCard';
 import { VolatilityGauge } from './VolatilityGauge';
@@ -24,69 +22,135 @@ import { ProfitabilityGauge } from './ProfitabilityGauge';
 import { StabilityRiskOverview } from './StabilityRiskOverview';
 import { StabilityGauge } from './StabilityGauge';
 
-interface StockInfo {
-  회사명: string;
-  종목코드: string;
-  시장구분: string;
-}
+const TIMEFRAME_LABELS: Record<Timeframe, string> = {
+  minute: '분',
+  daily: '일',
+  weekly: '주',
+  monthly: '월',
+  quarterly: '분기',
+  yearly: '년',
+};
+
+// 실시간 분봉을 차트 데이터에 반영 (같은 봉이면 교체, 새 봉이면 추가)
+const mergeLiveBar = (candles: StockCandle[], bar: StockCandle): StockCandle[] => {
+  const last = candles[candles.length - 1];
+  if (last && last.time === bar.time) return [...candles.slice(0, -1), bar];
+  if (!last || bar.time > last.time) return [...candles, bar];
+  return candles;
+};
 
 export const ChartWrapper: React.FC = () => {
   const [data, setData] = useState<StockCandle[]>([]);
-  const [timeframe, setTimeframe] = useState<'daily' | 'weekly' | 'monthly'>('daily');
+  const [timeframe, setTimeframe] = useState<Timeframe>('daily');
   const [symbol, setSymbol] = useState('005930');
   const [inputValue, setInputValue] = useState('');
-  const [stockList, setStockList] = useState<StockInfo[]>([]);
-  const [suggestions, setSuggestions] = useState<StockInfo[]>([]);
+  const [selectedStock, setSelectedStock] = useState<SymbolInfo | null>(null);
+  const [suggestions, setSuggestions] = useState<SymbolInfo[]>([]);
   const [summary, setSummary] = useState<StockSummary | null>(null);
   const [financial, setFinancial] = useState<FinancialResponse | null>(null);
   const [profitability, setProfitability] = useState<ProfitabilityResponse | null>(null);
   const [volatility, setVolatility] = useState<VolatilityResponse | null>(null);
   const [supplyRisk, setSupplyRisk] = useState<SupplyRiskResponse | null>(null);
 
+  // ✅ 선택된 종목의 회사명 조회 (제목 표시용)
   useEffect(() => {
-    fetch('http://localhost:8000/stocks')
-      .then((res) => res.json())
-      .then((json: StockInfo[]) => setStockList(json))
-      .catch((err) => console.error('종목 리스트 불러오기 실패:', err));
-  }, []);
+    searchStocks(symbol, 1)
+      .then((list) => setSelectedStock(list[0]?.종목코드 === symbol ? list[0] : null))
+      .catch(() => setSelectedStock(null));
+  }, [symbol]);
+
+  const loadedSymbol = useRef<string | null>(null);
 
   useEffect(() => {
-    if (symbol) {
+    if (!symbol) return;
+
+    // 단위만 바뀐 경우에는 차트만 다시 조회
+    if (loadedSymbol.current === symbol) {
       fetchCandles(symbol, timeframe).then(setData);
-      fetchStockSummary(symbol).then(setSummary).catch(() => setSummary(null));
-      fetchFinancialRatios(symbol).then(setFinancial).catch(() => setFinancial(null));
-      fetchProfitabilityRatios(symbol).then(setProfitability).catch(() => setProfitability(null));
-      fetchVolatility(symbol).then(setVolatility).catch(() => setVolatility(null));
-      fetchSupplyRisk(symbol).then(setSupplyRisk).catch(() => setSupplyRisk(null));
+      return;
     }
+
+    // 종목이 바뀐 경우 대시보드 API 한 번으로 전체 조회
+    // 대시보드 차트는 일봉 이상 단위만 지원하므로 분봉은 일봉으로 요청하고 차트는 따로 조회
+    loadedSymbol.current = symbol;
+    fetchDashboard(symbol, timeframe === 'minute' ? 'daily' : timeframe)
+      .then((dashboard) => {
+        if (timeframe === 'minute') {
+          fetchCandles(symbol, timeframe).then(setData);
+        } else {
+          setData(dashboard.chart ?? []);
+        }
+        setSummary(dashboard.summary);
+        setFinancial(dashboard.financial);
+        setProfitability(dashboard.profitability);
+        setVolatility(dashboard.volatility);
+        setSupplyRisk(dashboard.supply_risk);
+      })
+      .catch(() => {
+        loadedSymbol.current = null;
+        setData([]);
+        setSummary(null);
+        setFinancial(null);
+        setProfitability(null);
+        setVolatility(null);
+        setSupplyRisk(null);
+      });
+  }, [symbol, timeframe]);
+
+  // ✅ 실시간 체결가로 요약 카드 갱신 (분봉 차트는 형성 중인 봉도 함께 갱신)
+  useEffect(() => {
+    if (!symbol) return;
+    const liveBars =
+      timeframe === 'minute'
+        ? { bars: [1], onBar: ({ bar }: { bar: StockCandle }) => setData((prev) => mergeLiveBar(prev, bar)) }
+        : undefined;
+
+    return subscribeQuotes(
+      symbol,
+      (tick) =>
+        setSummary((prev) =>
+          prev && prev.symbol === tick.symbol
+            ? {
+                ...prev,
+                price: tick.price,
+                change: tick.change,
+                change_rate: tick.change_rate,
+                open: tick.open,
+                high: tick.high,
+                low: tick.low,
+                volume: tick.acml_vol,
+              }
+            : prev
+        ),
+      liveBars
+    );
   }, [symbol, timeframe]);
 
+  // ✅ 자동완성 (서버 검색, 늦게 도착한 이전 응답은 무시)
   useEffect(() => {
-    if (!inputValue.trim()) {
+    const q = inputValue.trim();
+    if (!q) {
       setSuggestions([]);
       return;
     }
 
-    const lower = inputValue.toLowerCase();
-    const filtered = stockList
-      .filter((s) =>
-        s.회사명.toLowerCase().includes(lower) || s.종목코드.includes(lower)
-      )
-      .slice(0, 5);
-
-    setSuggestions(filtered);
-  }, [inputValue, stockList]);
-
-  const handleSearch = () => {
-    if (inputValue.trim()) {
-      const match = stockList.find(
-        (s) =>
-          s.회사명 === inputValue.trim() || s.종목코드 === inputValue.trim()
-      );
-      if (match) {
+    let cancelled = false;
+    searchStocks(q, 5)
+      .then((list) => !cancelled && setSuggestions(list))
+      .catch(() => !cancelled && setSuggestions([]));
+    return () => {
+      cancelled = true;
+    };
+  }, [inputValue]);
+
+  const handleSearch = async () => {
+    const q = inputValue.trim();
+    if (q) {
+      const [match] = await searchStocks(q, 1).catch(() => []);
+      if (match && (match.회사명 === q || match.종목코드 === q)) {
         setSymbol(match.종목코드);
       } else {
-        setSymbol(inputValue.trim());
+        setSymbol(q);
       }
       setSuggestions([]);
     }
@@ -98,7 +162,6 @@ export const ChartWrapper: React.FC = () => {
     setSuggestions([]);
   };
 
-  const selectedStock = stockList.find((s) => s.종목코드 === symbol);
   const displayTitle = selectedStock
     ? `${selectedStock.회사명} (${selectedStock.종목코드})`
     : symbol;
@@ -158,14 +221,14 @@ export const ChartWrapper: React.FC = () => {
 
         <div style={{ display: 'inline-flex', gap: 8, alignItems: 'center', marginLeft: 20 }}>
           <span style={{ fontWeight: 500 }}>단위:</span>
-          {['daily', 'weekly', 'monthly'].map((unit) => {
-            const label = unit === 'daily' ? '일' : unit === 'weekly' ? '주' : '월';
+          {(Object.keys(TIMEFRAME_LABELS) as Timeframe[]).map((unit) => {
+            const label = TIMEFRAME_LABELS[unit];
             const isActive = timeframe === unit;
 
             return (
               <button
                 key={unit}
-                onClick={() => setTimeframe(unit as any)}
+                onClick={() => setTimeframe(unit)}
                 style={{
                   padding: '6px 12px',
                   borderRadius: 6,
@@ -1,12 +1,12 @@
 import React from 'react';
 import * as d3 from 'd3';
 import { useD3 } from './useD3';
-import { StockCandle } from '../types/stock';
+import { StockCandle, Timeframe } from '../types/stock';
 
 interface Props {
   data: StockCandle[];
   symbol: string;
-  timeframe: 'daily' | 'weekly' | 'monthly' | 'yearly';
+  timeframe: Timeframe;
 }
 
 export const D3CandlestickChart: React.FC<Props> = ({ data, symbol, timeframe }) => {
@@ -20,7 +20,10 @@ export const D3CandlestickChart: React.FC<Props> = ({ data, symbol, timeframe })
     const innerHeight = height - margin.top - margin.bottom;
     const volumeHeight = 100;
 
-    const parseDate = d3.timeParse('%Y%m%d');
+    // 분봉은 YYYYMMDDHHMM, 나머지는 YYYYMMDD
+    const isMinute = timeframe === 'minute';
+    const parseDate = d3.timeParse(isMinute ? '%Y%m%d%H%M' : '%Y%m%d');
+    const formatDate = d3.timeFormat(isMinute ? '%Y-%m-%d %H:%M' : '%Y-%m-%d');
     const candles = data.map((d) => ({
       ...d,
       date: parseDate(d.time)!,
@@ -75,16 +78,17 @@ export const D3CandlestickChart: React.FC<Props> = ({ data, symbol, timeframe })
       .attr('transform', `translate(0, ${innerHeight})`)
       .call(d3.axisBottom(x).tickFormat((d: any) => {
         const date = new Date(d);
-        return `${date.getMonth() + 1}/${date.getDate()}`;
+        return isMinute
+          ? d3.timeFormat('%H:%M')(date)
+          : `${date.getMonth() + 1}/${date.getDate()}`;
       }));
 
     svgArea.append('g').call(d3.axisLeft(y));
 
-    const sma = candles.map((d, i, arr) => {
-      if (i < 4) return null;
-      const avg = d3.mean(arr.slice(i - 4, i + 1), (d) => d.close)!;
-      return { date: d.date, value: avg };
-    }).filter(Boolean) as { date: Date; value: number }[];
+    // 5일 이동평균 (서버에서 계산된 값 사용)
+    const sma = candles
+      .filter((d) => d.sma5 != null)
+      .map((d) => ({ date: d.date, value: d.sma5 as number }));
 
     const line = d3.line<{ date: Date; value: number }>()
       .x((d) => x(d.date.toISOString())! + x.bandwidth() / 2)
@@ -189,7 +193,7 @@ export const D3CandlestickChart: React.FC<Props> = ({ data, symbol, timeframe })
       const changeRate = ((closest.close - closest.open) / closest.open) * 100;
       const rateColor = changeRate >= 0 ? 'red' : 'blue';
 
-      tooltipLines[0].text(`📅 ${d3.timeFormat('%Y-%m-%d')(closest.date)}`);
+      tooltipLines[0].text(`📅 ${formatDate(closest.date)}`);
       tooltipLines[1].text(`시: ${closest.open.toLocaleString()}`);
       tooltipLines[2].text(`고: ${closest.high.toLocaleString()}`);
       tooltipLines[3].text(`저: ${closest.low.toLocaleString()}`);
@@ -200,7 +204,7 @@ export const D3CandlestickChart: React.FC<Props> = ({ data, symbol, timeframe })
       tooltipLines[6].text(`거래량: ${(closest.volume / 1_000_000).toFixed(1)}M`);
 
       staticText.html(
-        `📅 ${d3.timeFormat('%Y-%m-%d')(closest.date)} | 시: ${closest.open.toLocaleString()} 고: ${closest.high.toLocaleString()} 저: ${closest.low.toLocaleString()} 종: ${closest.close.toLocaleString()} <tspan fill="${rateColor}">(${changeRate.toFixed(2)}%)</tspan> 거래량: ${(closest.volume / 1_000_000).toFixed(1)}M`
+        `📅 ${formatDate(closest.date)} | 시: ${closest.open.toLocaleString()} 고: ${closest.high.toLocaleString()} 저: ${closest.low.toLocaleString()} 종: ${closest.close.toLocaleString()} <tspan fill="${rateColor}">(${changeRate.toFixed(2)}%)</tspan> 거래량: ${(closest.volume / 1_000_000).toFixed(1)}M`
       );
 
       crosshairV.attr('x1', xPos).attr('x2', xPos).style('display', null);
@@ -222,7 +226,7 @@ export const D3CandlestickChart: React.FC<Props> = ({ data, symbol, timeframe })
           svgArea.attr('transform', `translate(${margin.left + event.transform.x},${margin.top}) scale(${event.transform.k}, 1)`);
         })
     );
-  }, [data]);
+  }, [data, timeframe]);
 
   return (
     <>
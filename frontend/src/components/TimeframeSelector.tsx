@@ -1,16 +1,20 @@
 import React from 'react';
+import { Timeframe } from '../types/stock';
 
 interface Props {
-  value: 'daily' | 'weekly' | 'monthly';
-  onChange: (value: 'daily' | 'weekly' | 'monthly') => void;
+  value: Timeframe;
+  onChange: (value: Timeframe) => void;
 }
 
 export const TimeframeSelector: React.FC<Props> = ({ value, onChange }) => {
   return (
     <select value={value} onChange={(e) => onChange(e.target.value as any)}>
+      <option value="minute">분</option>
       <option value="daily">일</option>
       <option value="weekly">주</option>
       <option value="monthly">월</option>
+      <option value="quarterly">분기</option>
+      <option value="yearly">년</option>
     </select>
   );
 };
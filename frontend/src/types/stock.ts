@@ -1,3 +1,5 @@
+export type Timeframe = 'minute' | 'daily' | 'weekly' | 'monthly' | 'quarterly' | 'yearly';
+
 export interface StockCandle {
   time: string;
   open: number;
@@ -5,6 +7,8 @@ export interface StockCandle {
   low: number;
   close: number;
   volume: number;
+  // 서버에서 계산한 지표 (indicators= 로 요청한 경우, 계산 전 구간은 null)
+  sma5?: number | null;
 }
 export interface SymbolInfo {
   회사명: string;